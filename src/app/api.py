@@ -1,20 +1,20 @@
-from fastapi import FastAPI
-from rq.job import Job
-from src.app.task_queue import task_queue
-from src.app.tasks import add_numbers, run_assessment
+from typing import Any
 
-import pandas as pd
 import numpy as np
+import pandas as pd
+from fastapi import FastAPI
 from pydantic import BaseModel, Field, field_validator
-from typing import Dict, Any
+from rq.job import Job
 
+from src.app.task_queue import task_queue
+from src.app.tasks import add_numbers, run_assessment, run_assessments
 from src.constants import AssessmentName
 from src.dataclasses.assessment_results import AssessmentType
 
 app = FastAPI()
 
 
-class AssessmentRequest(BaseModel):
+class AssessmentTask(BaseModel):
     assessment_name: str = Field(
         ...,
         description="Name of the assessment to run (must match AssessmentName enum)",
@@ -22,10 +22,6 @@ class AssessmentRequest(BaseModel):
     assessment_type: str = Field(
         ..., description="Type of assessment: 'summary', 'rolling', or 'expanding'"
     )
-    config: Dict[str, Any] = Field(
-        ...,
-        description="Configuration dict containing returns, bmk, rfr (as lists), and optional params",
-    )
 
     @field_validator("assessment_name")
     @classmethod
@@ -52,9 +48,16 @@ class AssessmentRequest(BaseModel):
             )
         return v
 
+
+class AssessmentRequest(AssessmentTask):
+    config: dict[str, Any] = Field(
+        ...,
+        description="Configuration dict containing returns, bmk, rfr (as lists), and optional params",
+    )
+
     @field_validator("config")
     @classmethod
-    def validate_config(cls, v: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_config(cls, v: dict[str, Any]) -> dict[str, Any]:
         """Validate that config contains required fields."""
         required_fields = ["returns", "bmk", "rfr"]
         missing = [f for f in required_fields if f not in v]
@@ -93,6 +96,24 @@ class AssessmentRequest(BaseModel):
         return v
 
 
+class AssessmentBatchRequest(BaseModel):
+    tasks: list[AssessmentTask] = Field(
+        ...,
+        min_length=1,
+        description="Assessments to run on the config, as one job",
+    )
+    config: dict[str, Any] = Field(
+        ...,
+        description="Configuration dict containing returns, bmk, rfr (as lists), and optional params",
+    )
+
+    @field_validator("config")
+    @classmethod
+    def validate_config(cls, v: dict[str, Any]) -> dict[str, Any]:
+        """Validate the config as for a single assessment."""
+        return AssessmentRequest.validate_config(v)
+
+
 @app.get("/")
 def ping():
     return "pong"
@@ -109,6 +130,10 @@ def serialize_result(result: Any) -> Any:
     if result is None:
         return None
 
+    if isinstance(result, list):
+        # Outputs of a batch of assessments
+        return [serialize_result(item) for item in result]
+
     if isinstance(result, dict):
         # Handle dict results (from assessment._run())
         serialized = {}
@@ -116,6 +141,12 @@ def serialize_result(result: Any) -> Any:
             if isinstance(value, pd.Series):
                 # Convert Series to list, replacing NaN with None
                 serialized[key] = value.replace({np.nan: None}).tolist()
+            elif isinstance(value, pd.DataFrame):
+                # Multi-window rolling results, one list per window
+                serialized[key] = {
+                    str(column): series.replace({np.nan: None}).tolist()
+                    for column, series in value.items()
+                }
             elif isinstance(value, (np.integer, np.floating)):
                 # Convert numpy types to Python types
                 if np.isnan(value):
@@ -166,3 +197,13 @@ def enqueue_assessment(req: AssessmentRequest):
         req.config,
     )
     return {"job_id": job.id}
+
+
+@app.post("/run_batch")
+def enqueue_assessments(req: AssessmentBatchRequest):
+    job = task_queue.enqueue(
+        run_assessments,
+        [task.model_dump() for task in req.tasks],
+        req.config,
+    )
+    return {"job_id": job.id}
@@ -1,32 +1,27 @@
 # tasks.py
+import os
+from time import perf_counter
+from typing import Any
+
 import pandas as pd
-from typing import Any, Dict
 
 from src.constants import AssessmentName
 from src.dataclasses.assessment_config import AssessmentConfig
 from src.evaluation import ALL_ASSESSMENTS
+from src.utils.result_cache import ResultCache, result_key
+
+# The default rq Worker forks a process per job, so the in-memory tier only
+# serves the runs of one job; results persist across jobs and workers through
+# RESULT_CACHE_DIR (set in docker-compose.yaml)
+result_cache: ResultCache = ResultCache(directory=os.getenv("RESULT_CACHE_DIR"))
 
 
 def add_numbers(a: int, b: int):
     return a + b
 
 
-def run_assessment(
-    assessment_name: str,
-    assessment_type: str,
-    config_dict: Dict[str, Any],
-):
-    """
-    Run an assessment with the given configuration.
-
-    Args:
-        assessment_name: Name of the assessment (e.g., "beta", "sharpe_ratio")
-        assessment_type: Type of assessment (e.g., "summary", "rolling", "expanding")
-        config_dict: Dictionary containing returns, bmk, rfr as lists, plus optional params
-
-    Returns:
-        Dictionary with assessment results including name, type, result, and time
-    """
+def _build_config(config_dict: dict[str, Any]) -> AssessmentConfig:
+    """Create the AssessmentConfig of a serialized config dict."""
     # Convert lists back to pandas Series
     config_dict = config_dict.copy()
 
@@ -42,20 +37,97 @@ def run_assessment(
     if "rfr" in config_dict and isinstance(config_dict["rfr"], list):
         config_dict["rfr"] = pd.Series(config_dict["rfr"], name=rfr_name)
 
-    # Get the assessment class from the registry
+    return AssessmentConfig(**config_dict)
+
+
+def _assessment_class(assessment_name: str):
+    """Get the assessment class from the registry."""
     try:
         assessment_enum = AssessmentName[assessment_name]
-        assessment_class = ALL_ASSESSMENTS[assessment_enum]
+        return ALL_ASSESSMENTS[assessment_enum]
     except KeyError:
         raise ValueError(
             f"Unknown assessment: {assessment_name}. Available: {list(ALL_ASSESSMENTS.keys())}"
         )
 
-    # Create config and assessment instance
-    config = AssessmentConfig(**config_dict)
-    assessment = assessment_class(config=config)
+
+def _run_cached(assessment, assessment_type: str, cache: ResultCache | None):
+    """Run an assessment, or return its result from ``cache`` if stored there."""
+    cache = cache if cache is not None else result_cache
+    key = result_key(assessment.name, assessment_type, assessment.config)
+
+    start = perf_counter()
+    cached = cache.get(key)
+    if cached is not None:
+        return {
+            "assessment": assessment.name,
+            "type": assessment_type,
+            "result": cached,
+            "time": perf_counter() - start,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "result_cache": "hit",
+        }
 
     # Run the assessment
     output = assessment._run(assessment_type)
+    cache.put(key, output["result"])
+
+    return {**output, "result_cache": "miss"}
+
+
+def run_assessment(
+    assessment_name: str,
+    assessment_type: str,
+    config_dict: dict[str, Any],
+    cache: ResultCache | None = None,
+):
+    """
+    Run an assessment with the given configuration.
+
+    Args:
+        assessment_name: Name of the assessment (e.g., "beta", "sharpe_ratio")
+        assessment_type: Type of assessment (e.g., "summary", "rolling", "expanding")
+        config_dict: Dictionary containing returns, bmk, rfr as lists, plus optional params
+        cache: Result cache to consult before computing. Defaults to the cache of
+            the worker, ``result_cache``.
+
+    Returns:
+        Dictionary with assessment results including name, type, result, and time
+    """
+    assessment_class = _assessment_class(assessment_name)
+
+    # Create config and assessment instance
+    config = _build_config(config_dict)
+    assessment = assessment_class(config=config)
+
+    return _run_cached(assessment, assessment_type, cache)
+
+
+def run_assessments(
+    tasks: list[dict[str, str]],
+    config_dict: dict[str, Any],
+    cache: ResultCache | None = None,
+):
+    """
+    Run several assessments against one configuration in a single job.
+
+    The config is deserialized once, and the assessments share its windowed
+    statistics.
+
+    Args:
+        tasks: Dicts with "assessment_name" and "assessment_type", as for run_assessment
+        config_dict: Dictionary containing returns, bmk, rfr as lists, plus optional params
+        cache: Result cache to consult before computing. Defaults to the cache of
+            the worker, ``result_cache``.
+
+    Returns:
+        List of assessment outputs, in the order of ``tasks``
+    """
+    assessment_classes = [_assessment_class(task["assessment_name"]) for task in tasks]
+    config = _build_config(config_dict)
 
-    return output
+    return [
+        _run_cached(assessment_class(config=config), task["assessment_type"], cache)
+        for assessment_class, task in zip(assessment_classes, tasks)
+    ]
@@ -1,3 +1,4 @@
+from src.assessments.annualized_returns import AnnualizedReturns
 from src.assessments.base_assessment import BaseAssessment
 from src.assessments.beta import Beta
 from src.assessments.cagr import CAGR
@@ -51,5 +52,6 @@ __all__ = [
     "M2Ratio",
     "MeanReturn",
     "CumulativeReturns",
+    "AnnualizedReturns",
     "UlcerIndex",
 ]
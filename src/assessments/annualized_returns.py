@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+import pandas as pd
+
+from src.assessments.base_assessment import BaseAssessment
+from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import window_log_growth
+
+
+@dataclass(kw_only=True)
+class AnnualizedReturns(BaseAssessment):
+    """Annualized Returns Assessment
+
+    Formula:
+        Annualized Return = Mean(ln(1 + R)) * ann_factor
+
+    Description:
+        Continuously compounded return per year. Unlike the arithmetic mean it
+        accounts for compounding, and it is additive across periods.
+        CAGR = exp(Annualized Return) - 1.
+    """
+
+    name: ClassVar[AssessmentName] = AssessmentName.AnnualizedReturns
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
+
+    @staticmethod
+    def _summary(returns: pd.Series, ann_factor: int = 252, **kwargs) -> float:
+        return float(np.log1p(returns).mean() * ann_factor)
+
+    @staticmethod
+    def _rolling(
+        returns: pd.Series, window: int, ann_factor: int = 252, **kwargs
+    ) -> pd.Series:
+        return np.log1p(returns).rolling(window=window).mean() * ann_factor
+
+    @staticmethod
+    def _expanding(
+        returns: pd.Series, min_periods: int = 21, ann_factor: int = 252, **kwargs
+    ) -> pd.Series:
+        return np.log1p(returns).expanding(min_periods=min_periods).mean() * ann_factor
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, ann_factor: int = 252, **kwargs) -> float:
+        return float(np.log1p(returns).mean() * ann_factor)
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray, window: int, ann_factor: int = 252, **kwargs
+    ) -> np.ndarray:
+        log_growth, count = window_log_growth(returns, window=window)
+
+        return log_growth / count * ann_factor
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray, min_periods: int = 21, ann_factor: int = 252, **kwargs
+    ) -> np.ndarray:
+        log_growth, count = window_log_growth(returns, min_periods=min_periods)
+
+        return log_growth / count * ann_factor
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        return stats.log_growth() / stats.n * ann_factor
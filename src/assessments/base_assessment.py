@@ -1,17 +1,58 @@
 from abc import ABC
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from time import perf_counter
-from typing import ClassVar
+from typing import Any, ClassVar
+
+import numpy as np
 import pandas as pd
 
 from src.dataclasses.assessment_config import AssessmentConfig
 from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
+from src.utils.windows import wrap_like
+
+_SERIES_KWARGS: tuple[str, ...] = ("returns", "rfr", "bmk")
+
+
+def resolve_dependency(
+    dependencies: Mapping[str, Any] | None, name: str, compute: Callable[[], Any]
+) -> Any:
+    """Result of the dependency ``name`` when it was passed in, else ``compute()``."""
+    if dependencies is not None and name in dependencies:
+        return dependencies[name]
+
+    return compute()
 
 
 @dataclass(kw_only=True)
 class BaseAssessment(ABC):
+    """Base class of all assessments.
+
+    Each assessment implements ``_summary``, ``_rolling`` and ``_expanding`` on
+    pandas objects. It may also implement the matching ``*_kernel`` staticmethods,
+    which take the same arguments with ``returns``, ``rfr`` and ``bmk`` as
+    contiguous float64 arrays of equal length (1-d, or 2-d with one series per
+    column) and return a float or an unlabelled array. When a kernel exists and
+    the inputs of the config are aligned, it is used instead of the pandas
+    implementation and the index is attached once to its result. Passing
+    ``reference=True`` always runs the pandas implementation.
+
+    ``inputs`` lists the config series an assessment reads. Its results are equal
+    for all configs whose processed ``inputs`` are equal, whatever their other
+    series.
+
+    Assessments built from other assessments list them in ``dependencies``. Their
+    methods take an optional ``dependencies`` mapping of name to the result of the
+    same type (see ``resolve_dependency``) and only compute the components that
+    are missing from it.
+    """
+
     config: AssessmentConfig
     name: ClassVar[str]
+    inputs: ClassVar[tuple[str, ...]] = _SERIES_KWARGS
+    dependencies: ClassVar[tuple[str, ...]] = ()
 
     def __post_init__(self):
         self._child_cls = type(self)
@@ -28,25 +69,188 @@ class BaseAssessment(ABC):
     def _expanding() -> pd.Series:
         raise NotImplementedError()
 
-    def summary(self) -> float:
-        return self._child_cls._summary(**self.config.kwargs)
+    @staticmethod
+    def _summary_kernel() -> float:
+        raise NotImplementedError()
+
+    @staticmethod
+    def _rolling_kernel() -> np.ndarray:
+        raise NotImplementedError()
+
+    @staticmethod
+    def _expanding_kernel() -> np.ndarray:
+        raise NotImplementedError()
+
+    @staticmethod
+    def _online(stats: OnlineStats, assessment_type: AssessmentType, **kwargs) -> float:
+        """Latest value from the running statistics of a streaming evaluation."""
+        raise NotImplementedError()
+
+    @classmethod
+    def online(
+        cls, stats: OnlineStats, assessment_type: AssessmentType, **kwargs
+    ) -> float:
+        """Latest value from running statistics, NaN until the window is ready.
+
+        Summaries use every point seen, as the batch summary does.
+        """
+        if assessment_type != AssessmentType.Summary and not stats.ready:
+            return np.nan
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return float(cls._online(stats, assessment_type, **kwargs))
 
-    def rolling(self) -> pd.Series:
-        return self._child_cls._rolling(**self.config.kwargs)
+    @property
+    def stats(self) -> WindowStats | None:
+        """Windowed statistics cache shared by all assessments of the config."""
+        return getattr(self.config, "stats", None)
 
-    def expanding(self) -> pd.Series:
-        return self._child_cls._expanding(**self.config.kwargs)
+    def has_kernel(self, assessment_type: AssessmentType | str) -> bool:
+        """Whether the assessment implements an array kernel for ``assessment_type``."""
+        name: str = f"_{assessment_type}_kernel"
+        return getattr(self._child_cls, name) is not getattr(BaseAssessment, name)
+
+    def _kernel_kwargs(self) -> dict[str, Any] | None:
+        """Config kwargs with the series as float64 arrays, None if not aligned.
+
+        Kernels assume equal-length inputs without gaps, so configs whose series
+        are not on the index of the returns, or hold NaNs, use the pandas path.
+        """
+        kwargs: dict[str, Any] = dict(self.config.kwargs)
+        index: pd.Index = kwargs["returns"].index
+
+        for key in _SERIES_KWARGS:
+            series: pd.Series | pd.DataFrame | None = kwargs.get(key)
+            if series is None:
+                continue
+            if not series.index.equals(index):
+                return None
+
+            values: np.ndarray = np.ascontiguousarray(series.to_numpy(dtype=np.float64))
+            if np.isnan(values).any():
+                return None
+
+            kwargs[key] = values
+
+        return kwargs
+
+    def _dependency_kwargs(
+        self,
+        dependencies: Mapping[str, Any] | None,
+        kernel: bool,
+        window: int | None = None,
+    ) -> dict[str, Any]:
+        """``dependencies`` override in the form the methods or kernels expect.
+
+        Results stored in float32 are not precise enough to build on and are
+        ignored, as are dependencies of reference runs.
+        """
+        if not dependencies or self.config.dtype != np.float64:
+            return {}
+
+        values: dict[str, Any] = {}
+        for name, result in dependencies.items():
+            # Multi-window rolling results hold one column per window
+            if window is not None and isinstance(result, pd.DataFrame):
+                result = result[window]
+            if kernel and not np.isscalar(result):
+                result = np.ascontiguousarray(np.asarray(result, dtype=np.float64))
+            values[name] = result
+
+        return {"dependencies": values}
+
+    def _evaluate(
+        self,
+        assessment_type: AssessmentType | str,
+        reference: bool = False,
+        dependencies: Mapping[str, Any] | None = None,
+        **overrides,
+    ) -> float | pd.Series | pd.DataFrame:
+        kwargs: dict[str, Any] | None = None
+        if not reference and self.has_kernel(assessment_type):
+            kwargs = self._kernel_kwargs()
+
+        if not reference:
+            overrides.update(
+                self._dependency_kwargs(
+                    dependencies, kwargs is not None, overrides.get("window")
+                )
+            )
+
+        if kwargs is None:
+            method = getattr(self._child_cls, f"_{assessment_type}")
+            result = method(**{**self.config.kwargs, **overrides}, stats=self.stats)
+        else:
+            kernel = getattr(self._child_cls, f"_{assessment_type}_kernel")
+            result = kernel(**{**kwargs, **overrides}, stats=self.stats)
+
+        if np.ndim(result) == 0:
+            return float(result) if kwargs is not None else result
+
+        if kwargs is not None:
+            result = wrap_like(result, self.config.kwargs["returns"])
+
+        # Computed in float64, stored in the precision of the config
+        return result.astype(self.config.dtype, copy=False)
+
+    def summary(
+        self,
+        reference: bool = False,
+        dependencies: Mapping[str, Any] | None = None,
+    ) -> float:
+        return self._evaluate(AssessmentType.Summary, reference, dependencies)
+
+    def rolling(
+        self,
+        reference: bool = False,
+        dependencies: Mapping[str, Any] | None = None,
+    ) -> pd.Series | pd.DataFrame:
+        if not isinstance(self.config.window, list):
+            return self._evaluate(AssessmentType.Rolling, reference, dependencies)
+
+        # One column per window; windowed statistics of every window come from
+        # the same prefix sums in the shared stats cache
+        return pd.concat(
+            {
+                window: self._evaluate(
+                    AssessmentType.Rolling, reference, dependencies, window=window
+                )
+                for window in self.config.window
+            },
+            axis=1,
+            names=["window"],
+        )
+
+    def expanding(
+        self,
+        reference: bool = False,
+        dependencies: Mapping[str, Any] | None = None,
+    ) -> pd.Series:
+        return self._evaluate(AssessmentType.Expanding, reference, dependencies)
 
     def _run(
-        self, assessment_type: AssessmentType | str = AssessmentType.Summary
+        self,
+        assessment_type: AssessmentType | str = AssessmentType.Summary,
+        reference: bool = False,
+        dependencies: Mapping[str, Any] | None = None,
     ) -> dict:
+        stats: WindowStats | None = self.stats
+        hits, misses = (stats.hits, stats.misses) if stats is not None else (0, 0)
+
         start: float = perf_counter()
-        result = getattr(self, assessment_type)()
+        result = getattr(self, assessment_type)(
+            reference=reference, dependencies=dependencies
+        )
         elapsed: float = perf_counter() - start
 
+        if stats is not None:
+            hits, misses = stats.hits - hits, stats.misses - misses
+
         return {
             "assessment": self.name,
             "type": assessment_type,
             "result": result,
             "time": elapsed,
+            "cache_hits": hits,
+            "cache_misses": misses,
         }
@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
 
 
 @dataclass(kw_only=True)
@@ -21,6 +25,7 @@ class BenchmarkCorrelation(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.BenchmarkCorrelation
+    inputs: ClassVar[tuple[str, ...]] = ("returns", "bmk")
 
     @staticmethod
     def _summary(returns: pd.Series, bmk: pd.Series, **kwargs) -> float:
@@ -28,12 +33,57 @@ class BenchmarkCorrelation(BaseAssessment):
 
     @staticmethod
     def _rolling(
-        returns: pd.Series, bmk: pd.Series, window: int, **kwargs
+        returns: pd.Series,
+        bmk: pd.Series,
+        window: int,
+        stats: WindowStats | None = None,
+        **kwargs,
     ) -> pd.Series:
-        return returns.rolling(window).corr(bmk)
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+
+        # Copied so the result does not alias the shared cache entry
+        return stats.corr("returns", "bmk", window).copy()
 
     @staticmethod
     def _expanding(
-        returns: pd.Series, bmk: pd.Series, min_periods: int = 21, **kwargs
+        returns: pd.Series,
+        bmk: pd.Series,
+        min_periods: int = 21,
+        stats: WindowStats | None = None,
+        **kwargs,
     ) -> pd.Series:
-        return returns.expanding(min_periods).corr(bmk)
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+
+        return stats.corr("returns", "bmk", min_periods=min_periods).copy()
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, bmk: np.ndarray, **kwargs) -> float:
+        return float(np.corrcoef(returns, bmk)[0, 1])
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        window: int,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+
+        return stats.corr("returns", "bmk", window, raw=True).copy()
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        min_periods: int = 21,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+
+        return stats.corr("returns", "bmk", min_periods=min_periods, raw=True).copy()
+
+    @staticmethod
+    def _online(stats: OnlineStats, assessment_type: AssessmentType, **kwargs) -> float:
+        return stats.corr()
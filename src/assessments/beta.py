@@ -6,6 +6,9 @@ import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
 
 
 @dataclass(kw_only=True)
@@ -20,6 +23,7 @@ class Beta(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.Beta
+    inputs: ClassVar[tuple[str, ...]] = ("returns", "bmk")
 
     @staticmethod
     def _summary(returns: pd.Series, bmk: pd.Series, **kwargs) -> float:
@@ -29,18 +33,59 @@ class Beta(BaseAssessment):
 
     @staticmethod
     def _rolling(
-        returns: pd.Series, bmk: pd.Series, window: int, **kwargs
+        returns: pd.Series,
+        bmk: pd.Series,
+        window: int,
+        stats: WindowStats | None = None,
+        **kwargs,
     ) -> pd.Series:
-        rolling_cov: pd.Series = returns.rolling(window).cov(bmk)
-        rolling_var: pd.Series = bmk.rolling(window).var()
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
 
-        return rolling_cov / rolling_var
+        # Copied so the result does not alias the shared cache entry
+        return stats.beta(window).copy()
 
     @staticmethod
     def _expanding(
-        returns: pd.Series, bmk: pd.Series, min_periods: int = 21, **kwargs
+        returns: pd.Series,
+        bmk: pd.Series,
+        min_periods: int = 21,
+        stats: WindowStats | None = None,
+        **kwargs,
     ) -> pd.Series:
-        expanding_cov: pd.Series = returns.expanding(min_periods).cov(bmk)
-        expanding_var: pd.Series = bmk.expanding(min_periods).var()
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
 
-        return expanding_cov / expanding_var
+        return stats.beta(min_periods=min_periods).copy()
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, bmk: np.ndarray, **kwargs) -> float:
+        cov: np.ndarray = np.cov(returns, bmk)
+
+        return float(cov[0, 1] / cov[1, 1])
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        window: int,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+
+        return stats.beta(window, raw=True).copy()
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        min_periods: int = 21,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+
+        return stats.beta(min_periods=min_periods, raw=True).copy()
+
+    @staticmethod
+    def _online(stats: OnlineStats, assessment_type: AssessmentType, **kwargs) -> float:
+        return stats.beta()
@@ -6,11 +6,15 @@ import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import window_growth
 
 
 @dataclass(kw_only=True)
 class CAGR(BaseAssessment):
     name: ClassVar[AssessmentName] = AssessmentName.CAGR
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(returns: pd.Series, ann_factor: int = 252, **kwargs) -> float:
@@ -33,3 +37,28 @@ class CAGR(BaseAssessment):
             args=(ann_factor,),
             raw=True,
         )
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, ann_factor: int = 252, **kwargs) -> float:
+        return float(np.prod(returns + 1) ** (ann_factor / len(returns)) - 1)
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray, window: int = 252, ann_factor: int = 252, **kwargs
+    ) -> np.ndarray:
+        return window_growth(returns, window=window, ann_factor=ann_factor)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray, min_periods: int = 21, ann_factor: int = 252, **kwargs
+    ) -> np.ndarray:
+        return window_growth(returns, min_periods=min_periods, ann_factor=ann_factor)
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        return stats.growth(ann_factor)
@@ -1,25 +1,44 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import ClassVar
+from typing import Any, ClassVar
 
+import numpy as np
 import pandas as pd
 
-
-from src.assessments.base_assessment import BaseAssessment
+from src.assessments.base_assessment import BaseAssessment, resolve_dependency
 from src.assessments.max_drawdown import MaxDrawdown
 from src.assessments.cagr import CAGR
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
 
 
 @dataclass(kw_only=True)
 class CalmarRatio(BaseAssessment):
     name: ClassVar[AssessmentName] = AssessmentName.CalmarRatio
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
+    dependencies: ClassVar[tuple[AssessmentName, ...]] = (
+        AssessmentName.CAGR,
+        AssessmentName.MaxDrawdown,
+    )
 
     @staticmethod
-    def _summary(returns: pd.Series, ann_factor: int = 252, **kwargs) -> float:
-        import numpy as np
-
-        cagr: float = CAGR._summary(returns=returns, ann_factor=ann_factor)
-        max_dd: float = MaxDrawdown._summary(returns=returns)
+    def _summary(
+        returns: pd.Series,
+        ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> float:
+        cagr: float = resolve_dependency(
+            dependencies,
+            AssessmentName.CAGR,
+            lambda: CAGR._summary(returns=returns, ann_factor=ann_factor),
+        )
+        max_dd: float = resolve_dependency(
+            dependencies,
+            AssessmentName.MaxDrawdown,
+            lambda: MaxDrawdown._summary(returns=returns),
+        )
 
         if abs(max_dd) == 0:
             # No drawdown - return inf if positive CAGR, -inf if negative
@@ -29,24 +48,135 @@ class CalmarRatio(BaseAssessment):
 
     @staticmethod
     def _rolling(
-        returns: pd.Series, window: int, ann_factor: int = 252, **kwargs
+        returns: pd.Series,
+        window: int,
+        ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
     ) -> pd.Series:
-        rolling_cagr: pd.Series = CAGR._rolling(
-            returns=returns, window=window, ann_factor=ann_factor
+        rolling_cagr: pd.Series = resolve_dependency(
+            dependencies,
+            AssessmentName.CAGR,
+            lambda: CAGR._rolling(
+                returns=returns, window=window, ann_factor=ann_factor
+            ),
+        )
+        rolling_max_dd: pd.Series = resolve_dependency(
+            dependencies,
+            AssessmentName.MaxDrawdown,
+            lambda: MaxDrawdown._rolling(returns=returns, window=window),
         )
-        rolling_max_dd: pd.Series = MaxDrawdown._rolling(returns=returns, window=window)
 
         return rolling_cagr / rolling_max_dd.abs()
 
     @staticmethod
     def _expanding(
-        returns: pd.Series, min_periods: int, ann_factor: int = 252, **kwargs
+        returns: pd.Series,
+        min_periods: int,
+        ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
     ) -> pd.Series:
-        expanding_cagr: pd.Series = CAGR._expanding(
-            returns=returns, min_periods=min_periods, ann_factor=ann_factor
+        expanding_cagr: pd.Series = resolve_dependency(
+            dependencies,
+            AssessmentName.CAGR,
+            lambda: CAGR._expanding(
+                returns=returns, min_periods=min_periods, ann_factor=ann_factor
+            ),
         )
-        expanding_max_dd: pd.Series = MaxDrawdown._expanding(
-            returns=returns, min_periods=min_periods
+        expanding_max_dd: pd.Series = resolve_dependency(
+            dependencies,
+            AssessmentName.MaxDrawdown,
+            lambda: MaxDrawdown._expanding(returns=returns, min_periods=min_periods),
         )
 
         return expanding_cagr / expanding_max_dd.abs()
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray,
+        ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> float:
+        cagr: float = resolve_dependency(
+            dependencies,
+            AssessmentName.CAGR,
+            lambda: CAGR._summary_kernel(returns=returns, ann_factor=ann_factor),
+        )
+        max_dd: float = resolve_dependency(
+            dependencies,
+            AssessmentName.MaxDrawdown,
+            lambda: MaxDrawdown._summary_kernel(returns=returns),
+        )
+
+        if abs(max_dd) == 0:
+            return float(np.inf) if cagr > 0 else float(-np.inf)
+
+        return cagr / abs(max_dd)
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        window: int,
+        ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        rolling_cagr: np.ndarray = resolve_dependency(
+            dependencies,
+            AssessmentName.CAGR,
+            lambda: CAGR._rolling_kernel(
+                returns=returns, window=window, ann_factor=ann_factor
+            ),
+        )
+        rolling_max_dd: np.ndarray = resolve_dependency(
+            dependencies,
+            AssessmentName.MaxDrawdown,
+            lambda: MaxDrawdown._rolling_kernel(returns=returns, window=window),
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return rolling_cagr / np.abs(rolling_max_dd)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        min_periods: int,
+        ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        expanding_cagr: np.ndarray = resolve_dependency(
+            dependencies,
+            AssessmentName.CAGR,
+            lambda: CAGR._expanding_kernel(
+                returns=returns, min_periods=min_periods, ann_factor=ann_factor
+            ),
+        )
+        expanding_max_dd: np.ndarray = resolve_dependency(
+            dependencies,
+            AssessmentName.MaxDrawdown,
+            lambda: MaxDrawdown._expanding_kernel(
+                returns=returns, min_periods=min_periods
+            ),
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return expanding_cagr / np.abs(expanding_max_dd)
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        cagr: float = CAGR._online(stats, assessment_type, ann_factor=ann_factor)
+        max_dd: float = MaxDrawdown._online(stats, assessment_type)
+
+        if assessment_type == AssessmentType.Summary and max_dd == 0:
+            return float(np.inf) if cagr > 0 else float(-np.inf)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return cagr / np.abs(max_dd)
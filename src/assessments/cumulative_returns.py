@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import window_growth
 
 
 @dataclass(kw_only=True)
@@ -20,6 +24,7 @@ class CumulativeReturns(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.CumulativeReturns
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(returns: pd.Series, **kwargs) -> float:
@@ -36,3 +41,21 @@ class CumulativeReturns(BaseAssessment):
         return returns.expanding(min_periods=min_periods).apply(
             lambda x: (1 + x).prod() - 1, raw=False
         )
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, **kwargs) -> float:
+        return float(np.prod(1 + returns) - 1)
+
+    @staticmethod
+    def _rolling_kernel(returns: np.ndarray, window: int, **kwargs) -> np.ndarray:
+        return window_growth(returns, window=window)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray, min_periods: int = 21, **kwargs
+    ) -> np.ndarray:
+        return window_growth(returns, min_periods=min_periods)
+
+    @staticmethod
+    def _online(stats: OnlineStats, assessment_type: AssessmentType, **kwargs) -> float:
+        return stats.growth()
@@ -1,10 +1,24 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
+
+
+def _tail_mean(x: pd.Series, confidence_level: float) -> float:
+    """Mean of the returns of a window at or below its VaR."""
+    if len(x) < 2:
+        return float("nan")
+    threshold: float = x.quantile(1 - confidence_level)
+    tail_losses: pd.Series = x[x <= threshold]
+
+    return tail_losses.mean() if len(tail_losses) > 0 else float("nan")
 
 
 @dataclass(kw_only=True)
@@ -23,6 +37,7 @@ class CVaR(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.CVaR
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(returns: pd.Series, confidence_level: float = 0.95, **kwargs) -> float:
@@ -35,19 +50,10 @@ class CVaR(BaseAssessment):
     def _rolling(
         returns: pd.Series, window: int, confidence_level: float = 0.95, **kwargs
     ) -> pd.Series:
-        """Calculate rolling CVaR using vectorized operations."""
-
-        def cvar_calc(x):
-            """Optimized CVaR calculation for a window."""
-            if len(x) < 2:
-                return float("nan")
-            threshold = x.quantile(1 - confidence_level)
-            tail_losses = x[x <= threshold]
-            return tail_losses.mean() if len(tail_losses) > 0 else float("nan")
-
-        # Using pandas built-in rolling with apply is already optimized
-        # The apply function runs on Series objects which use vectorized operations internally
-        return returns.rolling(window).apply(cvar_calc, raw=False)
+        """Calculate rolling CVaR as the tail mean of each window."""
+        return returns.rolling(window).apply(
+            _tail_mean, args=(confidence_level,), raw=False
+        )
 
     @staticmethod
     def _expanding(
@@ -56,15 +62,56 @@ class CVaR(BaseAssessment):
         confidence_level: float = 0.95,
         **kwargs,
     ) -> pd.Series:
-        """Calculate expanding CVaR using vectorized operations."""
-
-        def cvar_calc(x):
-            """Optimized CVaR calculation for expanding window."""
-            if len(x) < 2:
-                return float("nan")
-            threshold = x.quantile(1 - confidence_level)
-            tail_losses = x[x <= threshold]
-            return tail_losses.mean() if len(tail_losses) > 0 else float("nan")
-
-        # Using pandas built-in expanding with apply is already optimized
-        return returns.expanding(min_periods).apply(cvar_calc, raw=False)
+        """Calculate expanding CVaR as the tail mean of each window."""
+        return returns.expanding(min_periods).apply(
+            _tail_mean, args=(confidence_level,), raw=False
+        )
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray, confidence_level: float = 0.95, **kwargs
+    ) -> float:
+        var_threshold: float = np.quantile(returns, 1 - confidence_level)
+
+        return float(returns[returns <= var_threshold].mean())
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        window: int,
+        confidence_level: float = 0.95,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns)
+        _, cvar = stats.tail_risk("returns", confidence_level, window, raw=True)
+
+        return cvar
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        min_periods: int = 21,
+        confidence_level: float = 0.95,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns)
+        _, cvar = stats.tail_risk(
+            "returns", confidence_level, min_periods=min_periods, raw=True
+        )
+
+        return cvar
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        confidence_level: float = 0.95,
+        **kwargs,
+    ) -> float:
+        # Windowed CVaR needs two observations, as in ``tail_risk``
+        if assessment_type != AssessmentType.Summary and stats.count < 2:
+            return np.nan
+
+        return stats.tail_mean(1 - confidence_level)
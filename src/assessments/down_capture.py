@@ -1,10 +1,43 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import window_sum, wrap_like
+
+
+def _down_capture(
+    returns: np.ndarray,
+    bmk: np.ndarray,
+    window: int | None = None,
+    min_periods: int = 1,
+) -> np.ndarray:
+    """Down Capture per window from masked sums and counts of down-market days.
+
+    Rolling windows of length ``window`` (expanding when None) each cost O(1)
+    once the prefix sums are built. Windows without down-market days or
+    with a zero benchmark mean are NaN, as in ``_summary``.
+    """
+    down_market: np.ndarray = bmk < 0
+    count: np.ndarray = window_sum(down_market.astype(float), window, min_periods)
+    portfolio_sum: np.ndarray = window_sum(
+        np.where(down_market, returns, 0.0), window, min_periods
+    )
+    benchmark_sum: np.ndarray = window_sum(
+        np.where(down_market, bmk, 0.0), window, min_periods
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        portfolio_mean: np.ndarray = portfolio_sum / count
+        benchmark_mean: np.ndarray = benchmark_sum / count
+        ratio: np.ndarray = portfolio_mean / benchmark_mean
+
+    return np.where((count > 0) & (benchmark_mean != 0), ratio, np.nan)
 
 
 @dataclass(kw_only=True)
@@ -22,6 +55,7 @@ class DownCapture(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.DownCapture
+    inputs: ClassVar[tuple[str, ...]] = ("returns", "bmk")
 
     @staticmethod
     def _summary(returns: pd.Series, bmk: pd.Series, **kwargs) -> float:
@@ -42,65 +76,60 @@ class DownCapture(BaseAssessment):
     def _rolling(
         returns: pd.Series, bmk: pd.Series, window: int, **kwargs
     ) -> pd.Series:
-        """Calculate rolling Down Capture Ratio using vectorized operations."""
-
-        def down_capture_window(idx):
-            """Calculate Down Capture for window ending at idx."""
-            if idx < window - 1:
-                return float("nan")
-
-            start_idx = idx - window + 1
-            port_vals = returns.iloc[start_idx : idx + 1]
-            bmk_vals = bmk.iloc[start_idx : idx + 1]
-
-            down_mask = bmk_vals < 0
-            if not down_mask.any():
-                return float("nan")
-
-            port_mean = port_vals[down_mask].mean()
-            bmk_mean = bmk_vals[down_mask].mean()
-
-            if bmk_mean == 0 or pd.isna(bmk_mean):
-                return float("nan")
-
-            return port_mean / bmk_mean
-
-        # Apply calculation using index position
-        result = pd.Series(
-            [down_capture_window(i) for i in range(len(returns))], index=returns.index
+        """Calculate rolling Down Capture Ratio from windowed down-market sums."""
+        result: np.ndarray = _down_capture(
+            returns.to_numpy(dtype=float),
+            bmk.to_numpy(dtype=float),
+            window=window,
         )
 
-        return result
+        return wrap_like(result, returns)
 
     @staticmethod
     def _expanding(
         returns: pd.Series, bmk: pd.Series, min_periods: int = 21, **kwargs
     ) -> pd.Series:
-        """Calculate expanding Down Capture Ratio using vectorized operations."""
+        """Calculate expanding Down Capture Ratio from cumulative down-market sums."""
+        result: np.ndarray = _down_capture(
+            returns.to_numpy(dtype=float),
+            bmk.to_numpy(dtype=float),
+            min_periods=min_periods,
+        )
+
+        return wrap_like(result, returns)
 
-        def down_capture_window(idx):
-            """Calculate Down Capture for expanding window ending at idx."""
-            if idx < min_periods - 1:
-                return float("nan")
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, bmk: np.ndarray, **kwargs) -> float:
+        down_market: np.ndarray = bmk < 0
+        if not down_market.any():
+            return float("nan")
 
-            port_vals = returns.iloc[: idx + 1]
-            bmk_vals = bmk.iloc[: idx + 1]
+        benchmark_mean: float = bmk[down_market].mean()
+        if benchmark_mean == 0:
+            return float("nan")
 
-            down_mask = bmk_vals < 0
-            if not down_mask.any():
-                return float("nan")
+        return float(returns[down_market].mean() / benchmark_mean)
 
-            port_mean = port_vals[down_mask].mean()
-            bmk_mean = bmk_vals[down_mask].mean()
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray, bmk: np.ndarray, window: int, **kwargs
+    ) -> np.ndarray:
+        return _down_capture(returns, bmk, window=window)
 
-            if bmk_mean == 0 or pd.isna(bmk_mean):
-                return float("nan")
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray, bmk: np.ndarray, min_periods: int = 21, **kwargs
+    ) -> np.ndarray:
+        return _down_capture(returns, bmk, min_periods=min_periods)
 
-            return port_mean / bmk_mean
+    @staticmethod
+    def _online(stats: OnlineStats, assessment_type: AssessmentType, **kwargs) -> float:
+        count: float = stats.sum("down_days")
+        if count == 0:
+            return np.nan
 
-        # Apply calculation using index position
-        result = pd.Series(
-            [down_capture_window(i) for i in range(len(returns))], index=returns.index
-        )
+        benchmark_mean: float = stats.sum("down_bmk") / count
+        if benchmark_mean == 0:
+            return np.nan
 
-        return result
+        return stats.sum("down_returns") / count / benchmark_mean
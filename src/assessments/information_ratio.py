@@ -1,31 +1,45 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import ClassVar
+from typing import Any, ClassVar
 
 import numpy as np
 import pandas as pd
 
-from src.assessments.base_assessment import BaseAssessment
+from src.assessments.base_assessment import BaseAssessment, resolve_dependency
 from src.assessments.tracking_error import TrackingError
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
 
 
 @dataclass(kw_only=True)
 class InformationRatio(BaseAssessment):
     name: ClassVar[AssessmentName] = AssessmentName.InformationRatio
+    inputs: ClassVar[tuple[str, ...]] = ("returns", "bmk")
+    dependencies: ClassVar[tuple[AssessmentName, ...]] = (AssessmentName.TrackingError,)
+
+    # The tracking error is annualised by sqrt(ann_factor), as the
+    # TrackingError assessment reports it
 
     @staticmethod
     def _summary(
-        returns: pd.Series, bmk: pd.Series, ann_factor: int = 252, **kwargs
+        returns: pd.Series,
+        bmk: pd.Series,
+        ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
     ) -> float:
-        tracking_error: float = TrackingError._summary(
-            returns=returns, bmk=bmk, ann_factor=1
+        tracking_error: float = resolve_dependency(
+            dependencies,
+            AssessmentName.TrackingError,
+            lambda: TrackingError._summary(
+                returns=returns, bmk=bmk, ann_factor=ann_factor
+            ),
         )
 
         return (
-            float(
-                ((returns - bmk).mean() * ann_factor)
-                / (tracking_error * np.sqrt(ann_factor))
-            )
+            float(((returns - bmk).mean() * ann_factor) / tracking_error)
             if tracking_error != 0
             else np.nan
         )
@@ -36,15 +50,24 @@ class InformationRatio(BaseAssessment):
         bmk: pd.Series,
         window: int = 252,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
         **kwargs,
     ) -> pd.Series:
-        rolling_te: pd.Series = TrackingError._rolling(
-            returns=returns, bmk=bmk, window=window, ann_factor=1
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+        rolling_te: pd.Series = resolve_dependency(
+            dependencies,
+            AssessmentName.TrackingError,
+            lambda: TrackingError._rolling(
+                returns=returns,
+                bmk=bmk,
+                window=window,
+                ann_factor=ann_factor,
+                stats=stats,
+            ),
         )
 
-        return ((returns - bmk).rolling(window).mean() * ann_factor) / (
-            rolling_te * np.sqrt(ann_factor)
-        )
+        return (stats.mean("active", window) * ann_factor) / rolling_te
 
     @staticmethod
     def _expanding(
@@ -52,12 +75,115 @@ class InformationRatio(BaseAssessment):
         bmk: pd.Series,
         min_periods: int = 21,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
         **kwargs,
     ) -> pd.Series:
-        expanding_te: pd.Series = TrackingError._expanding(
-            returns=returns, bmk=bmk, min_periods=min_periods, ann_factor=1
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+        expanding_te: pd.Series = resolve_dependency(
+            dependencies,
+            AssessmentName.TrackingError,
+            lambda: TrackingError._expanding(
+                returns=returns,
+                bmk=bmk,
+                min_periods=min_periods,
+                ann_factor=ann_factor,
+                stats=stats,
+            ),
+        )
+
+        return (stats.mean("active", min_periods=min_periods) * ann_factor) / (
+            expanding_te
+        )
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> float:
+        tracking_error: float = resolve_dependency(
+            dependencies,
+            AssessmentName.TrackingError,
+            lambda: TrackingError._summary_kernel(
+                returns=returns, bmk=bmk, ann_factor=ann_factor
+            ),
         )
 
-        return ((returns - bmk).expanding(min_periods).mean() * ann_factor) / (
-            expanding_te * np.sqrt(ann_factor)
+        return (
+            float(((returns - bmk).mean() * ann_factor) / tracking_error)
+            if tracking_error != 0
+            else np.nan
         )
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        window: int = 252,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+        rolling_te: np.ndarray = resolve_dependency(
+            dependencies,
+            AssessmentName.TrackingError,
+            lambda: TrackingError._rolling_kernel(
+                returns=returns,
+                bmk=bmk,
+                window=window,
+                ann_factor=ann_factor,
+                stats=stats,
+            ),
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (stats.mean("active", window, raw=True) * ann_factor) / rolling_te
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        min_periods: int = 21,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+        expanding_te: np.ndarray = resolve_dependency(
+            dependencies,
+            AssessmentName.TrackingError,
+            lambda: TrackingError._expanding_kernel(
+                returns=returns,
+                bmk=bmk,
+                min_periods=min_periods,
+                ann_factor=ann_factor,
+                stats=stats,
+            ),
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (
+                stats.mean("active", min_periods=min_periods, raw=True) * ann_factor
+            ) / expanding_te
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        tracking_error: float = stats.std("active")
+        if assessment_type == AssessmentType.Summary and tracking_error == 0:
+            return np.nan
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (stats.mean("active") * ann_factor) / (
+                tracking_error * np.sqrt(ann_factor)
+            )
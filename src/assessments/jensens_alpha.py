@@ -1,16 +1,23 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import ClassVar
+from typing import Any, ClassVar
 
+import numpy as np
 import pandas as pd
 
-from src.assessments.base_assessment import BaseAssessment
+from src.assessments.base_assessment import BaseAssessment, resolve_dependency
 from src.assessments.beta import Beta
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
+from src.utils.windows import window_mean
 
 
 @dataclass(kw_only=True)
 class JensensAlpha(BaseAssessment):
     name: ClassVar[AssessmentName] = AssessmentName.JensensAlpha
+    dependencies: ClassVar[tuple[AssessmentName, ...]] = (AssessmentName.Beta,)
 
     @staticmethod
     def _summary(
@@ -18,9 +25,14 @@ class JensensAlpha(BaseAssessment):
         rfr: pd.Series,
         bmk: pd.Series,
         ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
         **kwargs,
     ) -> float:
-        beta: float = Beta._summary(returns=returns, bmk=bmk)
+        beta: float = resolve_dependency(
+            dependencies,
+            AssessmentName.Beta,
+            lambda: Beta._summary(returns=returns, bmk=bmk),
+        )
 
         return ((returns - rfr) - beta * (bmk - rfr)).mean() * ann_factor
 
@@ -31,13 +43,22 @@ class JensensAlpha(BaseAssessment):
         bmk: pd.Series,
         window: int,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
         **kwargs,
     ) -> pd.Series:
-        rolling_beta: pd.Series = Beta._rolling(returns=returns, bmk=bmk, window=window)
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+        rolling_beta: pd.Series = resolve_dependency(
+            dependencies, AssessmentName.Beta, lambda: stats.beta(window)
+        )
 
-        return ((returns - rfr) - rolling_beta * (bmk - rfr)).rolling(
-            window
-        ).mean() * ann_factor
+        return (
+            stats.series("excess") - rolling_beta * stats.series("bmk_excess")
+        ).rolling(window).mean() * ann_factor
 
     @staticmethod
     def _expanding(
@@ -46,12 +67,105 @@ class JensensAlpha(BaseAssessment):
         bmk: pd.Series,
         min_periods: int,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
         **kwargs,
     ) -> pd.Series:
-        rolling_beta: pd.Series = Beta._expanding(
-            returns=returns, bmk=bmk, min_periods=min_periods
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+        rolling_beta: pd.Series = resolve_dependency(
+            dependencies,
+            AssessmentName.Beta,
+            lambda: stats.beta(min_periods=min_periods),
+        )
+
+        return (
+            stats.series("excess") - rolling_beta * stats.series("bmk_excess")
+        ).expanding(min_periods).mean() * ann_factor
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray,
+        rfr: np.ndarray,
+        bmk: np.ndarray,
+        ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> float:
+        beta: float = resolve_dependency(
+            dependencies,
+            AssessmentName.Beta,
+            lambda: Beta._summary_kernel(returns=returns, bmk=bmk),
+        )
+
+        return float(((returns - rfr) - beta * (bmk - rfr)).mean() * ann_factor)
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        rfr: np.ndarray,
+        bmk: np.ndarray,
+        window: int,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
         )
+        rolling_beta: np.ndarray = resolve_dependency(
+            dependencies, AssessmentName.Beta, lambda: stats.beta(window, raw=True)
+        )
+        alpha: np.ndarray = stats.values("excess") - rolling_beta * stats.values(
+            "bmk_excess"
+        )
+
+        return window_mean(alpha, window) * ann_factor
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        rfr: np.ndarray,
+        bmk: np.ndarray,
+        min_periods: int,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+        expanding_beta: np.ndarray = resolve_dependency(
+            dependencies,
+            AssessmentName.Beta,
+            lambda: stats.beta(min_periods=min_periods, raw=True),
+        )
+        alpha: np.ndarray = stats.values("excess") - expanding_beta * stats.values(
+            "bmk_excess"
+        )
+
+        return window_mean(alpha, min_periods=min_periods) * ann_factor
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        if assessment_type == AssessmentType.Summary:
+            return (
+                stats.mean("excess") - stats.beta() * stats.mean("bmk_excess")
+            ) * ann_factor
 
-        return ((returns - rfr) - rolling_beta * (bmk - rfr)).expanding(
-            min_periods
-        ).mean() * ann_factor
+        # Windowed alphas use the beta of the window ending at each tick
+        return stats.alpha_mean() * ann_factor
@@ -1,11 +1,51 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 from scipy import stats
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import window_moments, wrap_like
+
+
+def _kurtosis(
+    values: np.ndarray,
+    window: int | None = None,
+    min_periods: int = 1,
+    excess: bool = True,
+) -> np.ndarray:
+    """Windowed unbiased kurtosis, matching ``scipy.stats.kurtosis(bias=False)``.
+
+    Built from running power sums, so each window costs O(1).
+    """
+    n, mean, m2, _, m4 = window_moments(values, window, min_periods)
+
+    return _kurtosis_from_moments(n, mean, m2, m4, excess)
+
+
+def _kurtosis_from_moments(
+    n: np.ndarray,
+    mean: np.ndarray,
+    m2: np.ndarray,
+    m4: np.ndarray,
+    excess: bool = True,
+) -> np.ndarray:
+    """Unbiased kurtosis from the count, mean and biased central moments."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zero: np.ndarray = m2 <= (np.finfo(np.float64).eps * mean) ** 2
+        biased: np.ndarray = np.where(zero, np.nan, m4 / m2**2)
+        unbiased: np.ndarray = (
+            1.0 / (n - 2) / (n - 3) * ((n**2 - 1.0) * m4 / m2**2 - 3 * (n - 1) ** 2)
+            + 3.0
+        )
+
+    kurtosis: np.ndarray = np.where(~zero & (n > 3), unbiased, biased)
+
+    return kurtosis - 3 if excess else kurtosis
 
 
 @dataclass(kw_only=True)
@@ -23,6 +63,7 @@ class Kurtosis(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.Kurtosis
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(returns: pd.Series, excess: bool = True, **kwargs) -> float:
@@ -34,14 +75,45 @@ class Kurtosis(BaseAssessment):
     def _rolling(
         returns: pd.Series, window: int, excess: bool = True, **kwargs
     ) -> pd.Series:
-        return returns.rolling(window=window).apply(
-            lambda x: float(stats.kurtosis(x, bias=False, fisher=excess)), raw=False
+        result: np.ndarray = _kurtosis(
+            returns.to_numpy(dtype=float), window=window, excess=excess
         )
 
+        return wrap_like(result, returns)
+
     @staticmethod
     def _expanding(
         returns: pd.Series, min_periods: int = 21, excess: bool = True, **kwargs
     ) -> pd.Series:
-        return returns.expanding(min_periods=min_periods).apply(
-            lambda x: float(stats.kurtosis(x, bias=False, fisher=excess)), raw=False
+        result: np.ndarray = _kurtosis(
+            returns.to_numpy(dtype=float), min_periods=min_periods, excess=excess
         )
+
+        return wrap_like(result, returns)
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, excess: bool = True, **kwargs) -> float:
+        return float(stats.kurtosis(returns, bias=False, fisher=excess))
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray, window: int, excess: bool = True, **kwargs
+    ) -> np.ndarray:
+        return _kurtosis(returns, window=window, excess=excess)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray, min_periods: int = 21, excess: bool = True, **kwargs
+    ) -> np.ndarray:
+        return _kurtosis(returns, min_periods=min_periods, excess=excess)
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        excess: bool = True,
+        **kwargs,
+    ) -> float:
+        n, mean, m2, _, m4 = stats.moments()
+
+        return float(_kurtosis_from_moments(n, mean, m2, m4, excess))
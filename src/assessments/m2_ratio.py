@@ -6,6 +6,17 @@ import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats, WindowMoments
+from src.utils.window_stats import WindowStats
+
+
+def _lag(values: np.ndarray) -> np.ndarray:
+    """Values of the previous point, NaN for the first one, as ``shift(1)``."""
+    lagged: np.ndarray = np.full(values.shape, np.nan)
+    lagged[1:] = values[:-1]
+
+    return lagged
 
 
 @dataclass(kw_only=True)
@@ -47,6 +58,36 @@ class M2Ratio(BaseAssessment):
 
         return float(m2)
 
+    @staticmethod
+    def _from_moments(
+        returns_mean: pd.Series | np.ndarray,
+        returns_std: pd.Series | np.ndarray,
+        bmk_mean: pd.Series | np.ndarray,
+        bmk_std: pd.Series | np.ndarray,
+        rfr_mean: pd.Series | np.ndarray,
+        ann_factor: int = 252,
+    ) -> pd.Series | np.ndarray:
+        """Combine windowed means and standard deviations into M².
+
+        Works on Series and arrays alike, returning the same type.
+        """
+        portfolio_ret = returns_mean * ann_factor
+        bmk_ret = bmk_mean * ann_factor
+        rfr_ret = rfr_mean * ann_factor
+
+        portfolio_vol = returns_std * np.sqrt(ann_factor)
+        bmk_vol = bmk_std * np.sqrt(ann_factor)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m2 = (
+                (portfolio_ret - rfr_ret) * (bmk_vol / portfolio_vol)
+                + rfr_ret
+                - bmk_ret
+            )
+
+        # NaN wherever the portfolio has no volatility
+        return m2 * np.where(portfolio_vol != 0, 1.0, np.nan)
+
     @staticmethod
     def _rolling(
         returns: pd.Series,
@@ -54,33 +95,24 @@ class M2Ratio(BaseAssessment):
         rfr: pd.Series,
         window: int,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
         **kwargs,
     ) -> pd.Series:
-        def calc_m2(idx):
-            if idx < window:
-                return np.nan
-
-            ret_window = returns.iloc[idx - window : idx]
-            bmk_window = bmk.iloc[idx - window : idx]
-            rfr_window = rfr.iloc[idx - window : idx]
-
-            portfolio_ret = ret_window.mean() * ann_factor
-            bmk_ret = bmk_window.mean() * ann_factor
-            rfr_mean = rfr_window.mean() * ann_factor
-
-            portfolio_vol = ret_window.std() * np.sqrt(ann_factor)
-            bmk_vol = bmk_window.std() * np.sqrt(ann_factor)
-
-            if portfolio_vol == 0:
-                return np.nan
-
-            return (
-                (portfolio_ret - rfr_mean) * (bmk_vol / portfolio_vol)
-                + rfr_mean
-                - bmk_ret
-            )
-
-        return pd.Series([calc_m2(i) for i in range(len(returns))], index=returns.index)
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+
+        # Each point uses the `window` observations before it, hence the shift
+        return M2Ratio._from_moments(
+            returns_mean=stats.mean("returns", window).shift(1),
+            returns_std=stats.std("returns", window).shift(1),
+            bmk_mean=stats.mean("bmk", window).shift(1),
+            bmk_std=stats.std("bmk", window).shift(1),
+            rfr_mean=stats.mean("rfr", window).shift(1),
+            ann_factor=ann_factor,
+        )
 
     @staticmethod
     def _expanding(
@@ -89,30 +121,118 @@ class M2Ratio(BaseAssessment):
         rfr: pd.Series,
         min_periods: int = 21,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
         **kwargs,
     ) -> pd.Series:
-        def calc_m2(idx):
-            if idx < min_periods - 1:
-                return np.nan
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+
+        return M2Ratio._from_moments(
+            returns_mean=stats.mean("returns", min_periods=min_periods),
+            returns_std=stats.std("returns", min_periods=min_periods),
+            bmk_mean=stats.mean("bmk", min_periods=min_periods),
+            bmk_std=stats.std("bmk", min_periods=min_periods),
+            rfr_mean=stats.mean("rfr", min_periods=min_periods),
+            ann_factor=ann_factor,
+        )
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        rfr: np.ndarray,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        portfolio_vol: float = returns.std(ddof=1) * np.sqrt(ann_factor)
+        if portfolio_vol == 0:
+            return np.nan
 
-            ret_window = returns.iloc[: idx + 1]
-            bmk_window = bmk.iloc[: idx + 1]
-            rfr_window = rfr.iloc[: idx + 1]
+        return float(
+            M2Ratio._from_moments(
+                returns_mean=returns.mean(),
+                returns_std=returns.std(ddof=1),
+                bmk_mean=bmk.mean(),
+                bmk_std=bmk.std(ddof=1),
+                rfr_mean=rfr.mean(),
+                ann_factor=ann_factor,
+            )
+        )
 
-            portfolio_ret = ret_window.mean() * ann_factor
-            bmk_ret = bmk_window.mean() * ann_factor
-            rfr_mean = rfr_window.mean() * ann_factor
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        rfr: np.ndarray,
+        window: int,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+
+        return M2Ratio._from_moments(
+            returns_mean=_lag(stats.mean("returns", window, raw=True)),
+            returns_std=_lag(stats.std("returns", window, raw=True)),
+            bmk_mean=_lag(stats.mean("bmk", window, raw=True)),
+            bmk_std=_lag(stats.std("bmk", window, raw=True)),
+            rfr_mean=_lag(stats.mean("rfr", window, raw=True)),
+            ann_factor=ann_factor,
+        )
 
-            portfolio_vol = ret_window.std() * np.sqrt(ann_factor)
-            bmk_vol = bmk_window.std() * np.sqrt(ann_factor)
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        rfr: np.ndarray,
+        min_periods: int = 21,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+
+        return M2Ratio._from_moments(
+            returns_mean=stats.mean("returns", min_periods=min_periods, raw=True),
+            returns_std=stats.std("returns", min_periods=min_periods, raw=True),
+            bmk_mean=stats.mean("bmk", min_periods=min_periods, raw=True),
+            bmk_std=stats.std("bmk", min_periods=min_periods, raw=True),
+            rfr_mean=stats.mean("rfr", min_periods=min_periods, raw=True),
+            ann_factor=ann_factor,
+        )
 
-            if portfolio_vol == 0:
-                return np.nan
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        # Rolling M² uses the window that ends the tick before
+        moments: WindowMoments = (
+            stats.lagged if assessment_type == AssessmentType.Rolling else stats
+        )
+        if not moments.ready:
+            return np.nan
 
-            return (
-                (portfolio_ret - rfr_mean) * (bmk_vol / portfolio_vol)
-                + rfr_mean
-                - bmk_ret
+        return float(
+            M2Ratio._from_moments(
+                returns_mean=moments.mean("returns"),
+                returns_std=moments.std("returns"),
+                bmk_mean=moments.mean("bmk"),
+                bmk_std=moments.std("bmk"),
+                rfr_mean=moments.mean("rfr"),
+                ann_factor=ann_factor,
             )
-
-        return pd.Series([calc_m2(i) for i in range(len(returns))], index=returns.index)
+        )
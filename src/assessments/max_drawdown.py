@@ -1,16 +1,78 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
-import pandas as pd
 import numpy as np
+import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import fill_windows, valid_log_wealth
+
+
+def _rolling_max_drawdown(returns: np.ndarray, window: int) -> np.ndarray:
+    """Max drawdown of every trailing window in O(n), over log wealth.
+
+    The series is cut into blocks of ``window`` points. Any window is then a
+    suffix of one block followed by a prefix of the next, and the (peak, trough,
+    max drawdown) summaries of all block prefixes and suffixes come from running
+    max/min scans (van Herk/Gil-Werman). Combining two summaries A then B gives
+    min(A.max_dd, B.max_dd, B.trough - A.peak).
+
+    Windows holding a return of -1 or below, or a NaN, have no log wealth and
+    are computed from the products of their returns instead.
+    """
+    n: int = len(returns)
+    out: np.ndarray = np.full(returns.shape, np.nan)
+    if window > n:
+        return out
+
+    log_wealth, flagged = valid_log_wealth(returns)
+
+    # Pad with the last value, which adds no new peak, trough or drawdown
+    n_blocks: int = -(-n // window)
+    padding: np.ndarray = np.repeat(log_wealth[-1:], n_blocks * window - n, axis=0)
+    blocks: np.ndarray = np.concatenate([log_wealth, padding]).reshape(
+        n_blocks, window, *returns.shape[1:]
+    )
+
+    prefix_max: np.ndarray = np.maximum.accumulate(blocks, axis=1)
+    prefix_min: np.ndarray = np.minimum.accumulate(blocks, axis=1)
+    prefix_dd: np.ndarray = np.minimum.accumulate(blocks - prefix_max, axis=1)
+
+    reverse: np.ndarray = blocks[:, ::-1]
+    suffix_max: np.ndarray = np.maximum.accumulate(reverse, axis=1)[:, ::-1]
+    suffix_min: np.ndarray = np.minimum.accumulate(reverse, axis=1)[:, ::-1]
+    suffix_dd: np.ndarray = np.minimum.accumulate(
+        (suffix_min - blocks)[:, ::-1], axis=1
+    )[:, ::-1]
+
+    ends: np.ndarray = np.arange(window - 1, n)
+    starts: np.ndarray = ends - window + 1
+    block: np.ndarray = starts // window
+    offset: np.ndarray = starts % window
+    next_block: np.ndarray = np.minimum(block + 1, n_blocks - 1)
+    last: np.ndarray = (offset - 1) % window
+
+    spanning_dd: np.ndarray = np.minimum(
+        np.minimum(suffix_dd[block, offset], prefix_dd[next_block, last]),
+        prefix_min[next_block, last] - suffix_max[block, offset],
+    )
+    aligned: np.ndarray = (offset == 0).reshape(-1, *([1] * (returns.ndim - 1)))
+    out[window - 1 :] = np.expm1(
+        np.where(aligned, suffix_dd[block, offset], spanning_dd)
+    )
+    if flagged.any():
+        fill_windows(out, returns, window, flagged, MaxDrawdown._summary_kernel)
+
+    return out
 
 
 @dataclass
 class MaxDrawdown(BaseAssessment):
     name: ClassVar[AssessmentName] = AssessmentName.MaxDrawdown
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(returns: pd.Series, **kwargs) -> float:
@@ -31,3 +93,31 @@ class MaxDrawdown(BaseAssessment):
             MaxDrawdown._summary,
             raw=True,
         )
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, **kwargs) -> float:
+        cum_returns: np.ndarray = np.cumprod(returns + 1)
+        running_max: np.ndarray = np.maximum.accumulate(cum_returns)
+
+        return float((cum_returns / running_max - 1).min())
+
+    @staticmethod
+    def _rolling_kernel(returns: np.ndarray, window: int = 252, **kwargs) -> np.ndarray:
+        return _rolling_max_drawdown(returns, window)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray, min_periods: int = 21, **kwargs
+    ) -> np.ndarray:
+        # A single running-peak pass: each prefix shares the drawdowns before it
+        cum_returns: np.ndarray = np.cumprod(returns + 1, axis=0)
+        running_max: np.ndarray = np.maximum.accumulate(cum_returns, axis=0)
+        drawdown: np.ndarray = cum_returns / running_max - 1
+        max_dd: np.ndarray = np.minimum.accumulate(drawdown, axis=0)
+        max_dd[: max(min_periods - 1, 0)] = np.nan
+
+        return max_dd
+
+    @staticmethod
+    def _online(stats: OnlineStats, assessment_type: AssessmentType, **kwargs) -> float:
+        return stats.max_drawdown()
@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import window_mean
 
 
 @dataclass(kw_only=True)
@@ -21,6 +25,7 @@ class MeanReturn(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.MeanReturn
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(returns: pd.Series, ann_factor: int = 252, **kwargs) -> float:
@@ -37,3 +42,28 @@ class MeanReturn(BaseAssessment):
         returns: pd.Series, min_periods: int = 21, ann_factor: int = 252, **kwargs
     ) -> pd.Series:
         return returns.expanding(min_periods=min_periods).mean() * ann_factor
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, ann_factor: int = 252, **kwargs) -> float:
+        return float(returns.mean() * ann_factor)
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray, window: int, ann_factor: int = 252, **kwargs
+    ) -> np.ndarray:
+        return window_mean(returns, window) * ann_factor
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray, min_periods: int = 21, ann_factor: int = 252, **kwargs
+    ) -> np.ndarray:
+        return window_mean(returns, min_periods=min_periods) * ann_factor
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        return stats.mean("returns") * ann_factor
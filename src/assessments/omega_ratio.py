@@ -6,6 +6,32 @@ import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import window_sum, wrap_like
+
+
+def _omega(
+    returns: np.ndarray,
+    threshold: float = 0.0,
+    window: int | None = None,
+    min_periods: int = 1,
+) -> np.ndarray:
+    """Windowed Omega Ratio from prefix sums of gains and losses.
+
+    Gain and loss day counts are exact, so windows without losses give
+    ``np.inf`` (and windows without gains give 0) exactly as in ``_summary``.
+    """
+    excess: np.ndarray = returns - threshold
+    gains: np.ndarray = window_sum(np.maximum(excess, 0.0), window, min_periods)
+    losses: np.ndarray = window_sum(np.maximum(-excess, 0.0), window, min_periods)
+    gain_days: np.ndarray = window_sum(excess > 0, window, min_periods)
+    loss_days: np.ndarray = window_sum(excess < 0, window, min_periods)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        omega: np.ndarray = np.where(gain_days > 0, gains, 0.0) / losses
+
+    return np.where(np.isnan(loss_days), np.nan, np.where(loss_days > 0, omega, np.inf))
 
 
 @dataclass(kw_only=True)
@@ -21,6 +47,7 @@ class OmegaRatio(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.OmegaRatio
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(
@@ -40,13 +67,11 @@ class OmegaRatio(BaseAssessment):
         ann_factor: int = 252,
         **kwargs,
     ) -> pd.Series:
-        def calc_omega(x):
-            excess = x - threshold
-            gains = excess[excess > 0].sum()
-            losses = -excess[excess < 0].sum()
-            return float(gains / losses) if losses > 0 else np.inf
+        result: np.ndarray = _omega(
+            returns.to_numpy(dtype=float), threshold, window=window
+        )
 
-        return returns.rolling(window=window).apply(calc_omega, raw=False)
+        return wrap_like(result, returns)
 
     @staticmethod
     def _expanding(
@@ -56,10 +81,48 @@ class OmegaRatio(BaseAssessment):
         ann_factor: int = 252,
         **kwargs,
     ) -> pd.Series:
-        def calc_omega(x):
-            excess = x - threshold
-            gains = excess[excess > 0].sum()
-            losses = -excess[excess < 0].sum()
-            return float(gains / losses) if losses > 0 else np.inf
+        result: np.ndarray = _omega(
+            returns.to_numpy(dtype=float), threshold, min_periods=min_periods
+        )
+
+        return wrap_like(result, returns)
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray, threshold: float = 0.0, ann_factor: int = 252, **kwargs
+    ) -> float:
+        excess: np.ndarray = returns - threshold
+        gains: float = excess[excess > 0].sum()
+        losses: float = -excess[excess < 0].sum()
+
+        return float(gains / losses) if losses > 0 else np.inf
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        threshold: float = 0.0,
+        window: int = 252,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> np.ndarray:
+        return _omega(returns, threshold, window=window)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        threshold: float = 0.0,
+        min_periods: int = 21,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> np.ndarray:
+        return _omega(returns, threshold, min_periods=min_periods)
+
+    @staticmethod
+    def _online(stats: OnlineStats, assessment_type: AssessmentType, **kwargs) -> float:
+        """Omega Ratio at the ``threshold`` the running statistics were built with."""
+        if stats.sum("loss_days") == 0:
+            return np.inf
+
+        gains: float = stats.sum("gains") if stats.sum("gain_days") > 0 else 0.0
 
-        return returns.expanding(min_periods=min_periods).apply(calc_omega, raw=False)
+        return gains / stats.sum("losses")
@@ -6,6 +6,9 @@ import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
 
 
 @dataclass(kw_only=True)
@@ -23,6 +26,7 @@ class RSquared(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.RSquared
+    inputs: ClassVar[tuple[str, ...]] = ("returns", "bmk")
 
     @staticmethod
     def _summary(returns: pd.Series, bmk: pd.Series, **kwargs) -> float:
@@ -31,14 +35,57 @@ class RSquared(BaseAssessment):
 
     @staticmethod
     def _rolling(
-        returns: pd.Series, bmk: pd.Series, window: int, **kwargs
+        returns: pd.Series,
+        bmk: pd.Series,
+        window: int,
+        stats: WindowStats | None = None,
+        **kwargs,
     ) -> pd.Series:
-        correlation = returns.rolling(window=window).corr(bmk)
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+        correlation = stats.corr("returns", "bmk", window)
         return correlation**2
 
     @staticmethod
     def _expanding(
-        returns: pd.Series, bmk: pd.Series, min_periods: int = 21, **kwargs
+        returns: pd.Series,
+        bmk: pd.Series,
+        min_periods: int = 21,
+        stats: WindowStats | None = None,
+        **kwargs,
     ) -> pd.Series:
-        correlation = returns.expanding(min_periods=min_periods).corr(bmk)
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+        correlation = stats.corr("returns", "bmk", min_periods=min_periods)
         return correlation**2
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, bmk: np.ndarray, **kwargs) -> float:
+        correlation = np.corrcoef(returns, bmk)[0, 1]
+        return float(correlation**2)
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        window: int,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+        correlation = stats.corr("returns", "bmk", window, raw=True)
+        return correlation**2
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        min_periods: int = 21,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+        correlation = stats.corr("returns", "bmk", min_periods=min_periods, raw=True)
+        return correlation**2
+
+    @staticmethod
+    def _online(stats: OnlineStats, assessment_type: AssessmentType, **kwargs) -> float:
+        return stats.corr() ** 2
@@ -6,6 +6,39 @@ import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import window_sum, wrap_like
+
+
+def _downside_variance(
+    returns: np.ndarray,
+    target: float = 0.0,
+    window: int | None = None,
+    min_periods: int = 1,
+) -> np.ndarray:
+    """Windowed sample variance of the deviations below ``target``.
+
+    Count, sum and sum of squares of the downside deviations are prefix sums,
+    shifted by the overall downside mean to limit cancellation. Windows with
+    fewer than two downside points are NaN, as with ``Series.var``.
+    """
+    deviation: np.ndarray = returns - target
+    downside: np.ndarray = deviation < 0
+    downside_count: np.ndarray = downside.sum(axis=0)
+    shift: np.ndarray = np.where(downside, deviation, 0.0).sum(axis=0) / np.maximum(
+        downside_count, 1
+    )
+    shifted: np.ndarray = np.where(downside, deviation - shift, 0.0)
+
+    count: np.ndarray = window_sum(downside, window, min_periods)
+    total: np.ndarray = window_sum(shifted, window, min_periods)
+    sum_squares: np.ndarray = window_sum(shifted**2, window, min_periods)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance: np.ndarray = (sum_squares - total**2 / count) / (count - 1)
+
+    return np.where(count > 1, np.maximum(variance, 0.0), np.nan)
 
 
 @dataclass(kw_only=True)
@@ -21,6 +54,7 @@ class SemiVariance(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.SemiVariance
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(
@@ -41,12 +75,11 @@ class SemiVariance(BaseAssessment):
         ann_factor: int = 252,
         **kwargs,
     ) -> pd.Series:
-        def calc_semi_var(x):
-            downside = x - target
-            downside = downside[downside < 0]
-            return float(downside.var() * ann_factor) if len(downside) > 0 else np.nan
+        result: np.ndarray = _downside_variance(
+            returns.to_numpy(dtype=float), target, window=window
+        )
 
-        return returns.rolling(window=window).apply(calc_semi_var, raw=False)
+        return wrap_like(result * ann_factor, returns)
 
     @staticmethod
     def _expanding(
@@ -56,11 +89,63 @@ class SemiVariance(BaseAssessment):
         ann_factor: int = 252,
         **kwargs,
     ) -> pd.Series:
-        def calc_semi_var(x):
-            downside = x - target
-            downside = downside[downside < 0]
-            return float(downside.var() * ann_factor) if len(downside) > 0 else np.nan
+        result: np.ndarray = _downside_variance(
+            returns.to_numpy(dtype=float), target, min_periods=min_periods
+        )
+
+        return wrap_like(result * ann_factor, returns)
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray, target: float = 0.0, ann_factor: int = 252, **kwargs
+    ) -> float:
+        downside: np.ndarray = np.minimum(returns - target, 0.0)
+
+        return float(downside.var(ddof=1) * ann_factor)
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        target: float = 0.0,
+        window: int = 252,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> np.ndarray:
+        return _downside_variance(returns, target, window=window) * ann_factor
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        target: float = 0.0,
+        min_periods: int = 21,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> np.ndarray:
+        return _downside_variance(returns, target, min_periods=min_periods) * ann_factor
 
-        return returns.expanding(min_periods=min_periods).apply(
-            calc_semi_var, raw=False
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        """Semi-Variance at the ``target`` the running statistics were built with.
+
+        The summary is the variance over all points, with zeros above the
+        target, while windows use the downside points only.
+        """
+        count: np.float64 = (
+            stats.n
+            if assessment_type == AssessmentType.Summary
+            else stats.sum("downside_days")
+        )
+        if count <= 1:
+            return np.nan
+
+        total: np.float64 = stats.sum("downside")
+        variance: np.float64 = (stats.sum("downside_sq") - total * total / count) / (
+            count - 1
         )
+
+        return np.maximum(variance, 0.0) * ann_factor
@@ -6,11 +6,15 @@ import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
 
 
 @dataclass(kw_only=True)
 class SharpeRatio(BaseAssessment):
     name: ClassVar[AssessmentName] = AssessmentName.SharpeRatio
+    inputs: ClassVar[tuple[str, ...]] = ("returns", "rfr")
 
     @staticmethod
     def _summary(
@@ -27,15 +31,20 @@ class SharpeRatio(BaseAssessment):
 
     @staticmethod
     def _rolling(
-        returns: pd.Series, rfr: pd.Series, window: int, ann_factor: int = 252, **kwargs
+        returns: pd.Series,
+        rfr: pd.Series,
+        window: int,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
     ) -> pd.Series:
-        excess: pd.Series = returns - rfr
+        stats = stats if stats is not None else WindowStats(returns=returns, rfr=rfr)
 
-        return excess.rolling(window=window).apply(
-            lambda x: float(x.mean() * np.sqrt(ann_factor) / x.std())
-            if x.std() > 0
-            else np.nan,
-            raw=False,
+        excess_mean: pd.Series = stats.mean("excess", window)
+        excess_std: pd.Series = stats.std("excess", window)
+
+        return (excess_mean * np.sqrt(ann_factor) / excess_std).where(
+            excess_std > 0, np.nan
         )
 
     @staticmethod
@@ -44,13 +53,82 @@ class SharpeRatio(BaseAssessment):
         rfr: pd.Series,
         min_periods: int = 21,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
         **kwargs,
     ) -> pd.Series:
-        excess: pd.Series = returns - rfr
+        stats = stats if stats is not None else WindowStats(returns=returns, rfr=rfr)
+
+        excess_mean: pd.Series = stats.mean("excess", min_periods=min_periods)
+        excess_std: pd.Series = stats.std("excess", min_periods=min_periods)
+
+        return (excess_mean * np.sqrt(ann_factor) / excess_std).where(
+            excess_std > 0, np.nan
+        )
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray, rfr: np.ndarray, ann_factor: int = 252, **kwargs
+    ) -> float:
+        excess: np.ndarray = returns - rfr
+        excess_std: float = excess.std(ddof=1)
+
+        return (
+            float(excess.mean() * np.sqrt(ann_factor) / excess_std)
+            if excess_std > 0
+            else np.nan
+        )
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        rfr: np.ndarray,
+        window: int,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, rfr=rfr)
+
+        excess_mean: np.ndarray = stats.mean("excess", window, raw=True)
+        excess_std: np.ndarray = stats.std("excess", window, raw=True)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                excess_std > 0, excess_mean * np.sqrt(ann_factor) / excess_std, np.nan
+            )
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        rfr: np.ndarray,
+        min_periods: int = 21,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, rfr=rfr)
+
+        excess_mean: np.ndarray = stats.mean(
+            "excess", min_periods=min_periods, raw=True
+        )
+        excess_std: np.ndarray = stats.std("excess", min_periods=min_periods, raw=True)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                excess_std > 0, excess_mean * np.sqrt(ann_factor) / excess_std, np.nan
+            )
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        excess_std: float = stats.std("excess")
 
-        return excess.expanding(min_periods=min_periods).apply(
-            lambda x: float(x.mean() * np.sqrt(ann_factor) / x.std())
-            if x.std() > 0
-            else np.nan,
-            raw=False,
+        return (
+            stats.mean("excess") * np.sqrt(ann_factor) / excess_std
+            if excess_std > 0
+            else np.nan
         )
@@ -1,11 +1,40 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 from scipy import stats
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import window_moments, wrap_like
+
+
+def _skewness(
+    values: np.ndarray, window: int | None = None, min_periods: int = 1
+) -> np.ndarray:
+    """Windowed unbiased skewness, matching ``scipy.stats.skew(bias=False)``.
+
+    Built from running power sums, so each window costs O(1).
+    """
+    n, mean, m2, m3, _ = window_moments(values, window, min_periods)
+
+    return _skewness_from_moments(n, mean, m2, m3)
+
+
+def _skewness_from_moments(
+    n: np.ndarray, mean: np.ndarray, m2: np.ndarray, m3: np.ndarray
+) -> np.ndarray:
+    """Unbiased skewness from the count, mean and biased central moments."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zero: np.ndarray = m2 <= (np.finfo(np.float64).eps * mean) ** 2
+        skew: np.ndarray = m3 / (m2 * np.sqrt(m2))
+        biased: np.ndarray = np.where(zero, np.nan, skew)
+        unbiased: np.ndarray = np.sqrt((n - 1.0) * n) / (n - 2.0) * skew
+
+    return np.where(~zero & (n > 2), unbiased, biased)
 
 
 @dataclass(kw_only=True)
@@ -23,6 +52,7 @@ class Skewness(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.Skewness
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(returns: pd.Series, **kwargs) -> float:
@@ -30,12 +60,34 @@ class Skewness(BaseAssessment):
 
     @staticmethod
     def _rolling(returns: pd.Series, window: int, **kwargs) -> pd.Series:
-        return returns.rolling(window=window).apply(
-            lambda x: float(stats.skew(x, bias=False)), raw=False
-        )
+        result: np.ndarray = _skewness(returns.to_numpy(dtype=float), window=window)
+
+        return wrap_like(result, returns)
 
     @staticmethod
     def _expanding(returns: pd.Series, min_periods: int = 21, **kwargs) -> pd.Series:
-        return returns.expanding(min_periods=min_periods).apply(
-            lambda x: float(stats.skew(x, bias=False)), raw=False
+        result: np.ndarray = _skewness(
+            returns.to_numpy(dtype=float), min_periods=min_periods
         )
+
+        return wrap_like(result, returns)
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, **kwargs) -> float:
+        return float(stats.skew(returns, bias=False))
+
+    @staticmethod
+    def _rolling_kernel(returns: np.ndarray, window: int, **kwargs) -> np.ndarray:
+        return _skewness(returns, window=window)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray, min_periods: int = 21, **kwargs
+    ) -> np.ndarray:
+        return _skewness(returns, min_periods=min_periods)
+
+    @staticmethod
+    def _online(stats: OnlineStats, assessment_type: AssessmentType, **kwargs) -> float:
+        n, mean, m2, m3, _ = stats.moments()
+
+        return float(_skewness_from_moments(n, mean, m2, m3))
@@ -6,11 +6,38 @@ import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
+from src.utils.windows import window_sum
+
+
+def _sortino(
+    excess: np.ndarray,
+    excess_mean: np.ndarray,
+    window: int | None = None,
+    min_periods: int = 1,
+    ann_factor: int = 252,
+) -> np.ndarray:
+    """Windowed Sortino Ratio from the windowed mean of ``excess``.
+
+    The downside deviation is the root mean square of the negative excess
+    returns, so a window sum of the squared shortfalls gives every window.
+    """
+    shortfall: np.ndarray = np.minimum(excess, 0.0)
+    count: np.ndarray = window_sum(np.ones_like(excess), window, min_periods)
+    downside_deviation: np.ndarray = np.sqrt(
+        window_sum(shortfall * shortfall, window, min_periods) / count
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return excess_mean / downside_deviation * np.sqrt(ann_factor)
 
 
 @dataclass(kw_only=True)
 class SortinoRatio(BaseAssessment):
     name: ClassVar[AssessmentName] = AssessmentName.SortinoRatio
+    inputs: ClassVar[tuple[str, ...]] = ("returns", "rfr")
 
     @staticmethod
     def _summary(
@@ -45,17 +72,22 @@ class SortinoRatio(BaseAssessment):
         target: float = 0.0,
         ann_factor: int = 252,
         rfr: pd.Series | None = None,
+        stats: WindowStats | None = None,
         **kwargs,
     ) -> pd.Series:
         # Use rfr if provided, otherwise use target
         if rfr is not None:
-            excess: pd.Series = returns - rfr
+            stats = (
+                stats if stats is not None else WindowStats(returns=returns, rfr=rfr)
+            )
+            excess: pd.Series = stats.series("excess")
+            rolling_excess_mean: pd.Series = stats.mean("excess", window)
         else:
             excess: pd.Series = returns - target
+            rolling_excess_mean: pd.Series = excess.rolling(window).mean()
 
         excess_downside: pd.Series = excess.where(excess < 0, 0.0)
 
-        rolling_excess_mean: pd.Series = excess.rolling(window).mean()
         rolling_excess_downside_deviation: pd.Series = (
             excess_downside.pow(2).rolling(window).mean().pow(0.5)
         )
@@ -73,17 +105,24 @@ class SortinoRatio(BaseAssessment):
         target: float = 0.0,
         ann_factor: int = 252,
         rfr: pd.Series | None = None,
+        stats: WindowStats | None = None,
         **kwargs,
     ) -> pd.Series:
         # Use rfr if provided, otherwise use target
         if rfr is not None:
-            excess: pd.Series = returns - rfr
+            stats = (
+                stats if stats is not None else WindowStats(returns=returns, rfr=rfr)
+            )
+            excess: pd.Series = stats.series("excess")
+            rolling_excess_mean: pd.Series = stats.mean(
+                "excess", min_periods=min_periods
+            )
         else:
             excess: pd.Series = returns - target
+            rolling_excess_mean: pd.Series = excess.expanding(min_periods).mean()
 
         excess_downside: pd.Series = excess.where(excess < 0, 0.0)
 
-        rolling_excess_mean: pd.Series = excess.expanding(min_periods).mean()
         rolling_excess_downside_deviation: pd.Series = (
             excess_downside.pow(2).expanding(min_periods).mean().pow(0.5)
         )
@@ -93,3 +132,91 @@ class SortinoRatio(BaseAssessment):
             / rolling_excess_downside_deviation
             * np.sqrt(ann_factor)
         )
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray,
+        target: float = 0.0,
+        ann_factor: int = 252,
+        rfr: np.ndarray | None = None,
+        **kwargs,
+    ) -> float:
+        excess: np.ndarray = returns - (rfr if rfr is not None else target)
+        shortfall: np.ndarray = np.minimum(excess, 0.0)
+        excess_downside_deviation: float = np.sqrt(np.mean(shortfall * shortfall))
+        mean_excess: float = excess.mean()
+
+        if excess_downside_deviation > 0:
+            return float(mean_excess / excess_downside_deviation * np.sqrt(ann_factor))
+
+        return float(np.inf) if mean_excess > 0 else float(-np.inf)
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        window: int = 252,
+        target: float = 0.0,
+        ann_factor: int = 252,
+        rfr: np.ndarray | None = None,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        if rfr is not None:
+            stats = (
+                stats if stats is not None else WindowStats(returns=returns, rfr=rfr)
+            )
+            excess: np.ndarray = stats.values("excess")
+            excess_mean: np.ndarray = stats.mean("excess", window, raw=True)
+        else:
+            excess: np.ndarray = returns - target
+            excess_mean: np.ndarray = WindowStats(returns=excess).mean(
+                "returns", window, raw=True
+            )
+
+        return _sortino(excess, excess_mean, window=window, ann_factor=ann_factor)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        min_periods: int = 252,
+        target: float = 0.0,
+        ann_factor: int = 252,
+        rfr: np.ndarray | None = None,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        if rfr is not None:
+            stats = (
+                stats if stats is not None else WindowStats(returns=returns, rfr=rfr)
+            )
+            excess: np.ndarray = stats.values("excess")
+            excess_mean: np.ndarray = stats.mean(
+                "excess", min_periods=min_periods, raw=True
+            )
+        else:
+            excess: np.ndarray = returns - target
+            excess_mean: np.ndarray = WindowStats(returns=excess).mean(
+                "returns", min_periods=min_periods, raw=True
+            )
+
+        return _sortino(
+            excess, excess_mean, min_periods=min_periods, ann_factor=ann_factor
+        )
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        mean_excess: float = stats.mean("excess")
+        excess_downside_deviation: float = np.sqrt(stats.sum("shortfall_sq") / stats.n)
+
+        if assessment_type == AssessmentType.Summary and not (
+            excess_downside_deviation > 0
+        ):
+            return float(np.inf) if mean_excess > 0 else float(-np.inf)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return mean_excess / excess_downside_deviation * np.sqrt(ann_factor)
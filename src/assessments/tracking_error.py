@@ -6,11 +6,15 @@ import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
 
 
 @dataclass(kw_only=True)
 class TrackingError(BaseAssessment):
     name: ClassVar[AssessmentName] = AssessmentName.TrackingError
+    inputs: ClassVar[tuple[str, ...]] = ("returns", "bmk")
 
     @staticmethod
     def _summary(
@@ -24,9 +28,12 @@ class TrackingError(BaseAssessment):
         bmk: pd.Series,
         window: int = 252,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
         **kwargs,
     ) -> pd.Series:
-        return (returns - bmk).rolling(window).std() * np.sqrt(ann_factor)
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+
+        return stats.std("active", window) * np.sqrt(ann_factor)
 
     @staticmethod
     def _expanding(
@@ -34,6 +41,52 @@ class TrackingError(BaseAssessment):
         bmk: pd.Series,
         min_periods: int = 21,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
         **kwargs,
     ) -> pd.Series:
-        return (returns - bmk).expanding(min_periods).std() * np.sqrt(ann_factor)
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+
+        return stats.std("active", min_periods=min_periods) * np.sqrt(ann_factor)
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray, bmk: np.ndarray, ann_factor: int = 252, **kwargs
+    ) -> float:
+        return float((returns - bmk).std(ddof=1) * np.sqrt(ann_factor))
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        window: int = 252,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+
+        return stats.std("active", window, raw=True) * np.sqrt(ann_factor)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        bmk: np.ndarray,
+        min_periods: int = 21,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns, bmk=bmk)
+
+        return stats.std("active", min_periods=min_periods, raw=True) * np.sqrt(
+            ann_factor
+        )
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        return stats.std("active") * np.sqrt(ann_factor)
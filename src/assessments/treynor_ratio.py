@@ -1,17 +1,22 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import ClassVar
+from typing import Any, ClassVar
 
 import numpy as np
 import pandas as pd
 
-from src.assessments.base_assessment import BaseAssessment
+from src.assessments.base_assessment import BaseAssessment, resolve_dependency
 from src.assessments.beta import Beta
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
 
 
 @dataclass(kw_only=True)
 class TreynorRatio(BaseAssessment):
     name: ClassVar[AssessmentName] = AssessmentName.TreynorRatio
+    dependencies: ClassVar[tuple[AssessmentName, ...]] = (AssessmentName.Beta,)
 
     @staticmethod
     def _summary(
@@ -19,9 +24,14 @@ class TreynorRatio(BaseAssessment):
         rfr: pd.Series,
         bmk: pd.Series,
         ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
         **kwargs,
     ) -> float:
-        beta: float = Beta._summary(returns=returns, bmk=bmk)
+        beta: float = resolve_dependency(
+            dependencies,
+            AssessmentName.Beta,
+            lambda: Beta._summary(returns=returns, bmk=bmk),
+        )
         excess: pd.Series = returns - rfr
 
         return excess.mean() * ann_factor / beta if beta != 0 else np.nan
@@ -33,12 +43,20 @@ class TreynorRatio(BaseAssessment):
         bmk: pd.Series,
         window: int = 252,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
         **kwargs,
     ) -> pd.Series:
-        rolling_beta: pd.Series = Beta._rolling(returns=returns, bmk=bmk, window=window)
-        excess: pd.Series = returns - rfr
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+        rolling_beta: pd.Series = resolve_dependency(
+            dependencies, AssessmentName.Beta, lambda: stats.beta(window)
+        )
 
-        return (excess.rolling(window).mean() * ann_factor / rolling_beta).where(
+        return (stats.mean("excess", window) * ann_factor / rolling_beta).where(
             rolling_beta != 0, np.nan
         )
 
@@ -49,13 +67,105 @@ class TreynorRatio(BaseAssessment):
         bmk: pd.Series,
         min_periods: int = 21,
         ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
         **kwargs,
     ) -> pd.Series:
-        expanding_beta: pd.Series = Beta._expanding(
-            returns=returns, bmk=bmk, min_periods=min_periods
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+        expanding_beta: pd.Series = resolve_dependency(
+            dependencies,
+            AssessmentName.Beta,
+            lambda: stats.beta(min_periods=min_periods),
         )
-        excess: pd.Series = returns - rfr
 
         return (
-            excess.expanding(min_periods).mean() * ann_factor / expanding_beta
+            stats.mean("excess", min_periods=min_periods) * ann_factor / expanding_beta
         ).where(expanding_beta != 0, np.nan)
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray,
+        rfr: np.ndarray,
+        bmk: np.ndarray,
+        ann_factor: int = 252,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> float:
+        beta: float = resolve_dependency(
+            dependencies,
+            AssessmentName.Beta,
+            lambda: Beta._summary_kernel(returns=returns, bmk=bmk),
+        )
+
+        return (returns - rfr).mean() * ann_factor / beta if beta != 0 else np.nan
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        rfr: np.ndarray,
+        bmk: np.ndarray,
+        window: int = 252,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+        rolling_beta: np.ndarray = resolve_dependency(
+            dependencies, AssessmentName.Beta, lambda: stats.beta(window, raw=True)
+        )
+        excess_mean: np.ndarray = stats.mean("excess", window, raw=True)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                rolling_beta != 0, excess_mean * ann_factor / rolling_beta, np.nan
+            )
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        rfr: np.ndarray,
+        bmk: np.ndarray,
+        min_periods: int = 21,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        dependencies: Mapping[str, Any] | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = (
+            stats
+            if stats is not None
+            else WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+        )
+        expanding_beta: np.ndarray = resolve_dependency(
+            dependencies,
+            AssessmentName.Beta,
+            lambda: stats.beta(min_periods=min_periods, raw=True),
+        )
+        excess_mean: np.ndarray = stats.mean(
+            "excess", min_periods=min_periods, raw=True
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                expanding_beta != 0, excess_mean * ann_factor / expanding_beta, np.nan
+            )
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        beta: float = stats.beta()
+
+        return stats.mean("excess") * ann_factor / beta if beta != 0 else np.nan
@@ -3,9 +3,51 @@ from typing import ClassVar
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.windows import (
+    fill_windows,
+    valid_log_wealth,
+    window_sum,
+)
+
+# Upper bound on the number of window elements materialised at once
+_CHUNK_SIZE: int = 1 << 20
+
+
+def _rolling_ulcer(returns: np.ndarray, window: int) -> np.ndarray:
+    """Ulcer Index of every trailing window, computed on raw ndarrays.
+
+    Windows are taken as ``sliding_window_view`` slices of the log wealth and
+    processed in chunks of at most ``_CHUNK_SIZE`` elements, so the in-window
+    running peak is one vectorised scan per chunk. Windows holding a return of
+    -1 or below, or a NaN, have no log wealth and are computed from the
+    products of their returns instead.
+    """
+    n: int = len(returns)
+    out: np.ndarray = np.full(returns.shape, np.nan)
+    if window > n:
+        return out
+
+    log_wealth, flagged = valid_log_wealth(returns)
+    windows: np.ndarray = sliding_window_view(log_wealth, window, axis=0)
+    rows: int = max(_CHUNK_SIZE // (window * int(np.prod(returns.shape[1:]))), 1)
+
+    for start in range(0, len(windows), rows):
+        chunk: np.ndarray = windows[start : start + rows]
+        running_max: np.ndarray = np.maximum.accumulate(chunk, axis=-1)
+        drawdown: np.ndarray = np.expm1(chunk - running_max) * 100
+        out[window - 1 + start : window - 1 + start + len(chunk)] = np.sqrt(
+            np.mean(drawdown**2, axis=-1)
+        )
+    if flagged.any():
+        fill_windows(out, returns, window, flagged, UlcerIndex._summary_kernel)
+
+    return out
 
 
 @dataclass(kw_only=True)
@@ -24,6 +66,7 @@ class UlcerIndex(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.UlcerIndex
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(returns: pd.Series, **kwargs) -> float:
@@ -43,20 +86,40 @@ class UlcerIndex(BaseAssessment):
 
     @staticmethod
     def _rolling(returns: pd.Series, window: int, **kwargs) -> pd.Series:
-        def calc_ulcer(x):
-            cumulative = (1 + x).cumprod()
-            running_max = cumulative.expanding().max()
-            drawdown = ((cumulative - running_max) / running_max) * 100
-            return np.sqrt((drawdown**2).mean())
-
-        return returns.rolling(window=window).apply(calc_ulcer, raw=False)
+        return returns.rolling(window=window).apply(UlcerIndex._summary, raw=False)
 
     @staticmethod
     def _expanding(returns: pd.Series, min_periods: int = 21, **kwargs) -> pd.Series:
-        def calc_ulcer(x):
-            cumulative = (1 + x).cumprod()
-            running_max = cumulative.expanding().max()
-            drawdown = ((cumulative - running_max) / running_max) * 100
-            return np.sqrt((drawdown**2).mean())
+        return returns.expanding(min_periods=min_periods).apply(
+            UlcerIndex._summary, raw=False
+        )
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, **kwargs) -> float:
+        cumulative: np.ndarray = np.cumprod(1 + returns)
+        running_max: np.ndarray = np.maximum.accumulate(cumulative)
+        drawdown: np.ndarray = ((cumulative - running_max) / running_max) * 100
+
+        return float(np.sqrt(np.mean(drawdown**2)))
 
-        return returns.expanding(min_periods=min_periods).apply(calc_ulcer, raw=False)
+    @staticmethod
+    def _rolling_kernel(returns: np.ndarray, window: int, **kwargs) -> np.ndarray:
+        return _rolling_ulcer(returns, window)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray, min_periods: int = 21, **kwargs
+    ) -> np.ndarray:
+        # Every prefix shares the same running peak, so one pass gives all drawdowns
+        cumulative: np.ndarray = np.cumprod(1 + returns, axis=0)
+        running_max: np.ndarray = np.maximum.accumulate(cumulative, axis=0)
+        drawdown: np.ndarray = ((cumulative - running_max) / running_max) * 100
+
+        sum_squares: np.ndarray = window_sum(drawdown**2, min_periods=min_periods)
+        count: np.ndarray = window_sum(np.ones_like(drawdown), min_periods=min_periods)
+
+        return np.sqrt(sum_squares / count)
+
+    @staticmethod
+    def _online(stats: OnlineStats, assessment_type: AssessmentType, **kwargs) -> float:
+        return stats.ulcer()
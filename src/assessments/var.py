@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
 
 
 @dataclass(kw_only=True)
@@ -21,6 +25,7 @@ class VaR(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.VaR
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(returns: pd.Series, confidence_level: float = 0.95, **kwargs) -> float:
@@ -43,3 +48,48 @@ class VaR(BaseAssessment):
     ) -> pd.Series:
         """Calculate expanding VaR."""
         return returns.expanding(min_periods).quantile(1 - confidence_level)
+
+    @staticmethod
+    def _summary_kernel(
+        returns: np.ndarray, confidence_level: float = 0.95, **kwargs
+    ) -> float:
+        return float(np.quantile(returns, 1 - confidence_level))
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        window: int,
+        confidence_level: float = 0.95,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """Rolling VaR from the sliding sorted window that CVaR also reads."""
+        stats = stats if stats is not None else WindowStats(returns=returns)
+        var, _ = stats.tail_risk("returns", confidence_level, window, raw=True)
+
+        return var
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        min_periods: int = 21,
+        confidence_level: float = 0.95,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """Expanding VaR from the growing sorted window that CVaR also reads."""
+        stats = stats if stats is not None else WindowStats(returns=returns)
+        var, _ = stats.tail_risk(
+            "returns", confidence_level, min_periods=min_periods, raw=True
+        )
+
+        return var
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        confidence_level: float = 0.95,
+        **kwargs,
+    ) -> float:
+        return stats.quantile(1 - confidence_level)
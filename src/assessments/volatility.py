@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 
 from src.assessments.base_assessment import BaseAssessment
 from src.constants import AssessmentName
+from src.dataclasses.assessment_results import AssessmentType
+from src.utils.online_stats import OnlineStats
+from src.utils.window_stats import WindowStats
 
 
 @dataclass(kw_only=True)
@@ -19,6 +23,7 @@ class Volatility(BaseAssessment):
     """
 
     name: ClassVar[AssessmentName] = AssessmentName.Volatility
+    inputs: ClassVar[tuple[str, ...]] = ("returns",)
 
     @staticmethod
     def _summary(returns: pd.Series, ann_factor: int = 252, **kwargs) -> float:
@@ -26,12 +31,63 @@ class Volatility(BaseAssessment):
 
     @staticmethod
     def _rolling(
-        returns: pd.Series, window: int, ann_factor: int = 252, **kwargs
+        returns: pd.Series,
+        window: int,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
     ) -> pd.Series:
-        return returns.rolling(window).std() * (ann_factor**0.5)
+        stats = stats if stats is not None else WindowStats(returns=returns)
+
+        return stats.std("returns", window) * (ann_factor**0.5)
 
     @staticmethod
     def _expanding(
-        returns: pd.Series, min_periods: int = 21, ann_factor: int = 252, **kwargs
+        returns: pd.Series,
+        min_periods: int = 21,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
     ) -> pd.Series:
-        return returns.expanding(min_periods).std() * (ann_factor**0.5)
+        stats = stats if stats is not None else WindowStats(returns=returns)
+
+        return stats.std("returns", min_periods=min_periods) * (ann_factor**0.5)
+
+    @staticmethod
+    def _summary_kernel(returns: np.ndarray, ann_factor: int = 252, **kwargs) -> float:
+        return float(returns.std(ddof=1) * (ann_factor**0.5))
+
+    @staticmethod
+    def _rolling_kernel(
+        returns: np.ndarray,
+        window: int,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns)
+
+        return stats.std("returns", window, raw=True) * (ann_factor**0.5)
+
+    @staticmethod
+    def _expanding_kernel(
+        returns: np.ndarray,
+        min_periods: int = 21,
+        ann_factor: int = 252,
+        stats: WindowStats | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        stats = stats if stats is not None else WindowStats(returns=returns)
+
+        return stats.std("returns", min_periods=min_periods, raw=True) * (
+            ann_factor**0.5
+        )
+
+    @staticmethod
+    def _online(
+        stats: OnlineStats,
+        assessment_type: AssessmentType,
+        ann_factor: int = 252,
+        **kwargs,
+    ) -> float:
+        return stats.std("returns") * (ann_factor**0.5)
@@ -0,0 +1,187 @@
+"""Returns, rfr and benchmark series aligned once on their union index.
+
+``AssessmentConfig.iter_configs`` pairs returns series with rfr and benchmark
+series, by default every returns with every rfr and benchmark. Instead of
+reindexing rfr and bmk again for each combination, ``AlignedPanel`` places all
+rfr and all benchmark series on the union of the indexes once, as contiguous
+(series x dates) arrays. It takes the rows of each returns series from them
+once per returns series. A combination is then a column selection of those
+rows, and its ``OverlapMode.LONGEST_OVERLAP`` bounds are the max/min of the
+first and last valid dates of its three series, found once per series.
+"""
+
+from dataclasses import dataclass, field
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+
+def _valid_bounds(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """First and last non-NaN position of each row of ``values``.
+
+    Rows without valid values get bounds that never overlap (length, -1).
+    """
+    length: int = values.shape[1]
+    valid: np.ndarray = ~np.isnan(values)
+    has_valid: np.ndarray = valid.any(axis=1)
+    first: np.ndarray = np.where(has_valid, valid.argmax(axis=1), length)
+    last: np.ndarray = np.where(
+        has_valid, length - 1 - valid[:, ::-1].argmax(axis=1), -1
+    )
+
+    return first, last
+
+
+@dataclass
+class AlignedPanel:
+    """All series of a config aligned on the union of their indexes.
+
+    All indexes must be unique and sorted (see ``supports``).
+
+    Args:
+        returns: Returns series, filtered to the config dates.
+        rfr: Risk-free rate series.
+        bmk: Benchmark series.
+        longest_overlap: Whether combinations keep only the period where their
+            returns, rfr and benchmark all have data.
+    """
+
+    returns: list[pd.Series]
+    rfr: list[pd.Series]
+    bmk: list[pd.Series]
+    longest_overlap: bool = False
+
+    index: pd.Index = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.index = reduce(
+            lambda left, right: left if left.equals(right) else left.union(right),
+            (s.index for s in (*self.returns, *self.rfr, *self.bmk)),
+        )
+        length: int = len(self.index)
+
+        # Rows of the union index holding each returns series
+        self._positions: list[np.ndarray] = [
+            self.index.get_indexer(s.index) for s in self.returns
+        ]
+        returns_values: list[np.ndarray] = [
+            s.to_numpy(dtype=np.float64, na_value=np.nan) for s in self.returns
+        ]
+        # Running count of missing returns, to check any range in O(1)
+        self._missing: list[np.ndarray] = [
+            np.concatenate([[0], np.cumsum(np.isnan(values))])
+            for values in returns_values
+        ]
+
+        self._rfr: np.ndarray = self._stack(self.rfr)
+        self._bmk: np.ndarray = self._stack(self.bmk)
+
+        # First and last valid rows of the returns, rfr and bmk series
+        self._firsts: tuple[np.ndarray, ...] = ()
+        self._lasts: tuple[np.ndarray, ...] = ()
+        if self.longest_overlap:
+            returns_first, returns_last = zip(
+                *(
+                    self._returns_bounds(values, positions, length)
+                    for values, positions in zip(returns_values, self._positions)
+                )
+            )
+            rfr_first, rfr_last = _valid_bounds(self._rfr)
+            bmk_first, bmk_last = _valid_bounds(self._bmk)
+            self._firsts = (np.array(returns_first), rfr_first, bmk_first)
+            self._lasts = (np.array(returns_last), rfr_last, bmk_last)
+
+        # Missing rfr and bmk values count as zero
+        np.nan_to_num(self._rfr, copy=False, nan=0.0)
+        np.nan_to_num(self._bmk, copy=False, nan=0.0)
+
+    @staticmethod
+    def supports(*series: pd.Series) -> bool:
+        """Whether the indexes of ``series`` are unique and sorted, as a union needs."""
+        return all(
+            s.index.is_unique and s.index.is_monotonic_increasing for s in series
+        )
+
+    def _stack(self, series: list[pd.Series]) -> np.ndarray:
+        values: np.ndarray = np.full((len(series), len(self.index)), np.nan)
+        for row, s in zip(values, series):
+            row[self.index.get_indexer(s.index)] = s.to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+
+        return values
+
+    @staticmethod
+    def _returns_bounds(
+        values: np.ndarray, positions: np.ndarray, length: int
+    ) -> tuple[int, int]:
+        valid: np.ndarray = np.flatnonzero(~np.isnan(values))
+        if not len(valid):
+            return length, -1
+
+        return positions[valid[0]], positions[valid[-1]]
+
+    def rows(self, i: int) -> tuple[np.ndarray, np.ndarray]:
+        """rfr and bmk values at the dates of returns series ``i``.
+
+        Returns:
+            Arrays of shape (series, dates); rows are contiguous.
+        """
+        positions: np.ndarray = self._positions[i]
+        return self._rfr[:, positions], self._bmk[:, positions]
+
+    def combination(
+        self,
+        i: int,
+        f: int,
+        b: int,
+        rows: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> tuple[pd.Series, pd.Series, pd.Series]:
+        """Processed (returns, rfr, bmk) of one combination.
+
+        Args:
+            i, f, b: Positions of the returns, rfr and bmk series.
+            rows: ``rows(i)``, to share between the combinations of returns ``i``.
+
+        Returns:
+            Tuple of (processed_returns, processed_rfr, processed_bmk)
+        """
+        returns: pd.Series = self.returns[i]
+        rfr_rows, bmk_rows = rows if rows is not None else self.rows(i)
+
+        lo, hi = 0, len(returns)
+        if self.longest_overlap:
+            start = max(first[k] for first, k in zip(self._firsts, (i, f, b)))
+            end = min(last[k] for last, k in zip(self._lasts, (i, f, b)))
+            if start > end:
+                raise ValueError(
+                    f"No overlapping period found for {returns.name}, "
+                    f"{self.rfr[f].name}, {self.bmk[b].name}"
+                )
+            positions: np.ndarray = self._positions[i]
+            lo = int(np.searchsorted(positions, start, side="left"))
+            hi = int(np.searchsorted(positions, end, side="right"))
+
+        if self._missing[i][hi] - self._missing[i][lo]:
+            raise ValueError(
+                f"Returns ({returns.name}) have missing data after processing"
+            )
+
+        # Views of the returns and of the rows, not copies
+        returns = returns.iloc[lo:hi]
+        return (
+            returns,
+            pd.Series(
+                rfr_rows[f, lo:hi],
+                index=returns.index,
+                name=self.rfr[f].name,
+                copy=False,
+            ),
+            pd.Series(
+                bmk_rows[b, lo:hi],
+                index=returns.index,
+                name=self.bmk[b].name,
+                copy=False,
+            ),
+        )
@@ -1,15 +1,32 @@
 from abc import ABC
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import date
 from enum import StrEnum
+from functools import cache
 from itertools import product
 import logging
-from typing import Iterator
+from typing import Any, Iterator
 
+import numpy as np
 import pandas as pd
 
+from src.dataclasses.aligned_panel import AlignedPanel
+from src.utils.window_stats import WindowStats
+
 logger = logging.getLogger(__name__)
 
+# Fields holding the series and how they combine, not assessment parameters
+_NON_PARAMETER_FIELDS: tuple[str, ...] = ("returns", "rfr", "bmk", "pairing")
+
+
+def _broadcast(series: pd.Series, columns: pd.Index) -> pd.DataFrame:
+    """Repeat ``series`` as every column of a DataFrame with ``columns``."""
+    return pd.DataFrame(
+        np.repeat(series.to_numpy()[:, None], len(columns), axis=1),
+        index=series.index,
+        columns=columns,
+    )
+
 
 class OverlapMode(StrEnum):
     """Mode for handling overlapping periods between multiple series."""
@@ -18,6 +35,20 @@ class OverlapMode(StrEnum):
     LONGEST_OVERLAP = "longest_overlap"  # Use only the longest overlapping period
 
 
+class PairingMode(StrEnum):
+    """How returns, rfr and benchmark series are combined into configurations."""
+
+    PRODUCT = "product"  # Every returns with every rfr and benchmark (default)
+    ZIP = "zip"  # The i-th returns, rfr and benchmark; single series go with all
+
+
+class Precision(StrEnum):
+    """Floating-point precision of the stored rolling and expanding results."""
+
+    FLOAT64 = "float64"  # Full precision (default)
+    FLOAT32 = "float32"  # Half the memory; computed in float64, stored in float32
+
+
 @dataclass(kw_only=True)
 class AssessmentConfig(ABC):
     returns: pd.Series | list[pd.Series]
@@ -28,9 +59,12 @@ class AssessmentConfig(ABC):
     end: str | pd.Timestamp | date | None = None
 
     ann_factor: int = 252
-    window: int = 252
+    window: int | list[int] = 252  # A list evaluates every rolling window
     min_periods: int = 21  # 1 BMonth
     overlap_mode: OverlapMode = OverlapMode.FULL
+    precision: Precision = Precision.FLOAT64
+    # A PairingMode, or explicit (returns, rfr, bmk) positions in the series lists
+    pairing: PairingMode | list[tuple[int, int, int]] = PairingMode.PRODUCT
 
     # Internal fields for normalized lists
     _returns_list: list[pd.Series] = field(init=False, repr=False)
@@ -42,17 +76,30 @@ class AssessmentConfig(ABC):
         if self.ann_factor <= 0:
             raise ValueError(f"ann_factor must be positive, got {self.ann_factor}")
 
-        if self.window <= 0:
-            raise ValueError(f"window must be positive, got {self.window}")
+        if not self.windows:
+            raise ValueError("window must contain at least one window length")
+
+        for window in self.windows:
+            if window <= 0:
+                raise ValueError(f"window must be positive, got {window}")
 
         if self.min_periods <= 0:
             raise ValueError(f"min_periods must be positive, got {self.min_periods}")
 
-        if self.min_periods > self.window:
-            logger.warning(
-                f"min_periods ({self.min_periods}) is greater than window ({self.window}). "
-                "This may cause issues in rolling calculations."
-            )
+        try:
+            self.precision = Precision(self.precision)
+        except ValueError:
+            raise ValueError(
+                f"precision must be one of {[p.value for p in Precision]}, "
+                f"got {self.precision!r}"
+            ) from None
+
+        for window in self.windows:
+            if self.min_periods > window:
+                logger.warning(
+                    f"min_periods ({self.min_periods}) is greater than window ({window}). "
+                    "This may cause issues in rolling calculations."
+                )
 
         # Normalize inputs to lists
         self._returns_list = (
@@ -61,6 +108,8 @@ class AssessmentConfig(ABC):
         self._rfr_list = self.rfr if isinstance(self.rfr, list) else [self.rfr]
         self._bmk_list = self.bmk if isinstance(self.bmk, list) else [self.bmk]
 
+        self._validate_pairing()
+
         # Validate all series are not empty
         for i, ret in enumerate(self._returns_list):
             if ret.empty:
@@ -87,11 +136,7 @@ class AssessmentConfig(ABC):
 
         # Store kwargs for later use (excluding internal fields)
         # Note: For single-series configs, we keep the series in kwargs for serialization
-        base_kwargs = {
-            k: v
-            for k, v in asdict(self).items()
-            if not k.startswith("_") and k not in ["returns", "rfr", "bmk"]
-        }
+        base_kwargs = self._parameters()
 
         # If single series (not lists), add them to kwargs for backward compatibility
         if (
@@ -105,6 +150,163 @@ class AssessmentConfig(ABC):
 
         self.kwargs: dict = base_kwargs
 
+        # Windowed statistics shared by the assessments, kept out of kwargs
+        # since those are serialized for remote execution
+        self.stats: WindowStats | None = (
+            WindowStats(
+                returns=base_kwargs["returns"],
+                rfr=base_kwargs["rfr"],
+                bmk=base_kwargs["bmk"],
+            )
+            if "returns" in base_kwargs
+            else None
+        )
+
+    @property
+    def windows(self) -> list[int]:
+        """Rolling window lengths, as a list even for a single window."""
+        return list(self.window) if isinstance(self.window, list) else [self.window]
+
+    @classmethod
+    @cache
+    def _parameter_names(cls) -> tuple[str, ...]:
+        return tuple(
+            f.name
+            for f in fields(cls)
+            if f.init and f.name not in _NON_PARAMETER_FIELDS
+        )
+
+    def _parameters(self) -> dict[str, Any]:
+        """Assessment parameters, referencing the field values without copying."""
+        return {name: getattr(self, name) for name in self._parameter_names()}
+
+    @property
+    def num_configs(self) -> int:
+        """Number of (returns, rfr, bmk) combinations evaluated."""
+        if isinstance(self.pairing, list):
+            return len(self.pairing)
+        if self.pairing == PairingMode.ZIP:
+            return max(
+                len(self._returns_list), len(self._rfr_list), len(self._bmk_list)
+            )
+
+        return len(self._returns_list) * len(self._rfr_list) * len(self._bmk_list)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """dtype of the stored rolling and expanding results."""
+        return np.dtype(self.precision.value)
+
+    def _validate_pairing(self) -> None:
+        sizes: tuple[int, int, int] = (
+            len(self._returns_list),
+            len(self._rfr_list),
+            len(self._bmk_list),
+        )
+
+        if isinstance(self.pairing, str):
+            try:
+                self.pairing = PairingMode(self.pairing)
+            except ValueError:
+                raise ValueError(
+                    f"pairing must be one of {[p.value for p in PairingMode]} "
+                    f"or a list of (returns, rfr, bmk) positions, got {self.pairing!r}"
+                ) from None
+
+            if self.pairing == PairingMode.ZIP and any(
+                size not in (1, max(sizes)) for size in sizes
+            ):
+                raise ValueError(
+                    "zip pairing needs lists of equal length or single series, "
+                    f"got {sizes[0]} returns, {sizes[1]} rfr, {sizes[2]} bmk"
+                )
+            return
+
+        if not self.pairing:
+            raise ValueError("pairing must contain at least one combination")
+
+        # Tuples of positions, also from JSON payloads holding lists
+        self.pairing = [tuple(positions) for positions in self.pairing]
+        for positions in self.pairing:
+            if len(positions) != 3 or not all(
+                isinstance(position, (int, np.integer)) and 0 <= position < size
+                for position, size in zip(positions, sizes)
+            ):
+                raise ValueError(
+                    f"pairing {positions} is not a (returns, rfr, bmk) position "
+                    f"triple within {sizes[0]} returns, {sizes[1]} rfr, {sizes[2]} bmk"
+                )
+
+        if len(set(self.pairing)) != len(self.pairing):
+            raise ValueError("pairing must not repeat a combination")
+
+    def _combinations(self) -> Iterator[tuple[int, int, int]]:
+        """Positions of the (returns, rfr, bmk) of each combination, in order."""
+        if isinstance(self.pairing, list):
+            yield from self.pairing
+        elif self.pairing == PairingMode.ZIP:
+            # Lists have the same length or a single series, repeated
+            for n in range(self.num_configs):
+                yield (
+                    n % len(self._returns_list),
+                    n % len(self._rfr_list),
+                    n % len(self._bmk_list),
+                )
+        else:
+            yield from product(
+                range(len(self._returns_list)),
+                range(len(self._rfr_list)),
+                range(len(self._bmk_list)),
+            )
+
+    def _filter_dates(self, returns: pd.Series) -> pd.Series:
+        """Restrict returns to the start and end dates."""
+        if self.start is not None:
+            start_date = pd.Timestamp(self.start).date()
+            returns = returns[start_date:]
+
+        if self.end is not None:
+            end_date = pd.Timestamp(self.end).date()
+            returns = returns[:end_date]
+
+        return returns
+
+    def _aligned_panel(self) -> AlignedPanel | None:
+        """Panel of all series, or None if their indexes cannot share a union."""
+        returns: list[pd.Series] = [self._filter_dates(r) for r in self._returns_list]
+        if not AlignedPanel.supports(*returns, *self._rfr_list, *self._bmk_list):
+            return None
+
+        return AlignedPanel(
+            returns=returns,
+            rfr=self._rfr_list,
+            bmk=self._bmk_list,
+            longest_overlap=self.overlap_mode == OverlapMode.LONGEST_OVERLAP,
+        )
+
+    def _iter_processed(
+        self,
+    ) -> Iterator[tuple[pd.Series, pd.Series, pd.Series]]:
+        """Processed (returns, rfr, bmk) of every combination of ``pairing``.
+
+        Uses one aligned panel for all combinations when possible, and
+        ``_process_single_config`` per combination otherwise.
+        """
+        panel: AlignedPanel | None = self._aligned_panel()
+        if panel is None:
+            for i, f, b in self._combinations():
+                yield self._process_single_config(
+                    self._returns_list[i], self._rfr_list[f], self._bmk_list[b]
+                )
+            return
+
+        # Rows are shared by consecutive combinations of the same returns
+        current: int | None = None
+        for i, f, b in self._combinations():
+            if i != current:
+                current, rows = i, panel.rows(i)
+            yield panel.combination(i, f, b, rows)
+
     def _process_single_config(
         self, returns: pd.Series, rfr: pd.Series, bmk: pd.Series
     ) -> tuple[pd.Series, pd.Series, pd.Series]:
@@ -114,14 +316,7 @@ class AssessmentConfig(ABC):
         Returns:
             Tuple of (processed_returns, processed_rfr, processed_bmk)
         """
-        # Apply date filtering
-        if self.start is not None:
-            start_date = pd.Timestamp(self.start).date()
-            returns = returns[start_date:]
-
-        if self.end is not None:
-            end_date = pd.Timestamp(self.end).date()
-            returns = returns[:end_date]
+        returns = self._filter_dates(returns)
 
         # Handle overlap mode
         if self.overlap_mode == OverlapMode.LONGEST_OVERLAP:
@@ -168,14 +363,7 @@ class AssessmentConfig(ABC):
         Yields:
             Tuple of (config_key, config) where config_key identifies the combination
         """
-        for ret, rfr, bmk in product(
-            self._returns_list, self._rfr_list, self._bmk_list
-        ):
-            # Process the combination
-            processed_ret, processed_rfr, processed_bmk = self._process_single_config(
-                ret, rfr, bmk
-            )
-
+        for processed_ret, processed_rfr, processed_bmk in self._iter_processed():
             # Create a key for this combination
             config_key = (
                 f"{processed_ret.name}|{processed_rfr.name}|{processed_bmk.name}"
@@ -193,10 +381,62 @@ class AssessmentConfig(ABC):
                 window=self.window,
                 min_periods=self.min_periods,
                 overlap_mode=self.overlap_mode,
+                precision=self.precision,
             )
 
             yield config_key, config
 
+    def iter_batches(
+        self,
+    ) -> Iterator[tuple[dict[str, "SingleAssessmentConfig"], "SingleAssessmentConfig"]]:
+        """
+        Group the individual configs into batches that can be evaluated at once.
+
+        Configs whose processed returns share the same index, rfr and benchmark are
+        stacked into a single config holding dates x portfolios DataFrames, with
+        one column per config_key. rfr and bmk are broadcast to the same columns
+        so that assessments can operate on all portfolios column-wise.
+
+        Yields:
+            Tuple of (configs, batch_config) where configs maps each config_key of
+            the batch to its individual config
+        """
+        batches: list[dict[str, SingleAssessmentConfig]] = []
+        for config_key, config in self.iter_configs():
+            for batch in batches:
+                first: SingleAssessmentConfig = next(iter(batch.values()))
+                if (
+                    first.returns.index.equals(config.returns.index)
+                    and first.rfr.equals(config.rfr)
+                    and first.bmk.equals(config.bmk)
+                ):
+                    batch[config_key] = config
+                    break
+            else:
+                batches.append({config_key: config})
+
+        for batch in batches:
+            first = next(iter(batch.values()))
+            columns = pd.Index(list(batch), name="config_key")
+
+            batch_config = SingleAssessmentConfig(
+                returns=pd.DataFrame(
+                    {key: config.returns for key, config in batch.items()},
+                    columns=columns,
+                ),
+                rfr=_broadcast(first.rfr, columns),
+                bmk=_broadcast(first.bmk, columns),
+                start=self.start,
+                end=self.end,
+                ann_factor=self.ann_factor,
+                window=self.window,
+                min_periods=self.min_periods,
+                overlap_mode=self.overlap_mode,
+                precision=self.precision,
+            )
+
+            yield batch, batch_config
+
 
 @dataclass(kw_only=True)
 class SingleAssessmentConfig(AssessmentConfig):
@@ -214,17 +454,30 @@ class SingleAssessmentConfig(AssessmentConfig):
         if self.ann_factor <= 0:
             raise ValueError(f"ann_factor must be positive, got {self.ann_factor}")
 
-        if self.window <= 0:
-            raise ValueError(f"window must be positive, got {self.window}")
+        if not self.windows:
+            raise ValueError("window must contain at least one window length")
+
+        for window in self.windows:
+            if window <= 0:
+                raise ValueError(f"window must be positive, got {window}")
 
         if self.min_periods <= 0:
             raise ValueError(f"min_periods must be positive, got {self.min_periods}")
 
-        if self.min_periods > self.window:
-            logger.warning(
-                f"min_periods ({self.min_periods}) is greater than window ({self.window}). "
-                "This may cause issues in rolling calculations."
-            )
+        try:
+            self.precision = Precision(self.precision)
+        except ValueError:
+            raise ValueError(
+                f"precision must be one of {[p.value for p in Precision]}, "
+                f"got {self.precision!r}"
+            ) from None
+
+        for window in self.windows:
+            if self.min_periods > window:
+                logger.warning(
+                    f"min_periods ({self.min_periods}) is greater than window ({window}). "
+                    "This may cause issues in rolling calculations."
+                )
 
         # No processing needed - data is already processed
         # Just validate it's not empty
@@ -237,20 +490,18 @@ class SingleAssessmentConfig(AssessmentConfig):
         if self.bmk.empty:
             raise ValueError("bmk series cannot be empty")
 
-        # Initialize the list fields to avoid asdict errors
+        # Initialize the list fields
         self._returns_list = [self.returns]
         self._rfr_list = [self.rfr]
         self._bmk_list = [self.bmk]
 
-        # Create kwargs manually to avoid issues with pd.Series serialization
         self.kwargs: dict = {
             "returns": self.returns,
             "rfr": self.rfr,
             "bmk": self.bmk,
-            "start": self.start,
-            "end": self.end,
-            "ann_factor": self.ann_factor,
-            "window": self.window,
-            "min_periods": self.min_periods,
-            "overlap_mode": self.overlap_mode,
+            **self._parameters(),
         }
+
+        self.stats: WindowStats | None = WindowStats(
+            returns=self.returns, rfr=self.rfr, bmk=self.bmk
+        )
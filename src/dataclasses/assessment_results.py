@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import TYPE_CHECKING
@@ -8,6 +9,7 @@ import seaborn as sns
 from matplotlib.figure import Figure
 
 from src.dataclasses.assessment_config import AssessmentConfig
+from src.utils.online_stats import OnlineStats
 
 if TYPE_CHECKING:
     from src.constants import AssessmentName
@@ -28,6 +30,12 @@ class EvaluationResults:
         results: Nested dict mapping config_key -> AssessmentName -> AssessmentType -> result value
         timer: Nested dict mapping config_key -> AssessmentName -> AssessmentType -> elapsed time
         config: The AssessmentConfig used to generate these results
+        cache_stats: Dict mapping config_key (or batch label for batched runs) ->
+            {"hits": int, "misses": int} for the shared windowed-statistics cache
+        online_stats: Dict mapping config_key -> expanding running statistics at the
+            last point, carried forward by incremental evaluations
+        result_cache_stats: {"hits": int, "misses": int} of the ResultCache during
+            the run, empty when the evaluation used no result cache
         results_dfs: Dict mapping AssessmentType -> DataFrame with multi-level columns
     """
 
@@ -38,6 +46,9 @@ class EvaluationResults:
         default_factory=dict
     )
     config: AssessmentConfig | None = None
+    cache_stats: dict[str, dict[str, int]] = field(default_factory=dict)
+    online_stats: dict[str, OnlineStats] = field(default_factory=dict)
+    result_cache_stats: dict[str, int] = field(default_factory=dict)
     results_dfs: dict[AssessmentType, pd.DataFrame] = field(
         default_factory=dict, init=False
     )
@@ -52,6 +63,7 @@ class EvaluationResults:
 
         For Summary: Index is assessments, columns are (Portfolio, RFR, Benchmark)
         For Rolling/Expanding: Index is dates, columns are (Portfolio, RFR, Benchmark, Assessment)
+        Rolling results for several windows gain a trailing Window column level.
         """
         # Build Summary DataFrame
         summary_data = {}
@@ -89,14 +101,21 @@ class EvaluationResults:
 
             for assessment, types in config_results.items():
                 if AssessmentType.Rolling in types:
-                    col_key = (portfolio, rfr, bmk, str(assessment))
-                    rolling_data[col_key] = types[AssessmentType.Rolling]
+                    for window, series in self._iter_windows(
+                        types[AssessmentType.Rolling]
+                    ):
+                        col_key = (portfolio, rfr, bmk, str(assessment))
+                        if window is not None:
+                            col_key = (*col_key, window)
+                        rolling_data[col_key] = series
 
         if rolling_data:
             rolling_df = pd.DataFrame(rolling_data)
+            names = ["Portfolio", "RFR", "Benchmark", "Assessment"]
+            if rolling_df.columns.nlevels > len(names):
+                names.append("Window")
             rolling_df.columns = pd.MultiIndex.from_tuples(
-                rolling_df.columns,
-                names=["Portfolio", "RFR", "Benchmark", "Assessment"],
+                rolling_df.columns, names=names
             )
             self.results_dfs[AssessmentType.Rolling] = rolling_df
 
@@ -122,6 +141,30 @@ class EvaluationResults:
             )
             self.results_dfs[AssessmentType.Expanding] = expanding_df
 
+    @property
+    def cache_hits(self) -> int:
+        """Total windowed-statistics cache hits across all configurations."""
+        return sum(stats.get("hits", 0) for stats in self.cache_stats.values())
+
+    @property
+    def cache_misses(self) -> int:
+        """Total windowed-statistics cache misses across all configurations."""
+        return sum(stats.get("misses", 0) for stats in self.cache_stats.values())
+
+    @staticmethod
+    def _iter_windows(
+        result: pd.Series | pd.DataFrame,
+    ) -> Iterator[tuple[int | None, pd.Series]]:
+        """Yield (window, series) pairs of a rolling result.
+
+        Multi-window results are DataFrames with one column per window; a single
+        window result is yielded with a window of None.
+        """
+        if isinstance(result, pd.DataFrame):
+            yield from result.items()
+        else:
+            yield None, result
+
     def get_summary_results(self) -> pd.DataFrame:
         """
         Extract all summary statistics into a DataFrame with multilevel columns.
@@ -169,30 +212,38 @@ class EvaluationResults:
         for config_key, config_results in self.results.items():
             for assessment, types in config_results.items():
                 if AssessmentType.Rolling in types:
-                    # Create multilevel column key
-                    col_key = (config_key, str(assessment))
-                    rolling_data[col_key] = types[AssessmentType.Rolling]
+                    # Create multilevel column key, with the window if several
+                    for window, series in self._iter_windows(
+                        types[AssessmentType.Rolling]
+                    ):
+                        col_key = (config_key, str(assessment))
+                        if window is not None:
+                            col_key = (*col_key, window)
+                        rolling_data[col_key] = series
 
         df = pd.DataFrame(rolling_data)
 
         # Create multilevel columns
         if df.columns.size > 0 and isinstance(df.columns[0], tuple):
+            windows = ["Window"] if df.columns.nlevels > 2 else []
+
             # Parse config keys if they contain pipe separators
             new_cols = []
-            for config_key, assessment in df.columns:
+            for config_key, assessment, *window in df.columns:
                 parts = config_key.split("|")
                 if len(parts) == 3:
-                    new_cols.append((*parts, assessment))
+                    new_cols.append((*parts, assessment, *window))
                 else:
-                    new_cols.append((config_key, assessment))
+                    new_cols.append((config_key, assessment, *window))
 
-            if all(len(c) == 4 for c in new_cols):
+            if all(len(c) == 4 + len(windows) for c in new_cols):
                 df.columns = pd.MultiIndex.from_tuples(
-                    new_cols, names=["Returns", "RFR", "Benchmark", "Assessment"]
+                    new_cols,
+                    names=["Returns", "RFR", "Benchmark", "Assessment", *windows],
                 )
             else:
                 df.columns = pd.MultiIndex.from_tuples(
-                    df.columns, names=["Config", "Assessment"]
+                    df.columns, names=["Config", "Assessment", *windows]
                 )
 
         return df
@@ -631,8 +682,11 @@ class EvaluationResults:
 
         if has_rolling:
             rolling_data = assessment_results[AssessmentType.Rolling]
-            if isinstance(rolling_data, pd.Series):
-                axes[plot_idx].plot(rolling_data.index, rolling_data.values)
+            if isinstance(rolling_data, (pd.Series, pd.DataFrame)):
+                for window, series in self._iter_windows(rolling_data):
+                    axes[plot_idx].plot(series.index, series.values, label=window)
+                if isinstance(rolling_data, pd.DataFrame):
+                    axes[plot_idx].legend(title="Window")
                 axes[plot_idx].set_title("Rolling")
                 axes[plot_idx].set_xlabel("Date")
                 axes[plot_idx].set_ylabel("Value")
@@ -715,5 +769,9 @@ class EvaluationResults:
         if self.config:
             lines.append(f"  overlap_mode={self.config.overlap_mode.value}")
 
+        if self.cache_stats:
+            lines.append(f"  cache_hits={self.cache_hits}")
+            lines.append(f"  cache_misses={self.cache_misses}")
+
         lines.append(")")
         return "\n".join(lines)
@@ -1,50 +1,59 @@
+import copy
+from collections.abc import Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Self, Type
-from concurrent.futures import Executor, ProcessPoolExecutor
+from graphlib import TopologicalSorter
+from logging import Logger, getLogger
+from time import perf_counter
+from typing import Any, Self
 
+import numpy as np
 import pandas as pd
-from typing import Iterable
 
+from src.assessments.annualized_returns import AnnualizedReturns
 from src.assessments.base_assessment import BaseAssessment
+from src.assessments.benchmark_correlation import BenchmarkCorrelation
 from src.assessments.beta import Beta
 from src.assessments.cagr import CAGR
-from src.assessments.jensens_alpha import JensensAlpha
-from src.assessments.max_drawdown import MaxDrawdown
 from src.assessments.calmar_ratio import CalmarRatio
-from src.assessments.information_ratio import InformationRatio
-from src.assessments.sharpe_ratio import SharpeRatio
-from src.assessments.sortino_ratio import SortinoRatio
-from src.assessments.tracking_error import TrackingError
-from src.assessments.treynor_ratio import TreynorRatio
-from src.assessments.volatility import Volatility
-from src.assessments.benchmark_correlation import BenchmarkCorrelation
-from src.assessments.var import VaR
+from src.assessments.cumulative_returns import CumulativeReturns
 from src.assessments.cvar import CVaR
-from src.assessments.up_capture import UpCapture
 from src.assessments.down_capture import DownCapture
-from src.assessments.omega_ratio import OmegaRatio
-from src.assessments.skewness import Skewness
+from src.assessments.information_ratio import InformationRatio
+from src.assessments.jensens_alpha import JensensAlpha
 from src.assessments.kurtosis import Kurtosis
-from src.assessments.semi_variance import SemiVariance
-from src.assessments.r_squared import RSquared
 from src.assessments.m2_ratio import M2Ratio
+from src.assessments.max_drawdown import MaxDrawdown
 from src.assessments.mean_return import MeanReturn
-from src.assessments.cumulative_returns import CumulativeReturns
+from src.assessments.omega_ratio import OmegaRatio
+from src.assessments.r_squared import RSquared
+from src.assessments.semi_variance import SemiVariance
+from src.assessments.sharpe_ratio import SharpeRatio
+from src.assessments.skewness import Skewness
+from src.assessments.sortino_ratio import SortinoRatio
+from src.assessments.tracking_error import TrackingError
+from src.assessments.treynor_ratio import TreynorRatio
 from src.assessments.ulcer_index import UlcerIndex
+from src.assessments.up_capture import UpCapture
+from src.assessments.var import VaR
+from src.assessments.volatility import Volatility
 from src.constants import AssessmentName
-from src.dataclasses.assessment_config import AssessmentConfig
-
-
-from logging import Logger, getLogger
-
+from src.dataclasses.assessment_config import (
+    AssessmentConfig,
+    SingleAssessmentConfig,
+)
 from src.dataclasses.assessment_results import AssessmentType, EvaluationResults
 from src.utils.executors import DummyExecutor, RQExecutor
+from src.utils.online_stats import OnlineStats
+from src.utils.result_cache import ResultCache, result_key
+from src.utils.shared_series import SharedConfig, SharedConfigHandle, attach_config
+from src.utils.task_pipeline import TaskPipeline
 
 logger: Logger = getLogger(__name__)
 
 
-ALL_ASSESSMENTS: dict[AssessmentName, Type[BaseAssessment]] = {
+ALL_ASSESSMENTS: dict[AssessmentName, type[BaseAssessment]] = {
     AssessmentName.Beta: Beta,
     AssessmentName.CAGR: CAGR,
     AssessmentName.MaxDrawdown: MaxDrawdown,
@@ -69,12 +78,16 @@ ALL_ASSESSMENTS: dict[AssessmentName, Type[BaseAssessment]] = {
     AssessmentName.RSquared: RSquared,
     AssessmentName.UlcerIndex: UlcerIndex,
     AssessmentName.MeanReturn: MeanReturn,
+    AssessmentName.AnnualizedReturns: AnnualizedReturns,
     AssessmentName.CumulativeReturns: CumulativeReturns,
 }
 
 
 ALL_ASSESSMENT_TYPES: frozenset[AssessmentType] = frozenset({v for v in AssessmentType})
 
+# Default bound on the executor tasks submitted but not yet collected
+MAX_IN_FLIGHT: int = 256
+
 
 class ExecutorType(Enum):
     DEFAULT = DummyExecutor
@@ -90,20 +103,22 @@ class Evaluation:
     config: AssessmentConfig
 
     def __post_init__(self):
-        self._assessments: dict[AssessmentName, Type[BaseAssessment]] = ALL_ASSESSMENTS
+        self._assessments: dict[AssessmentName, type[BaseAssessment]] = ALL_ASSESSMENTS
         self._assessment_types: list[AssessmentType] = list(AssessmentType)
         self._executor: DummyExecutor | ProcessPoolExecutor | RQExecutor = (
             ExecutorType.DEFAULT()
         )
+        self._batched: bool = False
+        self._previous: EvaluationResults | None = None
+        self._cache: ResultCache | None = None
+        self._task_size: int | None = 1
+        self._shared_memory: bool = True
+        self._max_in_flight: int | None = MAX_IN_FLIGHT
 
     def __repr__(self) -> str:
         num_assessments = len(self._assessments)
         num_assessment_types = len(self._assessment_types)
-        num_configs = (
-            len(self.config._returns_list)
-            * len(self.config._rfr_list)
-            * len(self.config._bmk_list)
-        )
+        num_configs = self.config.num_configs
         executor_type = self._executor.__class__.__name__
 
         lines = [
@@ -120,12 +135,10 @@ class Evaluation:
     def _init_assessments(self) -> None:
         """Wrapper func to init the assessments."""
         logger.debug("Initializing assessments.")
-        self._initialized_assessments: dict[AssessmentName, Any] = dict(
-            map(
-                lambda item: (item[0], item[1](config=self.config)),
-                self._assessments.items(),
-            )
-        )
+        self._initialized_assessments: dict[AssessmentName, Any] = {
+            name: assessment(config=self.config)
+            for name, assessment in self._assessments.items()
+        }
 
     def with_assessments(
         self, assessments: Iterable[AssessmentName] | None = None
@@ -174,6 +187,229 @@ class Evaluation:
 
         return self
 
+    def with_batching(self, batched: bool = True) -> Self:
+        """Method to evaluate aligned portfolios together in one pass.
+
+        Configs sharing the same dates, rfr and benchmark are stacked into dates x
+        portfolios DataFrames and each rolling/expanding assessment runs once on
+        all columns. Summaries are still computed per configuration.
+
+        Args:
+            batched (bool, optional): Whether to batch configurations. Defaults to True.
+
+        Returns:
+            Evaluation: Evaluation object with batching enabled or disabled.
+        """
+        logger.info(f"Running with batching={batched}")
+        self._batched = batched
+
+        return self
+
+    def with_previous(self, previous: EvaluationResults | None = None) -> Self:
+        """Method to extend the results of a previous run instead of recomputing them.
+
+        Configurations whose processed series start with the series of ``previous``
+        (same dates and values, with the same parameters) only compute their new
+        points: rolling results from the last windows of context and expanding
+        results and summaries from the running statistics carried by the results.
+        Other configurations, assessments and assessment types run in full. Not
+        supported by RQExecutor, whose results do not come back as series.
+
+        Args:
+            previous (EvaluationResults | None, optional): Results of an earlier run
+                over a shorter history. Defaults to None.
+
+        Returns:
+            Evaluation: Evaluation object extending ``previous``.
+        """
+        logger.info("Running incrementally from previous results")
+        self._previous = previous
+
+        return self
+
+    def with_task_size(self, task_size: int | None = None) -> Self:
+        """Method to submit several assessment runs of a configuration per task.
+
+        Each executor task runs up to ``task_size`` (assessment, type) pairs against
+        a single copy of the configuration, so a worker deserializes the series
+        once per task and its runs share the windowed statistics. This amortises
+        the process or HTTP overhead of small tasks. An evaluation starts with a
+        task size of 1, one run per task.
+
+        Args:
+            task_size (int | None, optional): Runs per task. None submits all runs of
+                a configuration as one task. Defaults to None.
+
+        Returns:
+            Evaluation: Evaluation object with grouped tasks.
+        """
+        if task_size is not None and task_size <= 0:
+            raise ValueError(f"task_size must be positive, got {task_size}")
+
+        logger.info(f"Running with task_size={task_size}")
+        self._task_size = task_size
+
+        return self
+
+    def with_max_in_flight(self, max_in_flight: int | None = MAX_IN_FLIGHT) -> Self:
+        """Method to bound the executor tasks pending at any time.
+
+        Tasks of all configurations are submitted without waiting for earlier
+        configurations to finish. Once ``max_in_flight`` tasks are pending, the
+        oldest is collected before the next is submitted, which bounds the inputs
+        and results held by the executor.
+
+        Args:
+            max_in_flight (int | None, optional): Pending task limit. None submits
+                everything up front. Defaults to MAX_IN_FLIGHT.
+
+        Returns:
+            Evaluation: Evaluation object with the in-flight limit.
+        """
+        if max_in_flight is not None and max_in_flight <= 0:
+            raise ValueError(f"max_in_flight must be positive, got {max_in_flight}")
+
+        logger.info(f"Running with max_in_flight={max_in_flight}")
+        self._max_in_flight = max_in_flight
+
+        return self
+
+    def with_shared_memory(self, shared_memory: bool = True) -> Self:
+        """Method to pass series to ProcessPoolExecutor workers in shared memory.
+
+        The processed series of each configuration are written once to a shared
+        memory block and tasks only carry a handle to it, instead of pickling the
+        config for every task. Enabled by default; other executors are unaffected.
+
+        Args:
+            shared_memory (bool, optional): Whether to share series. Defaults to True.
+
+        Returns:
+            Evaluation: Evaluation object with shared memory enabled or disabled.
+        """
+        logger.info(f"Running with shared_memory={shared_memory}")
+        self._shared_memory = shared_memory
+
+        return self
+
+    def _share(self, config: SingleAssessmentConfig) -> SharedConfig | None:
+        if not (
+            self._shared_memory
+            and isinstance(self._executor, ProcessPoolExecutor)
+            and SharedConfig.supports(config)
+        ):
+            return None
+
+        return SharedConfig(config)
+
+    def _submit_task(
+        self,
+        config: AssessmentConfig,
+        task: list[tuple[AssessmentName, AssessmentType, str | None]],
+        shared: SharedConfig | None = None,
+        inputs: dict[tuple[AssessmentName, AssessmentType], Any] | None = None,
+    ) -> Future:
+        runs: list[tuple[AssessmentName, AssessmentType]] = [
+            (name, assessment_type) for name, assessment_type, _ in task
+        ]
+        if shared is not None:
+            return self._executor.submit(
+                run_shared_assessments, shared.handle, runs, inputs
+            )
+        if isinstance(self._executor, RQExecutor):
+            return self._executor.submit_batch(
+                config,
+                [
+                    (self._assessments[name].name.name, str(assessment_type))
+                    for name, assessment_type in runs
+                ],
+            )
+
+        return self._executor.submit(run_assessments, config, runs, inputs)
+
+    def _submit_pending(
+        self,
+        config: SingleAssessmentConfig,
+        initialized_assessments: dict[AssessmentName, Any],
+        shared: SharedConfig | None,
+        task: list[tuple[AssessmentName, AssessmentType, str | None]],
+        inputs: dict[tuple[AssessmentName, AssessmentType], Any],
+    ) -> Future:
+        """Submit a pending task, a lone run straight to its initialized assessment."""
+        if len(task) > 1 or shared is not None:
+            return self._submit_task(config, task, shared, inputs)
+
+        name, assessment_type, _ = task[0]
+        dependencies = {dep: result for (dep, _), result in inputs.items()}
+        return self._executor.submit(
+            initialized_assessments[name]._run,
+            assessment_type,
+            *((False, dependencies) if dependencies else ()),
+        )
+
+    def with_cache(self, cache: ResultCache | None = None) -> Self:
+        """Method to reuse results of identical earlier runs from a ``ResultCache``.
+
+        Each assessment run is looked up by a content hash of its processed series
+        and parameters before it is computed, and stored afterwards. Runs on an
+        RQExecutor skip it, as their results come back as JSON lists.
+
+        Args:
+            cache (ResultCache | None, optional): Cache to consult. Defaults to None.
+
+        Returns:
+            Evaluation: Evaluation object using the cache.
+        """
+        logger.info("Running with a result cache")
+        self._cache = cache
+
+        return self
+
+    def _cache_key(
+        self,
+        assessment: BaseAssessment,
+        assessment_type: AssessmentType,
+        batched: bool = False,
+        digests: dict[str, bytes] | None = None,
+    ) -> str | None:
+        # RQExecutor results come back as JSON lists rather than pandas objects,
+        # and its workers keep their own cache
+        if self._cache is None or isinstance(self._executor, RQExecutor):
+            return None
+
+        return result_key(
+            assessment.name,
+            assessment_type,
+            assessment.config,
+            batched,
+            inputs=assessment.inputs,
+            digests=digests,
+        )
+
+    @staticmethod
+    def _signature(
+        assessment: BaseAssessment,
+        assessment_type: AssessmentType,
+        digests: dict[str, bytes],
+    ) -> str | None:
+        """Key shared by the runs whose results are equal, from the inputs they read."""
+        return result_key(
+            assessment.name,
+            assessment_type,
+            assessment.config,
+            inputs=assessment.inputs,
+            digests=digests,
+        )
+
+    def _cache_stats(self, before: tuple[int, int]) -> dict[str, int]:
+        if self._cache is None:
+            return {}
+
+        return {
+            "hits": self._cache.hits - before[0],
+            "misses": self._cache.misses - before[1],
+        }
+
     def run(self) -> EvaluationResults:
         """
         Run all configured assessments and return results.
@@ -184,50 +420,647 @@ class Evaluation:
         Returns:
             EvaluationResults: Object containing all assessment results and timing data
         """
+        if self._batched and self._previous is None:
+            return self._run_batched()
+        if self._previous is not None and isinstance(self._executor, RQExecutor):
+            raise ValueError("Incremental evaluation is not supported by RQExecutor")
+
+        previous_configs: dict[str, SingleAssessmentConfig] = (
+            dict(self._previous.config.iter_configs())
+            if self._previous is not None and self._previous.config is not None
+            else {}
+        )
+        online_stats: dict[str, OnlineStats] = {}
+        cache_before: tuple[int, int] = (
+            (self._cache.hits, self._cache.misses) if self._cache else (0, 0)
+        )
+
         results: dict[
             str, dict[AssessmentName | str, dict[AssessmentType, float | pd.Series]]
         ] = {}
         timer: dict[str, dict[AssessmentName | str, dict[AssessmentType, float]]] = {}
+        cache_stats: dict[str, dict[str, int]] = {}
+
+        # Runs reading the same processed inputs give equal results, so each
+        # signature is computed once and copied to the other configurations.
+        deduplicate: bool = (
+            len(self.config._rfr_list) > 1 or len(self.config._bmk_list) > 1
+        )
+        shared_runs = _SharedRuns(results, timer)
+
+        # Config, initialized assessments and shared series of configs with
+        # tasks pending
+        contexts: dict[
+            str,
+            tuple[
+                SingleAssessmentConfig, dict[AssessmentName, Any], SharedConfig | None
+            ],
+        ] = {}
+
+        def collect(config_key: str, task: list, outputs: list[dict] | dict) -> None:
+            self._store_outputs(
+                task,
+                outputs if isinstance(outputs, list) else [outputs],
+                results[config_key],
+                timer[config_key],
+                cache_stats[config_key],
+            )
+            for follower in shared_runs.release(config_key, task):
+                pipeline.unblock(follower)
+
+        def close(config_key: str) -> None:
+            _, _, config_shared = contexts.pop(config_key)
+            if config_shared is not None:
+                config_shared.close()
+
+        pipeline = TaskPipeline(
+            submit=lambda config_key, task, inputs: self._submit_pending(
+                *contexts[config_key], task, inputs
+            ),
+            inputs=lambda config_key, task: self._task_inputs(
+                task, results[config_key]
+            ),
+            collect=collect,
+            done=close,
+            max_in_flight=self._max_in_flight,
+        )
+
+        # Components before the assessments built from them
+        order: list[AssessmentName] = self._dependency_order()
+
+        try:
+            # Iterate over all config combinations
+            for config_key, single_config in self.config.iter_configs():
+                logger.info(f"Running assessments for configuration: {config_key}")
+
+                previous_config = previous_configs.get(config_key)
+                start: int | None = (
+                    _shared_prefix(previous_config, single_config)
+                    if previous_config is not None
+                    else None
+                )
+                if start is not None:
+                    (
+                        results[config_key],
+                        timer[config_key],
+                        cache_stats[config_key],
+                        online_stats[config_key],
+                    ) = self._run_incremental(config_key, single_config, start)
+                    continue
+
+                # Initialize assessments for this specific config
+                initialized_assessments: dict[AssessmentName, Any] = {
+                    name: self._assessments[name](config=single_config)
+                    for name in order
+                }
+
+                config_results = results[config_key] = {}
+                config_timer = timer[config_key] = {}
+                config_cache = cache_stats[config_key] = {"hits": 0, "misses": 0}
+
+                # Digests of the series, hashed once for all keys of the config
+                digests: dict[str, bytes] = {}
+                pending: list[tuple[AssessmentName, AssessmentType, str | None]] = []
+                for name, assessment in initialized_assessments.items():
+                    for assessment_type in self._assessment_types:
+                        signature: str | None = (
+                            self._signature(assessment, assessment_type, digests)
+                            if deduplicate
+                            else None
+                        )
+                        if shared_runs.take(
+                            signature, config_key, name, assessment_type
+                        ):
+                            continue
+
+                        key: str | None = self._cache_key(
+                            assessment, assessment_type, digests=digests
+                        )
+                        cached = self._cache.get(key) if key is not None else None
+                        run = [(name, assessment_type, key)]
+                        if cached is not None:
+                            config_results.setdefault(name, {})[assessment_type] = (
+                                cached
+                            )
+                            config_timer.setdefault(name, {})[assessment_type] = 0.0
+                        elif issubclass(type(self._executor), Executor):
+                            pending.append((name, assessment_type, key))
+                            continue
+                        else:
+                            inputs = self._task_inputs(run, config_results)
+                            self._store_outputs(
+                                run,
+                                [
+                                    assessment._run(
+                                        assessment_type,
+                                        dependencies={
+                                            dep: result
+                                            for (dep, _), result in inputs.items()
+                                        },
+                                    )
+                                ],
+                                config_results,
+                                config_timer,
+                                config_cache,
+                            )
+                        for follower in shared_runs.release(config_key, run):
+                            pipeline.unblock(follower)
+
+                if not pending:
+                    continue
+
+                config_shared: SharedConfig | None = self._share(single_config)
+                contexts[config_key] = (
+                    single_config,
+                    initialized_assessments,
+                    config_shared,
+                )
+
+                if self._task_size == 1 and config_shared is None:
+                    tasks = [[run] for run in pending]
+                else:
+                    size: int = self._task_size or len(pending)
+                    tasks = [
+                        pending[i : i + size] for i in range(0, len(pending), size)
+                    ]
+                pipeline.add(config_key, tasks)
+
+            pipeline.drain()
+        finally:
+            for _, _, config_shared in contexts.values():
+                if config_shared is not None:
+                    config_shared.close()
+
+        # Results in the order of the assessments, whatever order they arrived in
+        for config_key, config_results in results.items():
+            results[config_key] = self._ordered(config_results)
+            timer[config_key] = self._ordered(timer[config_key])
+
+        return EvaluationResults(
+            results=results,
+            timer=timer,
+            config=self.config,
+            cache_stats=cache_stats,
+            online_stats=online_stats,
+            result_cache_stats=self._cache_stats(cache_before),
+        )
+
+    def _store_outputs(
+        self,
+        task: list[tuple[AssessmentName, AssessmentType, str | None]],
+        outputs: list[dict],
+        config_results: dict,
+        config_timer: dict,
+        config_cache: dict[str, int],
+    ) -> None:
+        """Store the ``_run`` outputs of a task, and cache them under their keys."""
+        for (name, assessment_type, key), output in zip(task, outputs):
+            config_results.setdefault(name, {})[assessment_type] = output["result"]
+            config_timer.setdefault(name, {})[assessment_type] = output["time"]
+            config_cache["hits"] += output.get("cache_hits", 0)
+            config_cache["misses"] += output.get("cache_misses", 0)
+            if key is not None:
+                self._cache.put(key, output["result"])
+
+    def _dependency_order(self) -> list[AssessmentName]:
+        """Assessments to run, each after the dependencies it is evaluated with."""
+        sorter: TopologicalSorter = TopologicalSorter(
+            {
+                name: [dep for dep in cls.dependencies if dep in self._assessments]
+                for name, cls in self._assessments.items()
+            }
+        )
+
+        return list(sorter.static_order())
+
+    def _task_inputs(
+        self,
+        task: list[tuple[AssessmentName, AssessmentType, str | None]],
+        config_results: dict,
+    ) -> dict[tuple[AssessmentName, AssessmentType], Any] | None:
+        """Results of other tasks that the runs of ``task`` depend on.
+
+        Returns:
+            Dict of (name, type) to result, or None while some are not computed
+            yet. Empty for RQExecutor, whose jobs compute their own components.
+        """
+        if isinstance(self._executor, RQExecutor):
+            return {}
+
+        in_task: set[tuple[AssessmentName, AssessmentType]] = {
+            (name, assessment_type) for name, assessment_type, _ in task
+        }
+        inputs: dict[tuple[AssessmentName, AssessmentType], Any] = {}
+        for name, assessment_type, _ in task:
+            for dep in self._assessments[name].dependencies:
+                if dep not in self._assessments or (dep, assessment_type) in in_task:
+                    continue
+                if assessment_type not in config_results.get(dep, {}):
+                    return None
+                inputs[(dep, assessment_type)] = config_results[dep][assessment_type]
+
+        return inputs
+
+    def _ordered(self, values: dict) -> dict:
+        return {
+            name: {
+                assessment_type: values[name][assessment_type]
+                for assessment_type in self._assessment_types
+                if assessment_type in values[name]
+            }
+            for name in self._assessments
+            if name in values
+        }
+
+    def _run_incremental(
+        self, config_key: str, config: SingleAssessmentConfig, start: int
+    ) -> tuple[dict, dict, dict[str, int], OnlineStats]:
+        """
+        Extend the previous results of a configuration whose first ``start`` points
+        are unchanged.
+
+        Rolling results are computed on the new points plus two of the longest
+        windows of context, enough for rolling statistics of rolling statistics
+        (Jensen's Alpha averages rolling betas). Expanding results and summaries
+        come from the expanding running statistics of the previous results, which
+        are rebuilt from the shared prefix when missing.
+
+        Returns:
+            Tuple of (results, timer, cache_stats, online_stats) for the configuration
+        """
+        previous_results = self._previous.results.get(config_key, {})
+        length: int = len(config.returns)
+        logger.info(f"Reusing {start} of {length} points for {config_key}")
+
+        series: list[np.ndarray] = [
+            s.to_numpy(dtype=np.float64)
+            for s in (config.returns, config.rfr, config.bmk)
+        ]
+        stats: OnlineStats | None = self._previous.online_stats.get(config_key)
+        if stats is None or stats.count != start:
+            stats = OnlineStats(min_periods=config.min_periods)
+            stats.extend(*(values[:start] for values in series))
+        else:
+            # Keep the previous results usable
+            stats = copy.deepcopy(stats)
+
+        tail_start: int = max(start - 2 * max(config.windows), 0)
+        tail_config = SingleAssessmentConfig(
+            **{
+                **config.kwargs,
+                "returns": config.returns.iloc[tail_start:],
+                "rfr": config.rfr.iloc[tail_start:],
+                "bmk": config.bmk.iloc[tail_start:],
+            }
+        )
+
+        params: dict[str, Any] = {
+            k: v for k, v in config.kwargs.items() if k not in ("returns", "rfr", "bmk")
+        }
+        reused: dict[AssessmentName, list[AssessmentType]] = {
+            name: [
+                t for t in self._assessment_types if t in previous_results.get(name, {})
+            ]
+            for name in self._assessments
+        }
 
-        # Iterate over all config combinations
-        for config_key, single_config in self.config.iter_configs():
-            logger.info(f"Running assessments for configuration: {config_key}")
+        config_results: dict = {}
+        config_timer: dict = {}
+        config_cache: dict[str, int] = {"hits": 0, "misses": 0}
 
-            # Initialize assessments for this specific config
-            initialized_assessments: dict[AssessmentName, Any] = dict(
-                map(
-                    lambda item: (item[0], item[1](config=single_config)),
-                    self._assessments.items(),
+        futures = {}
+        for name, assessment_cls in self._assessments.items():
+            for assessment_type in self._assessment_types:
+                if assessment_type not in reused[name]:
+                    assessment = assessment_cls(config=config)
+                elif assessment_type == AssessmentType.Rolling:
+                    assessment = assessment_cls(config=tail_config)
+                else:
+                    continue
+                future = self._executor.submit(assessment._run, assessment_type)
+                futures[future] = (name, assessment_type)
+
+        # Advance the expanding statistics over the new points
+        expanding: dict[AssessmentName, list[float]] = {
+            name: []
+            for name, types in reused.items()
+            if AssessmentType.Expanding in types
+        }
+        elapsed: dict[AssessmentName, float] = dict.fromkeys(self._assessments, 0.0)
+        for tick in zip(*(values[start:] for values in series)):
+            stats.add(*tick)
+            for name, values in expanding.items():
+                began: float = perf_counter()
+                values.append(
+                    self._assessments[name].online(
+                        stats, AssessmentType.Expanding, **params
+                    )
+                )
+                elapsed[name] += perf_counter() - began
+
+        for name, types in reused.items():
+            for assessment_type in types:
+                previous = previous_results[name][assessment_type]
+                began = perf_counter()
+                if assessment_type == AssessmentType.Summary:
+                    config_results.setdefault(name, {})[assessment_type] = (
+                        self._assessments[name].online(stats, assessment_type, **params)
+                    )
+                elif assessment_type == AssessmentType.Expanding:
+                    config_results.setdefault(name, {})[assessment_type] = pd.concat(
+                        [
+                            previous,
+                            pd.Series(
+                                expanding[name],
+                                index=config.returns.index[start:],
+                                name=previous.name,
+                                dtype=config.dtype,
+                            ),
+                        ]
+                    )
+                else:
+                    continue
+                config_timer.setdefault(name, {})[assessment_type] = elapsed[name] + (
+                    perf_counter() - began
                 )
+
+        for future, (name, assessment_type) in futures.items():
+            output = future.result()
+            result = output["result"]
+            if assessment_type in reused[name]:
+                result = pd.concat(
+                    [
+                        previous_results[name][assessment_type],
+                        result.iloc[len(result) - (length - start) :],
+                    ]
+                )
+            config_results.setdefault(name, {})[assessment_type] = result
+            config_timer.setdefault(name, {})[assessment_type] = output["time"]
+            config_cache["hits"] += output.get("cache_hits", 0)
+            config_cache["misses"] += output.get("cache_misses", 0)
+
+        return config_results, config_timer, config_cache, stats
+
+    def _run_batched(self) -> EvaluationResults:
+        """
+        Run all configured assessments over batches of aligned configurations.
+
+        Rolling and expanding results of a batch are computed column-wise in a single
+        call and split back into one series per config_key. The elapsed time of a
+        batched call is shared equally between its configurations.
+
+        Returns:
+            EvaluationResults: Object containing all assessment results and timing data
+        """
+        if isinstance(self._executor, RQExecutor):
+            raise TypeError("Batched evaluation is not supported by RQExecutor")
+
+        results: dict[
+            str, dict[AssessmentName | str, dict[AssessmentType, float | pd.Series]]
+        ] = {}
+        timer: dict[str, dict[AssessmentName | str, dict[AssessmentType, float]]] = {}
+        cache_stats: dict[str, dict[str, int]] = {}
+        cache_before: tuple[int, int] = (
+            (self._cache.hits, self._cache.misses) if self._cache else (0, 0)
+        )
+
+        for batch_num, (configs, batch_config) in enumerate(self.config.iter_batches()):
+            logger.info(
+                f"Running assessments for batch of {len(configs)} configurations"
             )
 
-            config_results: dict[
-                AssessmentName | str, dict[AssessmentType, float | pd.Series]
-            ] = {}
-            config_timer: dict[AssessmentName | str, dict[AssessmentType, float]] = {}
+            for config_key in configs:
+                results[config_key] = {}
+                timer[config_key] = {}
 
             futures = {}
-            for name, assessment in initialized_assessments.items():
+            for name, assessment_cls in self._assessments.items():
                 for assessment_type in self._assessment_types:
-                    if issubclass(type(self._executor), Executor):
-                        future = self._executor.submit(assessment._run, assessment_type)
-                        futures[future] = (name, assessment_type)
-                    else:
-                        output = assessment._run(assessment_type)
-                        config_results.setdefault(name, {})[assessment_type] = output[
-                            "result"
-                        ]
-                        config_timer.setdefault(name, {})[assessment_type] = output[
-                            "time"
-                        ]
+                    if assessment_type == AssessmentType.Summary:
+                        for config_key, single_config in configs.items():
+                            assessment = assessment_cls(config=single_config)
+                            key = self._cache_key(assessment, assessment_type)
+                            cached = self._cache.get(key) if key is not None else None
+                            if cached is not None:
+                                results[config_key].setdefault(name, {})[
+                                    assessment_type
+                                ] = cached
+                                timer[config_key].setdefault(name, {})[
+                                    assessment_type
+                                ] = 0.0
+                                continue
+                            future = self._executor.submit(
+                                assessment._run, assessment_type
+                            )
+                            futures[future] = (name, assessment_type, config_key, key)
+                        continue
+
+                    # The batch runs unless every one of its columns is cached
+                    keys: dict[str, str | None] = {
+                        config_key: self._cache_key(
+                            assessment_cls(config=single_config),
+                            assessment_type,
+                            batched=True,
+                        )
+                        for config_key, single_config in configs.items()
+                    }
+                    cached_columns = {
+                        config_key: self._cache.get(key)
+                        for config_key, key in keys.items()
+                        if key is not None
+                    }
+                    if len(cached_columns) == len(configs) and all(
+                        column is not None for column in cached_columns.values()
+                    ):
+                        for config_key, column in cached_columns.items():
+                            results[config_key].setdefault(name, {})[
+                                assessment_type
+                            ] = column
+                            timer[config_key].setdefault(name, {})[assessment_type] = (
+                                0.0
+                            )
+                        continue
+
+                    assessment = assessment_cls(config=batch_config)
+                    future = self._executor.submit(assessment._run, assessment_type)
+                    futures[future] = (name, assessment_type, None, keys)
 
-            # Collect results from futures
-            for future, (name, assessment_type) in futures.items():
+            batch_cache: dict[str, int] = {"hits": 0, "misses": 0}
+            for future, (name, assessment_type, config_key, key) in futures.items():
                 output = future.result()
-                config_results.setdefault(name, {})[assessment_type] = output["result"]
-                config_timer.setdefault(name, {})[assessment_type] = output["time"]
+                batch_cache["hits"] += output.get("cache_hits", 0)
+                batch_cache["misses"] += output.get("cache_misses", 0)
+
+                if config_key is not None:
+                    results[config_key].setdefault(name, {})[assessment_type] = output[
+                        "result"
+                    ]
+                    timer[config_key].setdefault(name, {})[assessment_type] = output[
+                        "time"
+                    ]
+                    if key is not None:
+                        self._cache.put(key, output["result"])
+                    continue
+
+                batch_result: pd.DataFrame = output["result"]
+                for column_key in configs:
+                    # Multi-window results are (window, config_key) columns
+                    results[column_key].setdefault(name, {})[assessment_type] = (
+                        batch_result.xs(column_key, axis=1, level="config_key")
+                        if isinstance(batch_result.columns, pd.MultiIndex)
+                        else batch_result[column_key].rename(None)
+                    )
+                    timer[column_key].setdefault(name, {})[assessment_type] = output[
+                        "time"
+                    ] / len(configs)
+                    if key[column_key] is not None:
+                        self._cache.put(
+                            key[column_key], results[column_key][name][assessment_type]
+                        )
+
+            cache_stats[f"batch_{batch_num}"] = batch_cache
+
+        return EvaluationResults(
+            results=results,
+            timer=timer,
+            config=self.config,
+            cache_stats=cache_stats,
+            result_cache_stats=self._cache_stats(cache_before),
+        )
+
+
+def run_assessments(
+    config: AssessmentConfig,
+    runs: list[tuple[AssessmentName, AssessmentType]],
+    inputs: dict[tuple[AssessmentName, AssessmentType], Any] | None = None,
+) -> list[dict]:
+    """Run several assessments on one config, as a single executor task.
+
+    Each run is given the results of its dependencies, from ``inputs`` (results
+    of other tasks, by name and type) or from earlier runs of the same task.
+
+    Returns:
+        List of ``BaseAssessment._run`` outputs, in the order of ``runs``
+    """
+    available: dict[tuple[AssessmentName, AssessmentType], Any] = dict(inputs or {})
+    outputs: list[dict] = []
+    for name, assessment_type in runs:
+        assessment_cls: type[BaseAssessment] = ALL_ASSESSMENTS[name]
+        dependencies: dict[AssessmentName, Any] = {
+            dep: available[(dep, assessment_type)]
+            for dep in assessment_cls.dependencies
+            if (dep, assessment_type) in available
+        }
+        output = assessment_cls(config=config)._run(
+            assessment_type, dependencies=dependencies or None
+        )
+        available[(name, assessment_type)] = output["result"]
+        outputs.append(output)
+
+    return outputs
+
+
+def run_shared_assessments(
+    handle: SharedConfigHandle,
+    runs: list[tuple[AssessmentName, AssessmentType]],
+    inputs: dict[tuple[AssessmentName, AssessmentType], Any] | None = None,
+) -> list[dict]:
+    """Run several assessments on a config held in shared memory, in a worker.
+
+    Returns:
+        List of ``BaseAssessment._run`` outputs, in the order of ``runs``
+    """
+    return run_assessments(attach_config(handle), runs, inputs)
+
+
+def _shared_prefix(
+    previous: SingleAssessmentConfig, config: SingleAssessmentConfig
+) -> int | None:
+    """Number of leading points ``config`` shares with ``previous``, if reusable.
+
+    The processed returns, rfr and benchmark of ``previous`` must all be the first
+    points of those of ``config``, with the same parameters apart from the dates.
+    """
+    for key, value in previous.kwargs.items():
+        if key not in ("returns", "rfr", "bmk", "start", "end") and (
+            config.kwargs[key] != value
+        ):
+            return None
+
+    start: int = len(previous.returns)
+    if start > len(config.returns):
+        return None
+
+    for old, new in zip(
+        (previous.returns, previous.rfr, previous.bmk),
+        (config.returns, config.rfr, config.bmk),
+    ):
+        if not new.iloc[:start].equals(old):
+            return None
+
+    return start
+
+
+class _SharedRuns:
+    """Results of runs with equal input signatures, shared across configurations.
+
+    The first configuration needing a signature computes it, and the others take
+    its result at once or, while it is pending, when it is released.
+    """
+
+    def __init__(self, results: dict, timer: dict) -> None:
+        self._results = results
+        self._timer = timer
+        self._shared: dict[str, Any] = {}
+        self._followers: dict[str, list[str]] = {}
+        self._signatures: dict[tuple[str, AssessmentName, AssessmentType], str] = {}
+
+    def take(
+        self,
+        signature: str | None,
+        config_key: str,
+        name: AssessmentName,
+        assessment_type: AssessmentType,
+    ) -> bool:
+        """Take or wait for the result of ``signature``; False to compute it."""
+        if signature in self._shared:
+            self._store(config_key, name, assessment_type, self._shared[signature])
+            return True
+        if signature in self._followers:
+            self._followers[signature].append(config_key)
+            return True
+        if signature is not None:
+            self._followers[signature] = []
+            self._signatures[(config_key, name, assessment_type)] = signature
+
+        return False
+
+    def release(self, config_key: str, task: list) -> list[str]:
+        """Copy the computed results of ``task`` to the configurations waiting.
+
+        Returns:
+            Keys of the configurations given results
+        """
+        released: list[str] = []
+        for name, assessment_type, _ in task:
+            signature = self._signatures.pop((config_key, name, assessment_type), None)
+            if signature is None:
+                continue
+            result = self._shared[signature] = self._results[config_key][name][
+                assessment_type
+            ]
+            for follower in self._followers.pop(signature):
+                self._store(follower, name, assessment_type, result)
+                released.append(follower)
 
-            results[config_key] = config_results
-            timer[config_key] = config_timer
+        return released
 
-        return EvaluationResults(results=results, timer=timer, config=self.config)
+    def _store(
+        self,
+        config_key: str,
+        name: AssessmentName,
+        assessment_type: AssessmentType,
+        result: Any,
+    ) -> None:
+        self._results[config_key].setdefault(name, {})[assessment_type] = result
+        self._timer[config_key].setdefault(name, {})[assessment_type] = 0.0
@@ -0,0 +1,219 @@
+"""Evaluation kept up to date one new point per series at a time."""
+
+import pickle
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from logging import Logger, getLogger
+from typing import Any, Self
+
+import numpy as np
+
+from src.assessments.base_assessment import BaseAssessment
+from src.constants import AssessmentName
+from src.dataclasses.assessment_config import AssessmentConfig
+from src.dataclasses.assessment_results import AssessmentType
+from src.evaluation import ALL_ASSESSMENTS
+from src.utils.online_stats import OnlineStats
+
+logger: Logger = getLogger(__name__)
+
+_SERIES_KWARGS: tuple[str, ...] = ("returns", "rfr", "bmk")
+
+
+@dataclass
+class _ConfigStream:
+    """Running statistics of one (returns, rfr, bmk) combination."""
+
+    names: tuple[str, str, str]
+    expanding: OnlineStats
+    rolling: dict[int, OnlineStats] = field(default_factory=dict)
+
+    def add(self, returns: float, rfr: float, bmk: float) -> None:
+        self.expanding.add(returns, rfr, bmk)
+        for stats in self.rolling.values():
+            stats.add(returns, rfr, bmk)
+
+    def extend(self, returns: np.ndarray, rfr: np.ndarray, bmk: np.ndarray) -> None:
+        self.expanding.extend(returns, rfr, bmk)
+        for stats in self.rolling.values():
+            stats.extend(returns, rfr, bmk)
+
+
+class StreamingEvaluation:
+    """Evaluation updated with one new return per series instead of re-run.
+
+    The history of ``config`` is replayed once into running statistics for every
+    combination (see ``OnlineStats``). Each ``update`` then appends one tick to
+    every combination and returns the newest summary, rolling and expanding
+    value of each assessment, in the nested layout of ``EvaluationResults.results``,
+    in constant time for most assessments (see ``src.utils.online_stats``).
+
+    The running state can be persisted with ``snapshot`` and resumed with
+    ``restore``; it holds the current windows, not the history.
+    """
+
+    def __init__(self, config: AssessmentConfig) -> None:
+        self._params: dict[str, Any] = {
+            key: value
+            for key, value in config.kwargs.items()
+            if key not in _SERIES_KWARGS
+        }
+        self._multi_window: bool = isinstance(config.window, list)
+        self._assessments: dict[AssessmentName, type[BaseAssessment]] = ALL_ASSESSMENTS
+        self._assessment_types: list[AssessmentType] = list(AssessmentType)
+        self._streams: dict[str, _ConfigStream] = {}
+
+        for config_key, single_config in config.iter_configs():
+            logger.debug(f"Replaying history of {config_key}.")
+            stream: _ConfigStream = self._new_stream(
+                (
+                    single_config.returns.name,
+                    single_config.rfr.name,
+                    single_config.bmk.name,
+                ),
+                config,
+            )
+            stream.extend(
+                single_config.returns.to_numpy(dtype=float),
+                single_config.rfr.to_numpy(dtype=float),
+                single_config.bmk.to_numpy(dtype=float),
+            )
+
+            self._streams[config_key] = stream
+
+    def __repr__(self) -> str:
+        lines = [
+            "StreamingEvaluation(",
+            f"  assessments={len(self._assessments)}",
+            f"  assessment_types={len(self._assessment_types)}",
+            f"  configurations={len(self._streams)}",
+            ")",
+        ]
+        return "\n".join(lines)
+
+    @staticmethod
+    def _new_stream(
+        names: tuple[str, str, str], config: AssessmentConfig
+    ) -> _ConfigStream:
+        return _ConfigStream(
+            names=names,
+            expanding=OnlineStats(min_periods=config.min_periods),
+            rolling={window: OnlineStats(window=window) for window in config.windows},
+        )
+
+    def with_assessments(
+        self, assessments: Iterable[AssessmentName] | None = None
+    ) -> Self:
+        """Method to report only the given assessments from AssessmentName enum.
+
+        Args:
+            assessments (set[AssessmentName] | None, optional): Assessments to report. Defaults to None.
+
+        Returns:
+            StreamingEvaluation: StreamingEvaluation object with filtered assessments.
+        """
+        if not assessments:
+            return self
+
+        self._assessments = {name: ALL_ASSESSMENTS[name] for name in assessments}
+
+        return self
+
+    def with_assessment_types(
+        self, assessment_types: Iterable[AssessmentType] | None = None
+    ) -> Self:
+        """Method to report only the given assessment types from AssessmentType enum.
+
+        Args:
+            assessment_types (set[AssessmentType] | None, optional): Assessment types to report. Defaults to None.
+
+        Returns:
+            StreamingEvaluation: StreamingEvaluation object with filtered assessment types.
+        """
+        if not assessment_types:
+            return self
+
+        self._assessment_types = list(assessment_types)
+
+        return self
+
+    @staticmethod
+    def _pick(value: float | Mapping[str, float], name: str) -> float:
+        if isinstance(value, Mapping):
+            if name not in value:
+                raise KeyError(f"No new value for series {name!r}")
+            return value[name]
+
+        return value
+
+    def update(
+        self,
+        returns: float | Mapping[str, float],
+        rfr: float | Mapping[str, float],
+        bmk: float | Mapping[str, float],
+    ) -> dict[str, dict[AssessmentName, dict[AssessmentType, float | dict]]]:
+        """Append the next tick of every series and return the newest values.
+
+        Args:
+            returns: New return, or a mapping of series name to new return when
+                the config holds several returns series. Likewise for rfr/bmk.
+
+        Returns:
+            Nested dict config_key -> AssessmentName -> AssessmentType -> value,
+            with a dict of window -> value for rolling results of several windows.
+        """
+        for stream in self._streams.values():
+            returns_name, rfr_name, bmk_name = stream.names
+            stream.add(
+                self._pick(returns, returns_name),
+                self._pick(rfr, rfr_name),
+                self._pick(bmk, bmk_name),
+            )
+
+        return self.latest()
+
+    def latest(
+        self,
+    ) -> dict[str, dict[AssessmentName, dict[AssessmentType, float | dict]]]:
+        """Newest values of every assessment, without adding a tick."""
+        results: dict[
+            str, dict[AssessmentName, dict[AssessmentType, float | dict]]
+        ] = {}
+
+        for config_key, stream in self._streams.items():
+            results[config_key] = {}
+            for name, assessment in self._assessments.items():
+                values: dict[AssessmentType, float | dict] = {}
+                for assessment_type in self._assessment_types:
+                    if assessment_type == AssessmentType.Rolling:
+                        rolling: dict[int, float] = {
+                            window: assessment.online(
+                                stats, assessment_type, **self._params
+                            )
+                            for window, stats in stream.rolling.items()
+                        }
+                        values[assessment_type] = (
+                            rolling
+                            if self._multi_window
+                            else next(iter(rolling.values()))
+                        )
+                    else:
+                        values[assessment_type] = assessment.online(
+                            stream.expanding, assessment_type, **self._params
+                        )
+                results[config_key][name] = values
+
+        return results
+
+    def snapshot(self) -> bytes:
+        """Serialized running state, to persist between updates."""
+        return pickle.dumps(self)
+
+    @classmethod
+    def restore(cls, snapshot: bytes) -> Self:
+        """Resume from a ``snapshot``. Only restore snapshots from trusted storage."""
+        evaluation = pickle.loads(snapshot)
+        if not isinstance(evaluation, cls):
+            raise TypeError(f"Snapshot does not hold a {cls.__name__}")
+
+        return evaluation
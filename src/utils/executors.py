@@ -82,9 +82,44 @@ class RQExecutor(Executor):
         assessment = assessment_fn.__self__
         assessment_name = assessment.name.name  # Get the enum name (e.g., "Beta")
 
-        # Serialize config to dict (convert Series to lists for JSON)
+        return self._post(
+            "run",
+            {
+                "assessment_name": assessment_name,
+                "assessment_type": assessment_type,
+                "config": self._serialize_config(assessment.config),
+            },
+        )
+
+    def submit_batch(self, config, tasks: list[tuple[str, str]]) -> APIFuture:
+        """
+        Submit several assessments on the same config as one remote job.
+
+        The config is sent and deserialized once for all of them.
+
+        Args:
+            config: The AssessmentConfig the assessments run on
+            tasks: (assessment enum name, assessment type) pairs, e.g. ("Beta", "summary")
+
+        Returns:
+            APIFuture whose result is the list of outputs, in the order of ``tasks``
+        """
+        return self._post(
+            "run_batch",
+            {
+                "tasks": [
+                    {"assessment_name": name, "assessment_type": assessment_type}
+                    for name, assessment_type in tasks
+                ],
+                "config": self._serialize_config(config),
+            },
+        )
+
+    @staticmethod
+    def _serialize_config(config) -> dict:
+        """Serialize config kwargs to a JSON dict (Series as lists)."""
         config_dict = {}
-        for key, value in assessment.config.kwargs.items():
+        for key, value in config.kwargs.items():
             if hasattr(value, "tolist"):  # pd.Series or np.array
                 config_dict[key] = value.tolist()
             elif isinstance(value, pd.Timestamp):
@@ -92,15 +127,11 @@ class RQExecutor(Executor):
             else:
                 config_dict[key] = value
 
+        return config_dict
+
+    def _post(self, endpoint: str, payload: dict) -> APIFuture:
         # Send request to API
-        resp = requests.post(
-            f"{self.api_url}/run",
-            json={
-                "assessment_name": assessment_name,
-                "assessment_type": assessment_type,
-                "config": config_dict,
-            },
-        )
+        resp = requests.post(f"{self.api_url}/{endpoint}", json=payload)
         resp.raise_for_status()
         job_id = resp.json()["job_id"]
         return APIFuture(job_id, self.api_url, self.poll_interval)
@@ -0,0 +1,683 @@
+"""Online accumulators for streaming evaluation.
+
+``OnlineStats`` follows one (returns, rfr, bmk) stream over a sliding window, or
+over every tick so far, and answers the statistics the assessments need from
+running state instead of the full history:
+
+* compensated running sums of every per-tick quantity (moments, cross
+  products, log growth, gains and losses, capture and downside sums, ...),
+* a two-stack sliding aggregate for the maximum drawdown,
+* a ``SortedWindow`` for VaR and CVaR.
+
+Adding a tick costs O(1) for the sums and drawdowns and O(log w) comparisons
+for the sorted window. CVaR sums the tail of the sorted window, which is a
+fixed small fraction of it, and the rolling Ulcer Index rescans its window of
+log wealth, as its running peak restarts with every window.
+
+Quantities are centered on the first tick seen, which keeps the power sums
+small without knowing the overall mean in advance.
+"""
+
+from collections import deque
+from math import log, log1p
+
+import numpy as np
+
+from src.utils.sorted_window import SortedWindow
+
+# Per-tick quantities. Linear terms and products use the centered values
+# R = r - r0, F = f - f0 and B = b - b0, where (r0, f0, b0) is the first tick.
+_QUANTITIES: tuple[str, ...] = (
+    "returns",
+    "rfr",
+    "bmk",
+    "returns_sq",
+    "bmk_sq",
+    "excess_sq",
+    "active_sq",
+    "returns_bmk",
+    "returns_cube",
+    "returns_quad",
+    "shortfall_sq",
+    "log_growth",
+    "total_losses",
+    "sign_flips",
+    "gains",
+    "losses",
+    "gain_days",
+    "loss_days",
+    "up_days",
+    "up_returns",
+    "up_bmk",
+    "down_days",
+    "down_returns",
+    "down_bmk",
+    "downside",
+    "downside_sq",
+    "downside_days",
+    "changed_returns",
+    "changed_bmk",
+    "changed_excess",
+    "changed_active",
+)
+_INDEX: dict[str, int] = {name: i for i, name in enumerate(_QUANTITIES)}
+
+# Linear series as combinations of the centered inputs
+_LINEAR: dict[str, dict[str, int]] = {
+    "returns": {"returns": 1},
+    "rfr": {"rfr": 1},
+    "bmk": {"bmk": 1},
+    "excess": {"returns": 1, "rfr": -1},
+    "active": {"returns": 1, "bmk": -1},
+    "bmk_excess": {"bmk": 1, "rfr": -1},
+}
+
+
+def _tick_values(
+    tick: tuple[float, float, float],
+    first: tuple[float, float, float],
+    previous: tuple[float, float, float] | None,
+    threshold: float,
+    target: float,
+) -> np.ndarray:
+    """Vector of ``_QUANTITIES`` for one (returns, rfr, bmk) tick."""
+    r, f, b = tick
+    centered_r, centered_f, centered_b = r - first[0], f - first[1], b - first[2]
+    # Total losses have no log growth and returns below -1 flip its sign, so
+    # both are counted and only log|1 + r| is summed
+    excess, active = centered_r - centered_f, centered_r - centered_b
+    shortfall: float = min(r - f, 0.0)
+    gain: float = r - threshold
+    downside: float = min(r - target, 0.0)
+    up, down = b > 0, b < 0
+
+    if previous is None:
+        changed: tuple[bool, ...] = (False, False, False, False)
+    else:
+        p_r, p_f, p_b = previous
+        changed = (r != p_r, b != p_b, r - f != p_r - p_f, r - b != p_r - p_b)
+
+    squared_r: float = centered_r * centered_r
+
+    return np.array(
+        [
+            centered_r,
+            centered_f,
+            centered_b,
+            squared_r,
+            centered_b * centered_b,
+            excess * excess,
+            active * active,
+            centered_r * centered_b,
+            squared_r * centered_r,
+            squared_r * squared_r,
+            shortfall * shortfall,
+            log1p(r) if r > -1 else log(-1 - r) if r < -1 else 0.0,
+            r == -1,
+            r < -1,
+            max(gain, 0.0),
+            max(-gain, 0.0),
+            gain > 0,
+            gain < 0,
+            up,
+            r if up else 0.0,
+            b if up else 0.0,
+            down,
+            r if down else 0.0,
+            b if down else 0.0,
+            downside,
+            downside * downside,
+            r - target < 0,
+            *changed,
+        ],
+        dtype=np.float64,
+    )
+
+
+def _tick_matrix(
+    returns: np.ndarray,
+    rfr: np.ndarray,
+    bmk: np.ndarray,
+    first: tuple[float, float, float],
+    threshold: float,
+    target: float,
+) -> np.ndarray:
+    """``_tick_values`` of consecutive ticks, one row per tick.
+
+    The first row has no previous tick to compare with.
+    """
+    r, f, b = returns, rfr, bmk
+    centered_r, centered_f, centered_b = r - first[0], f - first[1], b - first[2]
+    excess, active = centered_r - centered_f, centered_r - centered_b
+    shortfall: np.ndarray = np.minimum(r - f, 0.0)
+    gain: np.ndarray = r - threshold
+    downside: np.ndarray = np.minimum(r - target, 0.0)
+    up, down = b > 0, b < 0
+
+    changed: list[np.ndarray] = []
+    for values in (r, b, r - f, r - b):
+        change: np.ndarray = np.zeros(len(values))
+        change[1:] = values[1:] != values[:-1]
+        changed.append(change)
+
+    squared_r: np.ndarray = centered_r * centered_r
+
+    return np.column_stack(
+        [
+            centered_r,
+            centered_f,
+            centered_b,
+            squared_r,
+            centered_b * centered_b,
+            excess * excess,
+            active * active,
+            centered_r * centered_b,
+            squared_r * centered_r,
+            squared_r * squared_r,
+            shortfall * shortfall,
+            np.where(
+                r > -1,
+                np.log1p(np.where(r > -1, r, 0.0)),
+                np.log(np.abs(np.where(r == -1, 1.0, 1 + r))),
+            ),
+            r == -1,
+            r < -1,
+            np.maximum(gain, 0.0),
+            np.maximum(-gain, 0.0),
+            gain > 0,
+            gain < 0,
+            up,
+            np.where(up, r, 0.0),
+            np.where(up, b, 0.0),
+            down,
+            np.where(down, r, 0.0),
+            np.where(down, b, 0.0),
+            downside,
+            downside * downside,
+            r - target < 0,
+            *changed,
+        ]
+    ).astype(np.float64)
+
+
+class RunningSums:
+    """Vector of running sums with Neumaier compensation.
+
+    Sliding windows add each value once and subtract it again later, so the
+    compensation keeps the sums from drifting over long streams.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._total: np.ndarray = np.zeros(size)
+        self._compensation: np.ndarray = np.zeros(size)
+
+    def add(self, values: np.ndarray) -> None:
+        total: np.ndarray = self._total + values
+        self._compensation += np.where(
+            np.abs(self._total) >= np.abs(values),
+            (self._total - total) + values,
+            (values - total) + self._total,
+        )
+        self._total = total
+
+    @property
+    def value(self) -> np.ndarray:
+        return self._total + self._compensation
+
+
+def _combine(
+    older: tuple[float, float, float], newer: tuple[float, float, float]
+) -> tuple[float, float, float]:
+    """Join (peak, trough, drawdown) summaries of two adjacent stretches."""
+    return (
+        max(older[0], newer[0]),
+        min(older[1], newer[1]),
+        min(older[2], newer[2], newer[1] - older[0]),
+    )
+
+
+class SlidingDrawdown:
+    """Maximum drawdown of a sliding window of log wealth.
+
+    A two-stack queue over the associative (peak, trough, drawdown) summary:
+    pushing and popping are O(1) amortised and the summary of the whole window
+    is one combination of the two stack aggregates.
+    """
+
+    def __init__(self) -> None:
+        # Oldest point on top, as the summary of itself and the newer points
+        # below it
+        self._front: list[tuple[float, float, float]] = []
+        self._back: list[float] = []
+        self._back_summary: tuple[float, float, float] | None = None
+
+    def __len__(self) -> int:
+        return len(self._front) + len(self._back)
+
+    def push(self, log_wealth: float) -> None:
+        point: tuple[float, float, float] = (log_wealth, log_wealth, 0.0)
+        self._back.append(log_wealth)
+        self._back_summary = (
+            point if self._back_summary is None else _combine(self._back_summary, point)
+        )
+
+    def pop(self) -> None:
+        if not self._front:
+            summary: tuple[float, float, float] | None = None
+            while self._back:
+                value: float = self._back.pop()
+                point = (value, value, 0.0)
+                summary = point if summary is None else _combine(point, summary)
+                self._front.append(summary)
+            self._back_summary = None
+
+        self._front.pop()
+
+    def max_drawdown(self) -> float:
+        """Largest fall in log wealth from a peak inside the window."""
+        if not self._front:
+            return self._back_summary[2] if self._back_summary else np.nan
+        if self._back_summary is None:
+            return self._front[-1][2]
+
+        return _combine(self._front[-1], self._back_summary)[2]
+
+
+class WindowMoments:
+    """Moments of the linear series from the running sums of one window.
+
+    ``count`` is the number of ticks in the window, ``ready`` whether the window
+    is complete (rolling) or holds at least ``min_periods`` ticks (expanding).
+    """
+
+    count: int
+    ready: bool
+
+    def __init__(
+        self,
+        count: int,
+        sums: np.ndarray,
+        shift: np.ndarray,
+        first_changes: np.ndarray | None,
+        ready: bool,
+    ) -> None:
+        self.count = count
+        self.ready = ready
+        self._sums: np.ndarray = sums
+        self._shift: np.ndarray = shift
+        self._first_changes: np.ndarray | None = first_changes
+
+    @property
+    def n(self) -> np.float64:
+        """``count`` as a float, so that empty windows divide to NaN or inf."""
+        return np.float64(self.count)
+
+    def sum(self, name: str) -> np.float64:
+        """Window sum of a per-tick quantity (uncentered ones as is)."""
+        return self._sums[_INDEX[name]]
+
+    def _centered_sum(self, key: str) -> np.float64:
+        return sum(
+            weight * self._sums[_INDEX[name]] for name, weight in _LINEAR[key].items()
+        )
+
+    def mean(self, key: str) -> np.float64:
+        shift: float = sum(
+            weight * self._shift[_INDEX[name]] for name, weight in _LINEAR[key].items()
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self._centered_sum(key) / self.n + shift
+
+    def log_growth(self) -> np.float64:
+        """Sum of ``log(1 + r)``, -inf with a total loss and NaN below -1."""
+        if self.sum("sign_flips") > 0:
+            return np.float64(np.nan)
+        if self.sum("total_losses") > 0:
+            return np.float64(-np.inf)
+
+        return self.sum("log_growth")
+
+    def growth(self, ann_factor: int | None = None) -> np.float64:
+        """Compounded growth ``prod(1 + r) - 1``, annualized with ``ann_factor``.
+
+        As ``window_growth``: -1 with a total loss, and a negative product kept
+        (or NaN when annualized) for an odd number of returns below -1.
+        """
+        if self.sum("total_losses") > 0:
+            return np.float64(-1.0)
+
+        exponent: np.float64 = ann_factor / self.n if ann_factor else np.float64(1.0)
+        if self.sum("sign_flips") % 2 == 1:
+            with np.errstate(invalid="ignore"):
+                return np.power(-np.exp(self.sum("log_growth")), exponent) - 1
+
+        return np.expm1(self.sum("log_growth") * exponent)
+
+    def _constant(self, key: str) -> bool:
+        """Whether ``key`` holds a single repeated value over the window."""
+        changes: float = self._sums[_INDEX[f"changed_{key}"]]
+        if self._first_changes is not None:
+            # The first tick of a rolling window was compared with a tick
+            # outside of it
+            changes -= self._first_changes[_INDEX[f"changed_{key}"]]
+
+        return changes == 0
+
+    def _comoment(self, total: float, left: float, right: float) -> np.float64:
+        n: np.float64 = self.n
+        if n <= 1:
+            return np.float64(np.nan)
+
+        return (total - left * right / n) / (n - 1)
+
+    def var(self, key: str) -> np.float64:
+        """Sample variance of returns, bmk, excess or active returns."""
+        if self.count > 1 and self._constant(key):
+            return np.float64(0.0)
+
+        centered: np.float64 = self._centered_sum(key)
+        variance: np.float64 = self._comoment(self.sum(f"{key}_sq"), centered, centered)
+
+        return np.maximum(variance, 0.0)
+
+    def std(self, key: str) -> np.float64:
+        return np.sqrt(self.var(key))
+
+    def cov(self) -> np.float64:
+        """Sample covariance of returns and bmk."""
+        if self.count > 1 and (self._constant("returns") or self._constant("bmk")):
+            return np.float64(0.0)
+
+        return self._comoment(
+            self.sum("returns_bmk"),
+            self._centered_sum("returns"),
+            self._centered_sum("bmk"),
+        )
+
+    def corr(self) -> np.float64:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.cov() / (self.std("returns") * self.std("bmk"))
+
+    def beta(self) -> np.float64:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.cov() / self.var("bmk")
+
+    def moments(
+        self,
+    ) -> tuple[np.float64, np.float64, np.float64, np.float64, np.float64]:
+        """Count, mean and biased central moments m2, m3, m4 of returns."""
+        n: np.float64 = self.n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean: np.float64 = self._centered_sum("returns") / n
+            raw2: np.float64 = self.sum("returns_sq") / n
+            raw3: np.float64 = self.sum("returns_cube") / n
+            raw4: np.float64 = self.sum("returns_quad") / n
+
+        if self._constant("returns"):
+            m2 = m3 = m4 = np.float64(0.0)
+        else:
+            mean2: np.float64 = mean * mean
+            m2 = np.maximum(raw2 - mean2, 0.0)
+            m3 = raw3 - 3 * mean * raw2 + 2 * mean2 * mean
+            m4 = raw4 - 4 * mean * raw3 + 6 * mean2 * raw2 - 3 * mean2 * mean2
+
+        return n, mean + self._shift[_INDEX["returns"]], m2, m3, m4
+
+
+class OnlineStats(WindowMoments):
+    """Running statistics of one stream over a sliding or expanding window.
+
+    Args:
+        window: Rolling window length. ``None`` accumulates every tick.
+        min_periods: Ticks needed before an expanding window is ``ready``.
+        threshold: Omega Ratio threshold for the gains and losses.
+        target: Semi-Variance target for the downside deviations.
+    """
+
+    def __init__(
+        self,
+        window: int | None = None,
+        min_periods: int = 1,
+        threshold: float = 0.0,
+        target: float = 0.0,
+    ) -> None:
+        self.window: int | None = window
+        self.min_periods: int = min_periods
+        self.threshold: float = threshold
+        self.target: float = target
+        self.count = 0
+        self.ready = False
+
+        self._running: RunningSums = RunningSums(len(_QUANTITIES))
+        self._sums = self._running.value
+        self._shift = np.zeros(len(_QUANTITIES))
+        self._first_changes = None
+        self._first: tuple[float, float, float] | None = None
+        self._previous: tuple[float, float, float] | None = None
+        self._log_wealth: float = 0.0
+
+        # Jensen's Alpha terms use the beta of the window at their own tick
+        self._alpha: RunningSums = RunningSums(2)
+        self._sorted: SortedWindow = SortedWindow()
+
+        if window is not None:
+            self._ticks: deque[np.ndarray] = deque()
+            self._returns: deque[float] = deque()
+            self._wealth: deque[float] = deque()
+            self._alphas: deque[float] = deque()
+            self._drawdown: SlidingDrawdown = SlidingDrawdown()
+        else:
+            self._wealth_level: np.float64 = np.float64(1.0)
+            self._peak: np.float64 = np.float64(-np.inf)
+            self._max_drawdown: np.float64 = np.float64(np.inf)
+            self._ulcer: RunningSums = RunningSums(1)
+
+        self.lagged: WindowMoments = self._moments()
+
+    def _moments(self) -> WindowMoments:
+        """Frozen copy of the current window moments."""
+        return WindowMoments(
+            self.count, self._sums.copy(), self._shift, self._first_changes, self.ready
+        )
+
+    def _is_ready(self) -> bool:
+        if self.window is not None:
+            return self.count >= self.window
+
+        return self.count >= self.min_periods
+
+    def add(self, returns: float, rfr: float, bmk: float) -> None:
+        """Append one tick, dropping the oldest one from a full rolling window."""
+        tick: tuple[float, float, float] = (float(returns), float(rfr), float(bmk))
+        if self._first is None:
+            self._first = tick
+            self._shift = np.zeros(len(_QUANTITIES))
+            self._shift[:3] = tick
+
+        self.lagged = self._moments()
+
+        values: np.ndarray = _tick_values(
+            tick, self._first, self._previous, self.threshold, self.target
+        )
+        self._previous = tick
+        self._running.add(values)
+        self._sorted.insert(tick[0])
+        if tick[0] > -1:
+            self._log_wealth += log1p(tick[0])
+        self.count += 1
+
+        if self.window is not None:
+            self._ticks.append(values)
+            self._returns.append(tick[0])
+            self._wealth.append(self._log_wealth)
+            self._drawdown.push(self._log_wealth)
+
+            if self.count > self.window:
+                self._running.add(-self._ticks.popleft())
+                self._sorted.remove(self._returns.popleft())
+                self._wealth.popleft()
+                self._drawdown.pop()
+                self.count -= 1
+
+            self._first_changes = self._ticks[0]
+        else:
+            # NaN from a total loss on the first tick, which leaves no peak
+            self._wealth_level *= 1 + tick[0]
+            self._peak = np.maximum(self._peak, self._wealth_level)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self._max_drawdown = np.minimum(
+                    self._max_drawdown, self._wealth_level / self._peak - 1
+                )
+                drawdown: np.float64 = (
+                    (self._wealth_level - self._peak) / self._peak * 100
+                )
+            self._ulcer.add(np.array([drawdown * drawdown]))
+
+        self._sums = self._running.value
+        self.ready = self._is_ready()
+        self._add_alpha(tick)
+
+    def extend(self, returns: np.ndarray, rfr: np.ndarray, bmk: np.ndarray) -> None:
+        """Append consecutive ticks, as ``add`` of each of them would.
+
+        An empty expanding window takes all but the last tick at once from
+        vectorised sums. An empty rolling window only replays the ticks that its
+        last window, and the betas of the Jensen's Alpha terms in it, reach.
+        """
+        returns, rfr, bmk = (
+            np.asarray(values, dtype=np.float64) for values in (returns, rfr, bmk)
+        )
+        if self._first is None and len(returns) > 1:
+            if self.window is None:
+                self._seed(returns[:-1], rfr[:-1], bmk[:-1])
+                start: int = len(returns) - 1
+            else:
+                start = max(len(returns) - (2 * self.window - 1), 0)
+            returns, rfr, bmk = returns[start:], rfr[start:], bmk[start:]
+
+        for tick in zip(returns.tolist(), rfr.tolist(), bmk.tolist()):
+            self.add(*tick)
+
+    def _seed(self, returns: np.ndarray, rfr: np.ndarray, bmk: np.ndarray) -> None:
+        """Fill an empty expanding window with the ticks of whole arrays."""
+        self._first = (float(returns[0]), float(rfr[0]), float(bmk[0]))
+        self._shift = np.zeros(len(_QUANTITIES))
+        self._shift[:3] = self._first
+        self._previous = (float(returns[-1]), float(rfr[-1]), float(bmk[-1]))
+
+        values: np.ndarray = _tick_matrix(
+            returns, rfr, bmk, self._first, self.threshold, self.target
+        )
+        self._running.add(values.sum(axis=0))
+        self._sums = self._running.value
+        self._sorted.extend(returns.tolist())
+        self._log_wealth = float(values[:, _INDEX["log_growth"]].sum())
+        self.count = len(returns)
+        self.ready = self._is_ready()
+
+        wealth: np.ndarray = np.cumprod(1 + returns)
+        peak: np.ndarray = np.maximum.accumulate(wealth)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown: np.ndarray = (wealth - peak) / peak * 100
+            self._max_drawdown = np.min(wealth / peak - 1)
+        self._wealth_level = wealth[-1]
+        self._peak = peak[-1]
+        self._ulcer.add(np.array([np.sum(drawdown * drawdown)]))
+
+        # Expanding betas at every tick, as ``beta`` computes them
+        n: np.ndarray = np.arange(1, len(returns) + 1, dtype=np.float64)
+        sums: dict[str, np.ndarray] = {
+            name: np.cumsum(values[:, _INDEX[name]])
+            for name in (
+                "returns",
+                "bmk",
+                "returns_bmk",
+                "bmk_sq",
+                "changed_returns",
+                "changed_bmk",
+            )
+        }
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov: np.ndarray = (
+                sums["returns_bmk"] - sums["returns"] * sums["bmk"] / n
+            ) / (n - 1)
+            var: np.ndarray = np.maximum(
+                (sums["bmk_sq"] - sums["bmk"] * sums["bmk"] / n) / (n - 1), 0.0
+            )
+            constant_bmk: np.ndarray = (n > 1) & (sums["changed_bmk"] == 0)
+            constant: np.ndarray = constant_bmk | (n > 1) & (
+                sums["changed_returns"] == 0
+            )
+            cov = np.where(n > 1, np.where(constant, 0.0, cov), np.nan)
+            var = np.where(n > 1, np.where(constant_bmk, 0.0, var), np.nan)
+            beta: np.ndarray = np.where(n >= self.min_periods, cov / var, np.nan)
+
+        alpha: np.ndarray = (returns - rfr) - beta * (bmk - rfr)
+        valid: np.ndarray = ~np.isnan(alpha)
+        self._alpha.add(np.array([alpha[valid].sum(), valid.sum()], dtype=np.float64))
+
+    def _add_alpha(self, tick: tuple[float, float, float]) -> None:
+        r, f, b = tick
+        beta: np.float64 = self.beta() if self.ready else np.float64(np.nan)
+        alpha: float = float((r - f) - beta * (b - f))
+        valid: bool = not np.isnan(alpha)
+        self._alpha.add(np.array([alpha if valid else 0.0, valid]))
+
+        if self.window is not None:
+            self._alphas.append(alpha)
+            if len(self._alphas) > self.window:
+                dropped: float = self._alphas.popleft()
+                if not np.isnan(dropped):
+                    self._alpha.add(np.array([-dropped, -1.0]))
+
+    def alpha_mean(self) -> np.float64:
+        """Mean of ``excess - beta * bmk_excess`` with the beta of each tick.
+
+        Needs a full window of valid terms (rolling) or ``min_periods`` of them
+        (expanding), as the windowed mean of pandas would.
+        """
+        total, valid = self._alpha.value
+        required: int = self.window if self.window is not None else self.min_periods
+        if valid < max(required, 1):
+            return np.float64(np.nan)
+
+        return total / valid
+
+    def _total_loss_in_window(self) -> bool:
+        """Whether the rolling window holds a return of -1 or below."""
+        return self.sum("total_losses") + self.sum("sign_flips") > 0
+
+    def _product_drawdowns(self) -> np.ndarray:
+        """Drawdowns of the rolling window from the products of its returns."""
+        wealth: np.ndarray = np.cumprod(1 + np.fromiter(self._returns, np.float64))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return wealth / np.maximum.accumulate(wealth) - 1
+
+    def max_drawdown(self) -> np.float64:
+        if self.window is None:
+            return np.float64(self._max_drawdown)
+        if self._total_loss_in_window():
+            return np.min(self._product_drawdowns())
+
+        return np.expm1(self._drawdown.max_drawdown())
+
+    def ulcer(self) -> np.float64:
+        """Root mean square of the percentage drawdowns from the running peak."""
+        if self.window is None:
+            return np.sqrt(self._ulcer.value[0] / self.n)
+        if self._total_loss_in_window():
+            return np.sqrt(np.mean((self._product_drawdowns() * 100) ** 2))
+
+        wealth: np.ndarray = np.fromiter(self._wealth, dtype=np.float64)
+        drawdown: np.ndarray = np.expm1(wealth - np.maximum.accumulate(wealth)) * 100
+
+        return np.sqrt(np.mean(drawdown**2))
+
+    def quantile(self, q: float) -> float:
+        return self._sorted.quantile(q)
+
+    def tail_mean(self, q: float) -> float:
+        """Mean of the returns at or below the ``q`` quantile."""
+        count, total = self._sorted.tail(self._sorted.quantile(q))
+
+        return total / count if count > 0 else np.nan
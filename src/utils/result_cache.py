@@ -0,0 +1,309 @@
+"""Content-addressed cache of assessment results.
+
+A result is identified by a hash of everything it is computed from: the
+assessment and its type, the processed returns, rfr and benchmark (values,
+index and names), the remaining config parameters and the code computing it.
+Equal inputs therefore share results across evaluations, notebooks, API calls
+and processes, and any change of the inputs or of the code is a different key.
+
+``ResultCache`` keeps a bounded in-memory LRU tier in front of an optional
+on-disk tier, a directory of pickled results trimmed to a size budget by
+evicting the least recently used files.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from contextlib import suppress
+from enum import Enum
+from functools import cache
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.dataclasses.assessment_config import AssessmentConfig
+
+logger: Logger = getLogger(__name__)
+
+# Part of every key, with the digest of the code; bump when results change
+# for another reason, such as a new format of the cached values
+CACHE_VERSION: int = 1
+
+# Packages whose sources compute the results
+_CODE_ROOT: Path = Path(__file__).resolve().parents[1]
+_CODE_PACKAGES: tuple[str, ...] = ("assessments", "dataclasses", "utils")
+
+_SERIES_KWARGS: tuple[str, ...] = ("returns", "rfr", "bmk")
+
+# Date filters are already applied to the processed series that are hashed
+_UNHASHED_KWARGS: tuple[str, ...] = (*_SERIES_KWARGS, "start", "end")
+
+
+def _series_digest(series: pd.Series | pd.DataFrame) -> bytes:
+    rows: bytes = pd.util.hash_pandas_object(series, index=True).to_numpy().tobytes()
+    labels: Any = (
+        list(series.columns) if isinstance(series, pd.DataFrame) else series.name
+    )
+
+    return hashlib.blake2b(
+        rows + repr((labels, str(series.index.dtype))).encode(), digest_size=20
+    ).digest()
+
+
+@cache
+def _code_digest(root: Path = _CODE_ROOT) -> bytes:
+    """Digest of the sources results are computed by, and of numpy and pandas.
+
+    Keys change with any edit of those sources or upgrade of those libraries,
+    so results of older code are never read back.
+    """
+    digest = hashlib.blake2b(
+        repr((np.__version__, pd.__version__)).encode(), digest_size=20
+    )
+    for package in _CODE_PACKAGES:
+        for path in sorted((root / package).rglob("*.py")):
+            digest.update(path.relative_to(root).as_posix().encode())
+            digest.update(path.read_bytes())
+
+    return digest.digest()
+
+
+def _parameter(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def result_key(
+    assessment_name: str,
+    assessment_type: str,
+    config: AssessmentConfig,
+    batched: bool = False,
+    inputs: tuple[str, ...] = _SERIES_KWARGS,
+    digests: dict[str, bytes] | None = None,
+) -> str | None:
+    """Content hash identifying one assessment run on ``config``.
+
+    Args:
+        assessment_name: Name of the assessment.
+        assessment_type: "summary", "rolling" or "expanding".
+        config: Config holding the (processed) returns, rfr and bmk in its kwargs.
+        batched: Whether the result is a column of a batched evaluation, whose
+            results are labelled differently.
+        inputs: Series the assessment reads; the others are not hashed.
+        digests: Digests of the series of ``config``, by name, filled as they are
+            computed so keys of several runs on one config hash each series once.
+
+    Returns:
+        Hex digest, or None for configs with several series combinations.
+    """
+    digests = digests if digests is not None else {}
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(_code_digest())
+    digest.update(
+        repr(
+            (CACHE_VERSION, str(assessment_name), str(assessment_type), batched)
+        ).encode()
+    )
+
+    for key in inputs:
+        if key not in digests:
+            series: pd.Series | pd.DataFrame | None = config.kwargs.get(key)
+            if series is None:
+                return None
+            digests[key] = _series_digest(series)
+        digest.update(digests[key])
+
+    parameters: list[tuple[str, Any]] = sorted(
+        (key, _parameter(value))
+        for key, value in config.kwargs.items()
+        if key not in _UNHASHED_KWARGS
+    )
+    digest.update(repr(parameters).encode())
+
+    return digest.hexdigest()
+
+
+def _copy(value: Any) -> Any:
+    """Pandas results are copied in and out, so callers cannot alter cached ones."""
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return value.copy()
+
+    return value
+
+
+class ResultCache:
+    """Two-tier cache of assessment results keyed by ``result_key``.
+
+    The disk tier unpickles whatever files it finds in ``directory`` (such as
+    ``RESULT_CACHE_DIR`` in the API workers), which runs arbitrary code for a
+    crafted file. Every process able to write to that directory is trusted, so
+    it must only be writable by the services sharing the cache.
+
+    Args:
+        max_entries: Number of results kept in memory.
+        directory: Directory of the on-disk tier. None keeps results in memory only.
+        max_disk_bytes: Size budget of the on-disk tier.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        directory: str | os.PathLike | None = None,
+        max_disk_bytes: int = 1 << 30,
+    ) -> None:
+        if max_entries < 0:
+            raise ValueError(f"max_entries must be non-negative, got {max_entries}")
+        if max_disk_bytes < 0:
+            raise ValueError(
+                f"max_disk_bytes must be non-negative, got {max_disk_bytes}"
+            )
+
+        self.max_entries: int = max_entries
+        self.max_disk_bytes: int = max_disk_bytes
+        self.directory: Path | None = Path(directory) if directory is not None else None
+
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self.memory_hits: int = 0
+        self.disk_hits: int = 0
+        self.misses: int = 0
+
+        self._disk_bytes: int = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(path.stat().st_size for path in self._files())
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counts of both tiers, with their current sizes."""
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def _files(self) -> list[Path]:
+        return list(self.directory.glob("*.pkl")) if self.directory is not None else []
+
+    def _remember(self, key: str, value: Any) -> None:
+        if self.max_entries == 0:
+            return
+
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str | None) -> Any | None:
+        """Cached result for ``key``, or None on a miss."""
+        if key is None:
+            return None
+
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return _copy(self._memory[key])
+
+        value: Any | None = self._read(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.disk_hits += 1
+        self._remember(key, value)
+
+        return _copy(value)
+
+    def put(self, key: str | None, value: Any) -> None:
+        """Store ``value`` under ``key`` in both tiers."""
+        if key is None or value is None:
+            return
+
+        value = _copy(value)
+        self._remember(key, value)
+        self._write(key, value)
+
+    def clear(self) -> None:
+        """Drop every cached result from both tiers."""
+        self._memory.clear()
+        for path in self._files():
+            path.unlink(missing_ok=True)
+        self._disk_bytes = 0
+
+    def _read(self, key: str) -> Any | None:
+        if self.directory is None:
+            return None
+
+        path: Path = self._path(key)
+        try:
+            with path.open("rb") as file:
+                value: Any = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning(f"Dropping unreadable cached result {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Reads count as use for the least-recently-used eviction
+        with suppress(OSError):
+            os.utime(path)
+
+        return value
+
+    def _write(self, key: str, value: Any) -> None:
+        if self.directory is None:
+            return
+
+        data: bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_disk_bytes:
+            return
+
+        path: Path = self._path(key)
+        previous: int = path.stat().st_size if path.exists() else 0
+
+        # Written aside and renamed, so readers never see a partial file
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+        os.replace(temporary, path)
+
+        self._disk_bytes += len(data) - previous
+        if self._disk_bytes > self.max_disk_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently used files until the tier fits its budget."""
+        entries: list[tuple[float, int, Path]] = []
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        total: int = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+        self._disk_bytes = total
@@ -0,0 +1,232 @@
+"""Shared-memory transport of config series to process pool workers.
+
+Submitting an assessment to a ``ProcessPoolExecutor`` pickles its config, so
+the same returns, rfr and benchmark arrays are serialized once per task.
+``SharedConfig`` instead writes the processed series of one config, and their
+common index, into a single ``multiprocessing.shared_memory`` block once.
+Tasks carry only its small picklable ``SharedConfigHandle``.
+
+Workers map the block on the first task of each config and rebuild the config
+around read-only views of it (``attach_config``). The rebuilt config is kept
+for the following tasks, so the windowed statistics of its ``WindowStats``
+are shared by every task the worker runs on that config.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from contextlib import suppress
+from dataclasses import dataclass
+from logging import Logger, getLogger
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Self
+
+import numpy as np
+import pandas as pd
+
+from src.dataclasses.assessment_config import SingleAssessmentConfig
+
+logger: Logger = getLogger(__name__)
+
+_SERIES_KWARGS: tuple[str, ...] = ("returns", "rfr", "bmk")
+
+# Offsets of the arrays in a block are aligned to cache lines
+_ALIGNMENT: int = 64
+
+# Configs a worker keeps mapped; older ones are released first
+MAX_ATTACHED: int = 8
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """Location of one array inside a shared block."""
+
+    offset: int
+    length: int
+    dtype: str
+
+
+@dataclass(frozen=True)
+class SharedConfigHandle:
+    """Picklable reference to the series of a config held in shared memory.
+
+    Args:
+        name: Name of the shared memory block.
+        index: Location of the index values, or the index itself when it cannot
+            be shared (range and object indexes).
+        index_meta: Name, dtype and frequency needed to rebuild a shared index.
+        series: Location and name of the returns, rfr and bmk values.
+        params: Remaining config parameters.
+    """
+
+    name: str
+    index: SharedArray | pd.Index
+    index_meta: tuple[Hashable, str, Any]
+    series: tuple[tuple[str, SharedArray, Hashable], ...]
+    params: dict[str, Any]
+
+
+def _index_values(index: pd.Index) -> np.ndarray | None:
+    """Plain array holding the index, or None if it is not worth sharing."""
+    if isinstance(index, pd.DatetimeIndex):
+        # Integers in the unit of the index, UTC for tz-aware indexes
+        return index.asi8
+    if isinstance(index, pd.RangeIndex) or not isinstance(index.dtype, np.dtype):
+        return None
+    if index.dtype.kind in "iuf":
+        return index.to_numpy()
+
+    return None
+
+
+def _rebuild_index(values: np.ndarray, meta: tuple[Hashable, str, Any]) -> pd.Index:
+    name, dtype, freq = meta
+    dtype = pd.api.types.pandas_dtype(dtype)
+    if dtype.kind != "M":
+        return pd.Index(values, name=name, copy=False)
+
+    tz_aware: bool = isinstance(dtype, pd.DatetimeTZDtype)
+    unit: str = dtype.unit if tz_aware else np.datetime_data(dtype)[0]
+    index = pd.DatetimeIndex(values.view(f"M8[{unit}]"), name=name)
+    if tz_aware:
+        index = index.tz_localize("UTC").tz_convert(dtype.tz)
+
+    return pd.DatetimeIndex(index, freq=freq) if freq is not None else index
+
+
+class SharedConfig:
+    """Owner of the shared memory block holding the series of one config.
+
+    The block lives until ``close``, which must only be called once no task
+    still needs it. Use as a context manager to release it on exit.
+
+    Args:
+        config: Config whose processed series are shared.
+    """
+
+    def __init__(self, config: SingleAssessmentConfig) -> None:
+        index: pd.Index = config.returns.index
+        index_values: np.ndarray | None = _index_values(index)
+
+        arrays: list[np.ndarray] = [
+            np.ascontiguousarray(getattr(config, key)) for key in _SERIES_KWARGS
+        ]
+        if index_values is not None:
+            arrays.append(np.ascontiguousarray(index_values))
+
+        offsets: list[int] = []
+        size: int = 0
+        for values in arrays:
+            offsets.append(size)
+            size += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        self._memory: SharedMemory = SharedMemory(create=True, size=max(size, 1))
+        locations: list[SharedArray] = []
+        for values, offset in zip(arrays, offsets):
+            np.ndarray(
+                values.shape, values.dtype, buffer=self._memory.buf, offset=offset
+            )[:] = values
+            locations.append(SharedArray(offset, len(values), values.dtype.str))
+
+        self.nbytes: int = size
+        self.handle: SharedConfigHandle = SharedConfigHandle(
+            name=self._memory.name,
+            index=locations[3] if index_values is not None else index,
+            index_meta=(index.name, str(index.dtype), getattr(index, "freq", None)),
+            series=tuple(
+                (key, location, getattr(config, key).name)
+                for key, location in zip(_SERIES_KWARGS, locations)
+            ),
+            params={
+                key: value
+                for key, value in config.kwargs.items()
+                if key not in _SERIES_KWARGS
+            },
+        )
+
+    @staticmethod
+    def supports(config: SingleAssessmentConfig) -> bool:
+        """Whether the series of ``config`` are plain numeric arrays on one index."""
+        index: pd.Index = config.returns.index
+        for key in _SERIES_KWARGS:
+            series = getattr(config, key)
+            if not isinstance(series, pd.Series):
+                return False
+            if not isinstance(series.dtype, np.dtype) or series.dtype.kind not in "iuf":
+                return False
+            if series.index is not index and not series.index.equals(index):
+                return False
+
+        return True
+
+    def close(self) -> None:
+        """Release and delete the shared block."""
+        self._memory.close()
+        with suppress(FileNotFoundError):
+            self._memory.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# Blocks mapped by this process, by name, with the config rebuilt on them
+_attached: OrderedDict[str, tuple[SharedMemory, SingleAssessmentConfig]] = OrderedDict()
+
+
+def _view(memory: SharedMemory, location: SharedArray) -> np.ndarray:
+    values: np.ndarray = np.ndarray(
+        (location.length,),
+        np.dtype(location.dtype),
+        buffer=memory.buf,
+        offset=location.offset,
+    )
+    values.flags.writeable = False
+
+    return values
+
+
+def attach_config(handle: SharedConfigHandle) -> SingleAssessmentConfig:
+    """Config rebuilt on read-only views of the shared block of ``handle``.
+
+    Called in the workers. The block is mapped once per process and the
+    config is reused by later tasks on the same handle.
+    """
+    if handle.name in _attached:
+        _attached.move_to_end(handle.name)
+        return _attached[handle.name][1]
+
+    # The owner deletes the block; workers must not on exit
+    memory = SharedMemory(name=handle.name, track=False)
+
+    index: pd.Index = (
+        _rebuild_index(_view(memory, handle.index), handle.index_meta)
+        if isinstance(handle.index, SharedArray)
+        else handle.index
+    )
+    series: dict[str, pd.Series] = {
+        key: pd.Series(_view(memory, location), index=index, name=name, copy=False)
+        for key, location, name in handle.series
+    }
+    config = SingleAssessmentConfig(**handle.params, **series)
+
+    _attached[handle.name] = (memory, config)
+    while len(_attached) > MAX_ATTACHED:
+        _release(next(iter(_attached)))
+
+    return config
+
+
+def _release(name: str) -> None:
+    memory, config = _attached.pop(name)
+    del config
+    # Still exported if a caller kept a view; the mapping then goes with it
+    with suppress(BufferError):
+        memory.close()
+
+
+def detach_all() -> None:
+    """Unmap every block attached by this process."""
+    while _attached:
+        _release(next(iter(_attached)))
@@ -0,0 +1,293 @@
+"""Sliding sorted windows for rolling and expanding order statistics.
+
+``SortedWindow`` keeps the values of a window in sorted order, so a rolling
+window is maintained with one insert and one delete per step instead of
+re-sorting every window. ``RankedWindow`` does the same for windows over values
+known in advance, such as expanding windows, without moving any data. VaR and
+CVaR are both read off the same window by ``tail_risk``.
+
+NaNs are kept out of the ordered values and only counted, so a window's
+statistics cover its valid values, as pandas' do.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from math import floor, isnan
+
+import numpy as np
+
+
+def _quantile(n: int, q: float, value_at: Callable[[int], float]) -> float:
+    """Quantile of ``n`` ordered values, ``value_at(k)`` being the k-th smallest.
+
+    Uses linear interpolation, matching ``pd.Series.quantile``.
+    """
+    if n == 0:
+        return float("nan")
+
+    # Same virtual index and lerp as numpy's "linear" method
+    virtual_index: float = n * q + (1 - q) - 1
+    lower: int = min(max(floor(virtual_index), 0), n - 1)
+    upper: int = min(lower + 1, n - 1)
+    gamma: float = virtual_index - floor(virtual_index)
+
+    a: float = value_at(lower)
+    b: float = value_at(upper) if upper != lower else a
+    diff: float = b - a
+    if gamma >= 0.5:
+        return b - diff * (1 - gamma)
+
+    return a + diff * gamma
+
+
+class SortedWindow:
+    """Multiset of floats kept in ascending order.
+
+    Insert and delete locate their position by bisection (O(log w)) and shift
+    the list behind it (a memmove of O(w)), so it suits bounded windows.
+    Quantiles are O(1). The sum of the k smallest values is kept as a running
+    sum, updated as values enter or leave the k smallest, so reading it costs
+    the change of k since the last read.
+    """
+
+    def __init__(self) -> None:
+        self._values: list[float] = []
+        self.nans: int = 0
+        # Sum of the _tail_count smallest values
+        self._tail_count: int = 0
+        self._tail: float = 0.0
+
+    def __len__(self) -> int:
+        """Number of valid (non-NaN) values."""
+        return len(self._values)
+
+    def insert(self, value: float) -> None:
+        if isnan(value):
+            self.nans += 1
+            return
+
+        idx: int = bisect_right(self._values, value)
+        self._values.insert(idx, value)
+        if idx < self._tail_count:
+            # The largest value of the tail moves out of it
+            self._tail += value - self._values[self._tail_count]
+
+    def extend(self, values: list[float]) -> None:
+        """Insert several values with a single sort."""
+        valid: list[float] = [value for value in values if not isnan(value)]
+        self.nans += len(values) - len(valid)
+        self._values = sorted(self._values + valid)
+        self._tail_count, self._tail = 0, 0.0
+
+    def remove(self, value: float) -> None:
+        if isnan(value):
+            if not self.nans:
+                raise ValueError(f"{value} is not in the window")
+            self.nans -= 1
+            return
+
+        idx: int = bisect_right(self._values, value) - 1
+        if idx < 0 or self._values[idx] != value:
+            raise ValueError(f"{value} is not in the window")
+
+        del self._values[idx]
+        if idx < self._tail_count:
+            self._tail -= value
+            if self._tail_count <= len(self._values):
+                # The next value moves into the tail
+                self._tail += self._values[self._tail_count - 1]
+            else:
+                self._tail_count -= 1
+
+    def quantile(self, q: float) -> float:
+        """Quantile with linear interpolation, matching ``pd.Series.quantile``."""
+        return _quantile(len(self._values), q, self._values.__getitem__)
+
+    def count_le(self, value: float) -> int:
+        """Number of values less than or equal to ``value``."""
+        return bisect_right(self._values, value)
+
+    def tail_sum(self, count: int) -> float:
+        """Sum of the ``count`` smallest values."""
+        while self._tail_count < count:
+            self._tail += self._values[self._tail_count]
+            self._tail_count += 1
+        while self._tail_count > count:
+            self._tail_count -= 1
+            self._tail -= self._values[self._tail_count]
+        if not self._tail_count:
+            # Drop the rounding error accumulated by the running sum
+            self._tail = 0.0
+
+        return self._tail
+
+    def tail(self, threshold: float) -> tuple[int, float]:
+        """Count and sum of the values less than or equal to ``threshold``."""
+        count: int = self.count_le(threshold)
+
+        return count, self.tail_sum(count)
+
+
+class RankedWindow:
+    """Window over a multiset of floats known in advance.
+
+    Each value has a fixed rank among all of them, and Fenwick trees over the
+    ranks hold the count and sum of the values in the window. Insert, delete,
+    the k-th smallest value and the count and sum of the values up to a
+    threshold are all O(log n), and no data is moved, so windows can grow to
+    the size of the data (expanding windows) at O(n log n) in total.
+
+    Args:
+        values: Every value that may enter the window. NaNs are ignored.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float)
+        self._sorted: list[float] = np.sort(values[~np.isnan(values)]).tolist()
+        size: int = len(self._sorted)
+
+        # Fenwick trees, 1-based, over the ranks of the sorted values
+        self._counts: list[int] = [0] * (size + 1)
+        self._sums: list[float] = [0.0] * (size + 1)
+        self._top: int = 1 << (size.bit_length() - 1) if size else 0
+        # Equal values are interchangeable, so those in the window take the
+        # first ranks of their value
+        self._used: dict[float, int] = {}
+        self._size: int = 0
+        self.nans: int = 0
+
+    def __len__(self) -> int:
+        """Number of valid (non-NaN) values."""
+        return self._size
+
+    def _update(self, rank: int, sign: int) -> None:
+        counts, sums = self._counts, self._sums
+        value: float = self._sorted[rank] * sign
+        i: int = rank + 1
+        while i < len(counts):
+            counts[i] += sign
+            sums[i] += value
+            i += i & -i
+        self._size += sign
+
+    def insert(self, value: float) -> None:
+        if isnan(value):
+            self.nans += 1
+            return
+
+        used: int = self._used.get(value, 0)
+        rank: int = bisect_left(self._sorted, value) + used
+        if rank >= len(self._sorted) or self._sorted[rank] != value:
+            raise ValueError(f"{value} is not among the values of the window")
+
+        self._used[value] = used + 1
+        self._update(rank, 1)
+
+    def remove(self, value: float) -> None:
+        if isnan(value):
+            if not self.nans:
+                raise ValueError(f"{value} is not in the window")
+            self.nans -= 1
+            return
+
+        used: int = self._used.get(value, 0)
+        if not used:
+            raise ValueError(f"{value} is not in the window")
+
+        self._used[value] = used - 1
+        self._update(bisect_left(self._sorted, value) + used - 1, -1)
+
+    def kth(self, k: int) -> float:
+        """The ``k``-th smallest value of the window, from 0."""
+        counts: list[int] = self._counts
+        position: int = 0
+        remaining: int = k + 1
+        bit: int = self._top
+        while bit:
+            following: int = position + bit
+            if following < len(counts) and counts[following] < remaining:
+                position = following
+                remaining -= counts[following]
+            bit >>= 1
+
+        return self._sorted[position]
+
+    def quantile(self, q: float) -> float:
+        """Quantile with linear interpolation, matching ``pd.Series.quantile``."""
+        return _quantile(self._size, q, self.kth)
+
+    def tail(self, threshold: float) -> tuple[int, float]:
+        """Count and sum of the values less than or equal to ``threshold``."""
+        counts, sums = self._counts, self._sums
+        i: int = bisect_right(self._sorted, threshold)
+        count: int = 0
+        total: float = 0.0
+        while i > 0:
+            count += counts[i]
+            total += sums[i]
+            i -= i & -i
+
+        return count, total
+
+
+def tail_risk(
+    values: np.ndarray,
+    confidence_level: float = 0.95,
+    window: int | None = None,
+    min_periods: int = 1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Windowed historical VaR and CVaR from a single sliding window.
+
+    Rolling windows use a ``SortedWindow``, expanding ones a ``RankedWindow``.
+    NaNs are skipped and windows need ``window`` (rolling) or ``min_periods``
+    (expanding) valid values, as in pandas: a rolling window holding a NaN is
+    NaN.
+
+    Args:
+        values: Array of returns, 1-d or 2-d with one series per column.
+        confidence_level: VaR/CVaR confidence level.
+        window: Rolling window length. ``None`` gives expanding windows.
+        min_periods: Minimum observations for an expanding window.
+
+    Returns:
+        Tuple of (var, cvar) arrays aligned with ``values``. CVaR needs at least
+        two observations per window, as in the pandas implementation.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim > 1:
+        columns = [
+            tail_risk(column, confidence_level, window, min_periods)
+            for column in values.T
+        ]
+        return (
+            np.column_stack([var for var, _ in columns]),
+            np.column_stack([cvar for _, cvar in columns]),
+        )
+
+    q: float = 1 - confidence_level
+    required: int = window if window is not None else max(min_periods, 1)
+
+    var: np.ndarray = np.full(len(values), np.nan)
+    cvar: np.ndarray = np.full(len(values), np.nan)
+    sorted_window: SortedWindow | RankedWindow = (
+        SortedWindow() if window is not None else RankedWindow(values)
+    )
+
+    data: list[float] = values.tolist()
+    for i, value in enumerate(data):
+        sorted_window.insert(value)
+        if window is not None and i >= window:
+            sorted_window.remove(data[i - window])
+
+        if len(sorted_window) < required:
+            continue
+
+        threshold: float = sorted_window.quantile(q)
+        var[i] = threshold
+
+        if len(sorted_window) >= 2:
+            count, total = sorted_window.tail(threshold)
+            if count > 0:
+                cvar[i] = total / count
+
+    return var, cvar
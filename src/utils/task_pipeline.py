@@ -0,0 +1,98 @@
+"""Pipelined submission of executor tasks grouped by key.
+
+``TaskPipeline`` submits the tasks of every key (an evaluation's configurations)
+without waiting for earlier ones, and only collects a result, oldest first, once
+``max_in_flight`` tasks are pending. Tasks needing the results of other tasks
+wait until their inputs are available, so components run before the
+assessments built from them.
+"""
+
+from collections import deque
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+
+class TaskPipeline:
+    """Bounded queue of executor tasks, with tasks blocked on their inputs.
+
+    Args:
+        submit: Submits ``(key, task, inputs)`` and returns its future.
+        inputs: Inputs of ``(key, task)``, or None while some are missing.
+        collect: Stores the output of ``(key, task, output)``.
+        done: Called with a key once all of its tasks are collected.
+        max_in_flight: Most tasks pending at once. None for no limit.
+    """
+
+    def __init__(
+        self,
+        submit: Callable[[Hashable, Any, Any], Future],
+        inputs: Callable[[Hashable, Any], Any | None],
+        collect: Callable[[Hashable, Any, Any], None],
+        done: Callable[[Hashable], None] | None = None,
+        max_in_flight: int | None = None,
+    ) -> None:
+        self._submit = submit
+        self._inputs = inputs
+        self._collect = collect
+        self._done = done
+        self._max_in_flight = max_in_flight
+
+        self._in_flight: deque[tuple[Future, Hashable, Any]] = deque()
+        self._ready: deque[tuple[Hashable, Any, Any]] = deque()
+        self._blocked: dict[Hashable, list] = {}
+        self._remaining: dict[Hashable, int] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of submitted tasks not collected yet."""
+        return len(self._in_flight)
+
+    def add(self, key: Hashable, tasks: list) -> None:
+        """Queue the tasks of ``key`` and submit those whose inputs are available."""
+        self._remaining[key] = self._remaining.get(key, 0) + len(tasks)
+        for task in tasks:
+            inputs = self._inputs(key, task)
+            if inputs is None:
+                self._blocked.setdefault(key, []).append(task)
+            else:
+                self._ready.append((key, task, inputs))
+        self._schedule()
+
+    def unblock(self, key: Hashable) -> None:
+        """Queue the blocked tasks of ``key`` whose inputs are now available."""
+        waiting: list = []
+        for task in self._blocked.pop(key, []):
+            inputs = self._inputs(key, task)
+            if inputs is None:
+                waiting.append(task)
+            else:
+                self._ready.append((key, task, inputs))
+        if waiting:
+            self._blocked[key] = waiting
+
+    def drain(self) -> None:
+        """Submit and collect tasks until none is pending."""
+        self._schedule()
+        while self._in_flight:
+            self._collect_oldest()
+            self._schedule()
+
+    def _schedule(self) -> None:
+        while self._ready:
+            if self._max_in_flight and len(self._in_flight) >= self._max_in_flight:
+                self._collect_oldest()
+            else:
+                key, task, inputs = self._ready.popleft()
+                self._in_flight.append((self._submit(key, task, inputs), key, task))
+
+    def _collect_oldest(self) -> None:
+        future, key, task = self._in_flight.popleft()
+        self._collect(key, task, future.result())
+        self.unblock(key)
+
+        self._remaining[key] -= 1
+        if not self._remaining[key]:
+            del self._remaining[key]
+            if self._done is not None:
+                self._done(key)
@@ -0,0 +1,332 @@
+"""Memoised rolling and expanding statistics shared by the assessments of a config.
+
+Many assessments need the same windowed moments (Sharpe and Treynor both use the
+mean excess return, Beta, Treynor and Jensen's Alpha all need the rolling beta,
+R-Squared and Benchmark Correlation the same correlation, ...). ``WindowStats``
+computes each distinct (statistic, series, window) once and serves every later
+request from its cache, counting hits and misses so the saving can be measured.
+
+All statistics of a series are answered from one set of compensated prefix sums
+(of the values, their squares and their cross products with other series), so
+every additional window, rolling or expanding, costs a single subtraction.
+VaR and CVaR of a window are read off the same sorted window by ``tail_risk``.
+
+Statistics are cached as plain arrays. They are returned labelled like the
+input series, or as the cached ndarray itself with ``raw=True`` for the array
+kernels of the assessments. Cached results are shared between callers and must
+be treated as read-only.
+"""
+
+from collections.abc import Callable, Hashable
+from typing import ClassVar
+
+import numpy as np
+import pandas as pd
+
+from src.utils.sorted_window import tail_risk
+from src.utils.windows import PrefixSums, changes_from_prefix, value_changes, wrap_like
+
+
+class WindowStats:
+    """Cache of windowed statistics over the series of one config.
+
+    Series are referred to by key: ``"returns"``, ``"rfr"`` and ``"bmk"`` plus
+    the derived ``"excess"`` (returns - rfr), ``"active"`` (returns - bmk) and
+    ``"bmk_excess"`` (bmk - rfr). A ``window`` of ``None`` means expanding
+    windows with at least ``min_periods`` observations. DataFrames, and 2-d
+    arrays, are handled column-wise. Inputs may also be plain ndarrays, in which
+    case results are never labelled.
+    """
+
+    _DERIVED: ClassVar[dict[str, tuple[str, str]]] = {
+        "excess": ("returns", "rfr"),
+        "active": ("returns", "bmk"),
+        "bmk_excess": ("bmk", "rfr"),
+    }
+
+    def __init__(
+        self,
+        returns: pd.Series | np.ndarray | None = None,
+        rfr: pd.Series | np.ndarray | None = None,
+        bmk: pd.Series | np.ndarray | None = None,
+    ) -> None:
+        self._series: dict[str, pd.Series | np.ndarray | None] = {
+            "returns": returns,
+            "rfr": rfr,
+            "bmk": bmk,
+        }
+        self._cache: dict[Hashable, pd.Series | np.ndarray] = {}
+        self._prefixes: dict[Hashable, np.ndarray | PrefixSums] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __getstate__(self) -> dict:
+        # Ship only the inputs to worker processes, not the filled cache
+        return {
+            **self.__dict__,
+            "_cache": {},
+            "_prefixes": {},
+            "hits": 0,
+            "misses": 0,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"WindowStats(entries={len(self._cache)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def _cached(
+        self,
+        key: Hashable,
+        compute: Callable[[], pd.Series | np.ndarray],
+    ) -> pd.Series | np.ndarray:
+        if key in self._cache:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._cache[key] = compute()
+
+        return self._cache[key]
+
+    def _memo(self, key: Hashable, compute: Callable[[], np.ndarray | PrefixSums]):
+        """Memoise an intermediate array, without counting towards hits/misses."""
+        if key not in self._prefixes:
+            self._prefixes[key] = compute()
+
+        return self._prefixes[key]
+
+    def series(self, key: str) -> pd.Series | np.ndarray:
+        """Input or derived series for ``key``."""
+        if key in self._DERIVED:
+            left, right = self._DERIVED[key]
+            return self._cached(
+                ("series", key), lambda: self.series(left) - self.series(right)
+            )
+
+        series: pd.Series | np.ndarray | None = self._series.get(key)
+        if series is None:
+            raise KeyError(f"No {key} series available")
+
+        return series
+
+    def values(self, key: str) -> np.ndarray:
+        """Contiguous float64 array of the input or derived series for ``key``."""
+        return self._memo(
+            ("values", key),
+            lambda: np.ascontiguousarray(
+                np.asarray(self.series(key), dtype=np.float64)
+            ),
+        )
+
+    def _label(self, values: np.ndarray, key: str, raw: bool) -> pd.Series | np.ndarray:
+        like: pd.Series | np.ndarray = self.series(key)
+        if raw or not isinstance(like, (pd.Series, pd.DataFrame)):
+            return values
+
+        return wrap_like(values, like)
+
+    def _shift(self, key: str) -> np.ndarray:
+        """Overall mean of ``key``, subtracted before summing to limit cancellation."""
+        return self._memo(("shift", key), lambda: self.values(key).mean(axis=0))
+
+    def _centered(self, key: str) -> np.ndarray:
+        return self._memo(
+            ("centered", key), lambda: self.values(key) - self._shift(key)
+        )
+
+    def _sums(self, key: str, other: str | None = None) -> PrefixSums:
+        """Prefix sums of the centered values, their squares or cross products."""
+        if other is None:
+            return self._memo(("sums", key), lambda: PrefixSums(self._centered(key)))
+
+        key, other = sorted((key, other))
+        return self._memo(
+            ("sums", key, other),
+            lambda: PrefixSums(self._centered(key) * self._centered(other)),
+        )
+
+    def _constant(
+        self, key: str, window: int | None = None, min_periods: int = 1
+    ) -> np.ndarray:
+        """Windows in which ``key`` holds a single repeated value."""
+        changed: np.ndarray = self._memo(
+            ("changed", key), lambda: value_changes(self.values(key))
+        )
+        sums: PrefixSums = self._memo(("changes", key), lambda: PrefixSums(changed))
+
+        return changes_from_prefix(changed, sums, window, min_periods) == 0
+
+    def _count(self, key: str, window: int | None, min_periods: int) -> np.ndarray:
+        """Number of observations in each window, NaN before the first one."""
+        values: np.ndarray = self._centered(key)
+        count: np.ndarray = np.full(len(values), np.nan)
+        if window is None:
+            count[:] = np.arange(1, len(values) + 1)
+            count[: max(min_periods - 1, 0)] = np.nan
+        elif window <= len(values):
+            count[window - 1 :] = window
+
+        return count.reshape(-1, *([1] * (values.ndim - 1)))
+
+    def _comoment(
+        self, key: str, other: str, window: int | None, min_periods: int
+    ) -> np.ndarray:
+        """Sample (co)variance of ``key`` and ``other`` over each window."""
+        count: np.ndarray = self._count(key, window, min_periods)
+        left: np.ndarray = self._sums(key).window(window, min_periods)
+        right: np.ndarray = (
+            left if other == key else self._sums(other).window(window, min_periods)
+        )
+        cross: np.ndarray = self._sums(key, other).window(window, min_periods)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            comoment: np.ndarray = (cross - left * right / count) / (count - 1)
+
+        if other == key:
+            comoment = np.maximum(comoment, 0.0)
+
+        # A constant series has no (co)variance, not rounding noise
+        constant: np.ndarray = self._constant(key, window, min_periods)
+        if other != key:
+            constant = constant | self._constant(other, window, min_periods)
+
+        return np.where(count > 1, np.where(constant, 0.0, comoment), np.nan)
+
+    @staticmethod
+    def _window_key(window: int | None, min_periods: int) -> tuple:
+        # min_periods only changes expanding windows
+        return (window, min_periods if window is None else None)
+
+    def _mean(self, key: str, window: int | None, min_periods: int) -> np.ndarray:
+        def compute() -> np.ndarray:
+            total: np.ndarray = self._sums(key).window(window, min_periods)
+            count: np.ndarray = self._count(key, window, min_periods)
+
+            return total / count + self._shift(key)
+
+        return self._cached(
+            ("mean", key, *self._window_key(window, min_periods)), compute
+        )
+
+    def _var(self, key: str, window: int | None, min_periods: int) -> np.ndarray:
+        return self._cached(
+            ("var", key, *self._window_key(window, min_periods)),
+            lambda: self._comoment(key, key, window, min_periods),
+        )
+
+    def _std(self, key: str, window: int | None, min_periods: int) -> np.ndarray:
+        return self._cached(
+            ("std", key, *self._window_key(window, min_periods)),
+            lambda: np.sqrt(self._var(key, window, min_periods)),
+        )
+
+    def _cov(
+        self, key: str, other: str, window: int | None, min_periods: int
+    ) -> np.ndarray:
+        return self._cached(
+            ("cov", key, other, *self._window_key(window, min_periods)),
+            lambda: self._comoment(key, other, window, min_periods),
+        )
+
+    def _corr(
+        self, key: str, other: str, window: int | None, min_periods: int
+    ) -> np.ndarray:
+        def compute() -> np.ndarray:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return self._cov(key, other, window, min_periods) / (
+                    self._std(key, window, min_periods)
+                    * self._std(other, window, min_periods)
+                )
+
+        return self._cached(
+            ("corr", key, other, *self._window_key(window, min_periods)), compute
+        )
+
+    def _beta(self, window: int | None, min_periods: int) -> np.ndarray:
+        def compute() -> np.ndarray:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return self._cov("returns", "bmk", window, min_periods) / self._var(
+                    "bmk", window, min_periods
+                )
+
+        return self._cached(("beta", *self._window_key(window, min_periods)), compute)
+
+    def _tail_risk(
+        self, key: str, confidence_level: float, window: int | None, min_periods: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        return self._cached(
+            (
+                "tail_risk",
+                key,
+                confidence_level,
+                *self._window_key(window, min_periods),
+            ),
+            lambda: tail_risk(self.values(key), confidence_level, window, min_periods),
+        )
+
+    def mean(
+        self,
+        key: str,
+        window: int | None = None,
+        min_periods: int = 1,
+        raw: bool = False,
+    ) -> pd.Series | np.ndarray:
+        return self._label(self._mean(key, window, min_periods), key, raw)
+
+    def var(
+        self,
+        key: str,
+        window: int | None = None,
+        min_periods: int = 1,
+        raw: bool = False,
+    ) -> pd.Series | np.ndarray:
+        return self._label(self._var(key, window, min_periods), key, raw)
+
+    def std(
+        self,
+        key: str,
+        window: int | None = None,
+        min_periods: int = 1,
+        raw: bool = False,
+    ) -> pd.Series | np.ndarray:
+        return self._label(self._std(key, window, min_periods), key, raw)
+
+    def cov(
+        self,
+        key: str,
+        other: str,
+        window: int | None = None,
+        min_periods: int = 1,
+        raw: bool = False,
+    ) -> pd.Series | np.ndarray:
+        return self._label(self._cov(key, other, window, min_periods), key, raw)
+
+    def corr(
+        self,
+        key: str,
+        other: str,
+        window: int | None = None,
+        min_periods: int = 1,
+        raw: bool = False,
+    ) -> pd.Series | np.ndarray:
+        return self._label(self._corr(key, other, window, min_periods), key, raw)
+
+    def beta(
+        self, window: int | None = None, min_periods: int = 1, raw: bool = False
+    ) -> pd.Series | np.ndarray:
+        """Windowed beta of returns against the benchmark."""
+        return self._label(self._beta(window, min_periods), "returns", raw)
+
+    def tail_risk(
+        self,
+        key: str = "returns",
+        confidence_level: float = 0.95,
+        window: int | None = None,
+        min_periods: int = 1,
+        raw: bool = False,
+    ) -> tuple[pd.Series | np.ndarray, pd.Series | np.ndarray]:
+        """Windowed historical VaR and CVaR, read off one sorted window."""
+        var, cvar = self._tail_risk(key, confidence_level, window, min_periods)
+
+        return self._label(var, key, raw), self._label(cvar, key, raw)
@@ -0,0 +1,319 @@
+"""Windowed-sum primitives shared by the rolling and expanding assessments.
+
+Every window is answered from a single prefix-sum array, so a rolling or
+expanding sum costs one subtraction per point instead of a pass over the window.
+All helpers work along axis 0 and therefore accept a single series of shape
+``(n,)`` as well as a panel of shape ``(n, k)``.
+
+Helpers taking ``window`` and ``min_periods`` compute rolling windows of length
+``window``, or expanding windows with at least ``min_periods`` points when
+``window`` is ``None``.
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+
+def prefix_sum(values: np.ndarray) -> np.ndarray:
+    """Cumulative sum of ``values`` with a leading row of zeros.
+
+    ``prefix[j] - prefix[i]`` is the sum of ``values[i:j]``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    prefix: np.ndarray = np.zeros((len(values) + 1, *values.shape[1:]))
+    np.cumsum(values, axis=0, out=prefix[1:])
+
+    return prefix
+
+
+def rolling_from_prefix(prefix: np.ndarray, window: int) -> np.ndarray:
+    """Sums over the trailing ``window`` points, NaN until the first full window."""
+    out: np.ndarray = np.full((len(prefix) - 1, *prefix.shape[1:]), np.nan)
+    if window < len(prefix):
+        out[window - 1 :] = prefix[window:] - prefix[:-window]
+
+    return out
+
+
+def expanding_from_prefix(prefix: np.ndarray, min_periods: int = 1) -> np.ndarray:
+    """Sums over all points so far, NaN until ``min_periods`` points are available."""
+    out: np.ndarray = prefix[1:].copy()
+    out[: max(min_periods - 1, 0)] = np.nan
+
+    return out
+
+
+def window_from_prefix(
+    prefix: np.ndarray, window: int | None = None, min_periods: int = 1
+) -> np.ndarray:
+    """Rolling sums for ``window`` or expanding sums when ``window`` is None."""
+    if window is None:
+        return expanding_from_prefix(prefix, min_periods)
+
+    return rolling_from_prefix(prefix, window)
+
+
+def compensated_prefix_sum(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Prefix sum together with the running sum of its rounding errors.
+
+    ``prefix + compensation`` carries roughly twice the working precision, which
+    keeps differences of large prefixes accurate for short windows. The error
+    of each step of the cumulative sum is recovered exactly with TwoSum.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    prefix: np.ndarray = prefix_sum(values)
+
+    previous: np.ndarray = prefix[:-1]
+    current: np.ndarray = prefix[1:]
+    virtual: np.ndarray = current - previous
+    errors: np.ndarray = (previous - (current - virtual)) + (values - virtual)
+
+    return prefix, prefix_sum(errors)
+
+
+class PrefixSums:
+    """Compensated prefix sums of an array, answering window sums of any length.
+
+    Building the prefix is the only pass over the data, so several windows over
+    the same values share it.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        self.prefix, self.compensation = compensated_prefix_sum(values)
+
+    def __len__(self) -> int:
+        return len(self.prefix) - 1
+
+    def window(self, window: int | None = None, min_periods: int = 1) -> np.ndarray:
+        """Rolling sum for ``window`` or expanding sum when ``window`` is None."""
+        return window_from_prefix(self.prefix, window, min_periods) + (
+            window_from_prefix(self.compensation, window, min_periods)
+        )
+
+
+def window_sum(
+    values: np.ndarray, window: int | None = None, min_periods: int = 1
+) -> np.ndarray:
+    """Rolling sum for ``window`` or expanding sum when ``window`` is None."""
+    return PrefixSums(values).window(window, min_periods)
+
+
+def window_mean(
+    values: np.ndarray, window: int | None = None, min_periods: int = 1
+) -> np.ndarray:
+    """Mean of the non-NaN points of each window, as ``rolling(window).mean()``.
+
+    Rolling windows need all ``window`` points to be valid and expanding
+    windows at least ``min_periods`` valid points; other windows are NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid: np.ndarray = ~np.isnan(values)
+    total: np.ndarray = window_sum(np.where(valid, values, 0.0), window)
+    count: np.ndarray = window_sum(valid, window)
+    required: int = window if window is not None else max(min_periods, 1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(count >= required, total / count, np.nan)
+
+
+def value_changes(values: np.ndarray) -> np.ndarray:
+    """1.0 where a point differs from the previous point, else 0.0."""
+    values = np.asarray(values, dtype=np.float64)
+    changed: np.ndarray = np.zeros(values.shape)
+    changed[1:] = values[1:] != values[:-1]
+
+    return changed
+
+
+def changes_from_prefix(
+    changed: np.ndarray,
+    sums: PrefixSums,
+    window: int | None = None,
+    min_periods: int = 1,
+) -> np.ndarray:
+    """Window counts of ``value_changes`` from their prefix sums ``sums``."""
+    out: np.ndarray = sums.window(window, min_periods)
+    if window is not None and window <= len(changed):
+        # Drop the comparison of each window's first point with its predecessor
+        out[window - 1 :] -= changed[: len(changed) - window + 1]
+
+    return out
+
+
+def window_changes(
+    values: np.ndarray, window: int | None = None, min_periods: int = 1
+) -> np.ndarray:
+    """Number of points in each window that differ from the previous point.
+
+    A window holds a single repeated value exactly when this is zero.
+    """
+    changed: np.ndarray = value_changes(values)
+
+    return changes_from_prefix(changed, PrefixSums(changed), window, min_periods)
+
+
+def window_moments(
+    values: np.ndarray, window: int | None = None, min_periods: int = 1
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Count, mean and biased central moments m2, m3, m4 of each window.
+
+    The moments come from prefix sums of powers of the values, shifted by their
+    overall mean to keep the power sums small and limit cancellation. Windows
+    holding a single repeated value get central moments of exactly zero.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    shift: np.ndarray = values.mean(axis=0) if len(values) else np.float64(0.0)
+    centered: np.ndarray = values - shift
+
+    # Powers by multiplication, which is much cheaper than a generic ``**``
+    squared: np.ndarray = centered * centered
+
+    count: np.ndarray = window_sum(np.ones_like(centered), window, min_periods)
+    mean: np.ndarray = window_sum(centered, window, min_periods) / count
+    raw2: np.ndarray = window_sum(squared, window, min_periods) / count
+    raw3: np.ndarray = window_sum(squared * centered, window, min_periods) / count
+    raw4: np.ndarray = window_sum(squared * squared, window, min_periods) / count
+
+    mean2: np.ndarray = mean * mean
+    m2: np.ndarray = np.maximum(raw2 - mean2, 0.0)
+    m3: np.ndarray = raw3 - 3 * mean * raw2 + 2 * mean2 * mean
+    m4: np.ndarray = raw4 - 4 * mean * raw3 + 6 * mean2 * raw2 - 3 * mean2 * mean2
+
+    constant: np.ndarray = window_changes(values, window, min_periods) == 0
+    m2, m3, m4 = (np.where(constant, 0.0, moment) for moment in (m2, m3, m4))
+
+    return count, mean + shift, m2, m3, m4
+
+
+def _window_log_factors(
+    returns: np.ndarray, window: int | None = None, min_periods: int = 1
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None, np.ndarray | None]:
+    """Windowed sum of ``log|1 + r|`` and counts of the points it cannot cover.
+
+    A total loss (``r == -1``) has no logarithm, a return below -1 flips the
+    sign of the growth and a NaN has neither, so they are counted apart instead
+    of poisoning the prefix sum for every later window.
+
+    Returns:
+        Tuple of (log_abs_growth, count, losses, flips): ``losses`` counts the
+        total losses of each window (NaN where it holds a NaN) and ``flips`` its
+        returns below -1. Both are None when no point needs them.
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    count: np.ndarray = window_sum(np.ones_like(returns), window, min_periods)
+
+    factors: np.ndarray = 1.0 + returns
+    if not (np.isnan(factors).any() or (factors <= 0.0).any()):
+        return window_sum(np.log1p(returns), window, min_periods), count, None, None
+
+    nans: np.ndarray = np.isnan(factors)
+    zeros: np.ndarray = factors == 0.0
+    negatives: np.ndarray = factors < 0.0
+    log_factors: np.ndarray = np.log(np.abs(np.where(nans | zeros, 1.0, factors)))
+
+    losses: np.ndarray = window_sum(zeros, window, min_periods)
+    losses[window_sum(nans, window, min_periods) > 0] = np.nan
+
+    return (
+        window_sum(log_factors, window, min_periods),
+        count,
+        losses,
+        window_sum(negatives, window, min_periods),
+    )
+
+
+def window_log_growth(
+    returns: np.ndarray, window: int | None = None, min_periods: int = 1
+) -> tuple[np.ndarray, np.ndarray]:
+    """Windowed sum of ``log(1 + r)`` and the number of points in each window.
+
+    Compounded growth over any window is ``exp(log_growth) - 1``, so every
+    window costs one subtraction of the same ``log1p`` prefix sum. As for
+    ``np.log1p``, windows holding a total loss (``r == -1``) are ``-inf`` and
+    windows holding a return below -1 or a NaN are NaN.
+    """
+    log_growth, count, losses, flips = _window_log_factors(returns, window, min_periods)
+    if losses is not None:
+        log_growth = np.where(losses > 0, -np.inf, log_growth)
+        log_growth[np.isnan(losses) | (flips > 0)] = np.nan
+
+    return log_growth, count
+
+
+def window_growth(
+    returns: np.ndarray,
+    window: int | None = None,
+    min_periods: int = 1,
+    ann_factor: int | None = None,
+) -> np.ndarray:
+    """Compounded growth ``prod(1 + r) - 1`` of each window, as ``np.prod``.
+
+    With ``ann_factor``, the growth is annualized to
+    ``prod(1 + r) ** (ann_factor / n) - 1`` over the ``n`` points of the window.
+    Windows holding a total loss are -1, and a negative product is kept (or NaN
+    when annualized) instead of being lost to the logarithm.
+    """
+    log_growth, count, losses, flips = _window_log_factors(returns, window, min_periods)
+    exponent: np.ndarray | float = ann_factor / count if ann_factor else 1.0
+    growth: np.ndarray = np.expm1(log_growth * exponent)
+    if losses is None:
+        return growth
+
+    negative: np.ndarray = flips % 2 == 1
+    with np.errstate(invalid="ignore"):
+        flipped: np.ndarray = np.power(-np.exp(log_growth), exponent) - 1.0
+    growth = np.where(negative, flipped, growth)
+    growth[losses > 0] = -1.0
+    growth[np.isnan(losses)] = np.nan
+
+    return growth
+
+
+def valid_log_wealth(returns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Cumulative ``log(1 + r)`` over the points with positive growth.
+
+    Total losses, returns below -1 and NaNs have no logarithm; they are left out
+    of the running sum and flagged, so windows holding them can be answered
+    with ``fill_windows`` while the others keep the log-space path.
+
+    Returns:
+        Tuple of (log_wealth, flagged)
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    flagged: np.ndarray = ~(returns > -1.0)
+
+    return np.cumsum(np.log1p(np.where(flagged, 0.0, returns)), axis=0), flagged
+
+
+def fill_windows(
+    out: np.ndarray,
+    values: np.ndarray,
+    window: int,
+    flagged: np.ndarray,
+    func: Callable[[np.ndarray], float],
+) -> None:
+    """Set ``out`` to ``func`` of each trailing window holding a flagged point.
+
+    For the few windows a vectorised path cannot answer; ``func`` gets the
+    ``window`` points of one column of ``values``.
+    """
+    holding: np.ndarray = rolling_from_prefix(prefix_sum(flagged), window) > 0
+    # A window opening on a total loss has no peak, and is NaN as in pandas
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for position in zip(*np.nonzero(holding)):
+            end: int = position[0]
+            out[position] = func(
+                values[(slice(end - window + 1, end + 1), *position[1:])]
+            )
+
+
+def wrap_like(
+    values: np.ndarray, like: pd.Series | pd.DataFrame
+) -> pd.Series | pd.DataFrame:
+    """Label an array computed from ``like`` with its index and name (or columns)."""
+    if isinstance(like, pd.DataFrame):
+        return pd.DataFrame(values, index=like.index, columns=like.columns)
+
+    return pd.Series(values, index=like.index, name=like.name)
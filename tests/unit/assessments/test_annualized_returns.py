@@ -0,0 +1,67 @@
+"""Tests for Annualized Returns assessment."""
+
+import numpy as np
+import pandas as pd
+
+from src.assessments.annualized_returns import AnnualizedReturns
+from src.assessments.cagr import CAGR
+
+
+def test_annualized_returns_constant_growth():
+    """Test annualized returns with constant growth."""
+    # Returns: 10%, 10%, 10%
+    # ln(1.10) per period, annualized with ann_factor=1
+    returns = pd.Series([0.10, 0.10, 0.10])
+
+    result = AnnualizedReturns._summary(returns=returns, ann_factor=1)
+
+    assert np.isclose(result, np.log(1.10))
+
+
+def test_annualized_returns_zero_returns():
+    """Test annualized returns with zero returns."""
+    returns = pd.Series([0.0, 0.0, 0.0])
+
+    result = AnnualizedReturns._summary(returns=returns)
+
+    assert result == 0.0
+
+
+def test_annualized_returns_consistent_with_cagr():
+    """Test exp(annualized return) - 1 equals CAGR."""
+    returns = pd.Series([0.02, -0.01, 0.03, -0.02, 0.01])
+
+    result = AnnualizedReturns._summary(returns=returns, ann_factor=252)
+    cagr = CAGR._summary(returns=returns, ann_factor=252)
+
+    assert np.isclose(np.expm1(result), cagr)
+
+
+def test_annualized_returns_rolling_matches_window_summary():
+    """Test rolling annualized returns equal the summary of each trailing window."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 100))
+    window = 20
+
+    result = AnnualizedReturns._rolling(returns=returns, window=window)
+
+    expected = [np.nan] * (window - 1) + [
+        AnnualizedReturns._summary(returns=returns.iloc[i - window + 1 : i + 1])
+        for i in range(window - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10)
+
+
+def test_annualized_returns_expanding_matches_prefix_summary():
+    """Test expanding annualized returns equal the summary of each prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 60))
+    min_periods = 5
+
+    result = AnnualizedReturns._expanding(returns=returns, min_periods=min_periods)
+
+    expected = [np.nan] * (min_periods - 1) + [
+        AnnualizedReturns._summary(returns=returns.iloc[: i + 1])
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10)
@@ -0,0 +1,131 @@
+"""Tests for the array kernels and pandas reference path of BaseAssessment."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.assessments import (
+    CAGR,
+    BaseAssessment,
+    CumulativeReturns,
+    MaxDrawdown,
+    SharpeRatio,
+    UlcerIndex,
+    VaR,
+)
+from src.dataclasses.assessment_config import AssessmentConfig
+from src.dataclasses.assessment_results import AssessmentType
+from src.evaluation import ALL_ASSESSMENTS
+
+
+@pytest.fixture
+def config():
+    """Aligned single-series config over two years of business days."""
+    rng = np.random.default_rng(7)
+    index = pd.bdate_range("2020-01-01", periods=504)
+
+    return AssessmentConfig(
+        returns=pd.Series(rng.normal(0.0004, 0.01, 504), index, name="Portfolio"),
+        bmk=pd.Series(rng.normal(0.0003, 0.009, 504), index, name="Benchmark"),
+        rfr=pd.Series(np.full(504, 0.0001), index, name="RFR"),
+        window=[21, 63],
+        min_periods=21,
+    )
+
+
+def assert_same_result(kernel, reference):
+    if isinstance(reference, float):
+        np.testing.assert_allclose(kernel, reference, rtol=1e-9)
+        return
+
+    assert type(kernel) is type(reference)
+    assert kernel.index.equals(reference.index)
+    if isinstance(reference, pd.DataFrame):
+        assert kernel.columns.equals(reference.columns)
+
+    np.testing.assert_allclose(
+        kernel.to_numpy(), reference.to_numpy(), rtol=1e-9, atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("assessment_cls", ALL_ASSESSMENTS.values())
+@pytest.mark.parametrize("assessment_type", list(AssessmentType))
+def test_kernel_matches_reference(config, assessment_cls, assessment_type):
+    """Test every kernel gives the labelled result of the pandas implementation."""
+    assessment = assessment_cls(config=config)
+
+    kernel = getattr(assessment, assessment_type)()
+    reference = getattr(assessment, assessment_type)(reference=True)
+
+    assert_same_result(kernel, reference)
+
+
+@pytest.mark.parametrize(
+    "assessment_cls", [CAGR, CumulativeReturns, MaxDrawdown, UlcerIndex]
+)
+@pytest.mark.parametrize("assessment_type", list(AssessmentType))
+def test_kernel_matches_reference_with_total_loss(
+    config, assessment_cls, assessment_type
+):
+    """Test the compounding kernels agree with pandas around a -100% day."""
+    returns = config.kwargs["returns"].copy()
+    returns.iloc[100] = -1.0
+    lossy = AssessmentConfig(
+        returns=returns,
+        bmk=config.kwargs["bmk"],
+        rfr=config.kwargs["rfr"],
+        window=[21, 63],
+        min_periods=21,
+    )
+    assessment = assessment_cls(config=lossy)
+
+    kernel = getattr(assessment, assessment_type)()
+    reference = getattr(assessment, assessment_type)(reference=True)
+
+    assert_same_result(kernel, reference)
+
+
+def test_kernel_matches_reference_for_batches(config):
+    """Test kernels run on 2-d arrays with one column per config."""
+    returns = config.kwargs["returns"]
+    batch_config = AssessmentConfig(
+        returns=[returns, returns * 0.5],
+        bmk=config.kwargs["bmk"],
+        rfr=config.kwargs["rfr"],
+        window=63,
+    )
+    _, batch = next(batch_config.iter_batches())
+    assessment = SharpeRatio(config=batch)
+
+    assert_same_result(assessment.rolling(), assessment.rolling(reference=True))
+
+
+def test_has_kernel(config, monkeypatch):
+    """Test kernels are detected per assessment type."""
+    assert SharpeRatio(config=config).has_kernel(AssessmentType.Rolling)
+    assert VaR(config=config).has_kernel(AssessmentType.Rolling)
+
+    monkeypatch.setattr(VaR, "_rolling_kernel", BaseAssessment._rolling_kernel)
+    assert VaR(config=config).has_kernel(AssessmentType.Summary)
+    assert not VaR(config=config).has_kernel(AssessmentType.Rolling)
+
+
+def test_misaligned_inputs_use_reference(config, monkeypatch):
+    """Test series that are not on the returns index skip the kernels."""
+    returns = config.kwargs["returns"]
+    misaligned = AssessmentConfig(
+        returns=returns,
+        bmk=config.kwargs["bmk"].iloc[5:],
+        rfr=config.kwargs["rfr"],
+        window=63,
+    )
+
+    def fail(**kwargs):
+        raise AssertionError("kernel used for misaligned inputs")
+
+    monkeypatch.setattr(SharpeRatio, "_rolling_kernel", staticmethod(fail))
+    monkeypatch.setattr(BaseAssessment, "has_kernel", lambda self, _: True)
+
+    result = SharpeRatio(config=misaligned).rolling()
+
+    assert result.index.equals(returns.index)
@@ -55,3 +55,58 @@ def test_cagr_mixed_returns():
     # CAGR should be positive but less than arithmetic mean
     assert result > 0
     assert result < 0.05  # Less than simple average
+
+
+def test_cagr_rolling_matches_window_summary():
+    """Test rolling CAGR equals the summary of each trailing window."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 100))
+    window = 20
+
+    result = CAGR._rolling(returns=returns, window=window, ann_factor=252)
+
+    expected = [np.nan] * (window - 1) + [
+        CAGR._summary(returns=returns.iloc[i - window + 1 : i + 1], ann_factor=252)
+        for i in range(window - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10)
+
+
+def test_cagr_expanding_matches_prefix_summary():
+    """Test expanding CAGR equals the summary of each prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 60))
+    min_periods = 5
+
+    result = CAGR._expanding(returns=returns, min_periods=min_periods, ann_factor=252)
+
+    expected = [np.nan] * (min_periods - 1) + [
+        CAGR._summary(returns=returns.iloc[: i + 1], ann_factor=252)
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10)
+
+
+def test_cagr_kernels_with_total_loss():
+    """Test a -100% day only affects the windows holding it."""
+    rng = np.random.default_rng(2)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 300))
+    returns.iloc[50] = -1.0
+    window = 20
+
+    def summary(x):
+        return CAGR._summary(returns=x, ann_factor=252)
+
+    rolling = CAGR._rolling_kernel(returns.to_numpy(), window=window, ann_factor=252)
+    expanding = CAGR._expanding_kernel(
+        returns.to_numpy(), min_periods=5, ann_factor=252
+    )
+
+    np.testing.assert_allclose(
+        rolling, returns.rolling(window).apply(summary, raw=True), rtol=1e-10
+    )
+    assert np.isnan(rolling).sum() == window - 1
+    np.testing.assert_allclose(
+        expanding, returns.expanding(5).apply(summary, raw=True), rtol=1e-10
+    )
+    assert (expanding[50:] == -1.0).all()
@@ -2,8 +2,12 @@
 
 import numpy as np
 import pandas as pd
+import pytest
 
+from src.assessments.cagr import CAGR
 from src.assessments.calmar_ratio import CalmarRatio
+from src.assessments.max_drawdown import MaxDrawdown
+from src.constants import AssessmentName
 
 
 def test_calmar_ratio_with_drawdown():
@@ -40,3 +44,22 @@ def test_calmar_ratio_all_negative():
 
     # Negative mean return, positive max drawdown, result should be negative
     assert result < 0
+
+
+def test_calmar_ratio_uses_passed_dependencies():
+    """Test Calmar ratio takes its components from dependencies when given."""
+    returns = pd.Series([0.10, -0.15, 0.05])
+
+    result = CalmarRatio._summary(
+        returns=returns,
+        dependencies={AssessmentName.CAGR: 0.3, AssessmentName.MaxDrawdown: -0.15},
+    )
+
+    assert result == pytest.approx(2.0)
+    assert CalmarRatio._summary(
+        returns=returns,
+        dependencies={
+            AssessmentName.CAGR: CAGR._summary(returns=returns),
+            AssessmentName.MaxDrawdown: MaxDrawdown._summary(returns=returns),
+        },
+    ) == CalmarRatio._summary(returns=returns)
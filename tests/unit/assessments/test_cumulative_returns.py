@@ -61,3 +61,56 @@ def test_cumulative_returns_round_trip():
 
     # Should be close to 0
     assert np.isclose(result, 0.0, atol=0.01)
+
+
+def test_cumulative_returns_rolling_matches_window_summary():
+    """Test rolling cumulative returns equal the summary of each trailing window."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 100))
+    window = 20
+
+    result = CumulativeReturns._rolling(returns=returns, window=window)
+
+    expected = [np.nan] * (window - 1) + [
+        CumulativeReturns._summary(returns=returns.iloc[i - window + 1 : i + 1])
+        for i in range(window - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10)
+
+
+def test_cumulative_returns_expanding_matches_prefix_summary():
+    """Test expanding cumulative returns equal the summary of each prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 60))
+    min_periods = 5
+
+    result = CumulativeReturns._expanding(returns=returns, min_periods=min_periods)
+
+    expected = [np.nan] * (min_periods - 1) + [
+        CumulativeReturns._summary(returns=returns.iloc[: i + 1])
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10)
+
+
+def test_cumulative_returns_kernels_with_losses_beyond_total():
+    """Test returns of -100% and below only affect the windows holding them."""
+    rng = np.random.default_rng(2)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 300))
+    returns.iloc[50] = -1.0
+    returns.iloc[150] = -1.5
+    window = 20
+
+    def summary(x):
+        return CumulativeReturns._summary(returns=x)
+
+    rolling = CumulativeReturns._rolling_kernel(returns.to_numpy(), window=window)
+    expanding = CumulativeReturns._expanding_kernel(returns.to_numpy(), min_periods=5)
+
+    np.testing.assert_allclose(
+        rolling, returns.rolling(window).apply(summary, raw=True), rtol=1e-10
+    )
+    assert np.isnan(rolling).sum() == window - 1
+    np.testing.assert_allclose(
+        expanding, returns.expanding(5).apply(summary, raw=True), rtol=1e-10
+    )
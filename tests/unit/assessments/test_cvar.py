@@ -43,3 +43,46 @@ def test_cvar_vs_var():
 
     # CVaR should be <= VaR (more extreme loss)
     assert cvar <= var
+
+
+def test_cvar_rolling_matches_window_summary():
+    """Test rolling CVaR equals the summary of each trailing window."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(np.round(rng.normal(0, 0.01, 120), 3))
+    window = 30
+
+    result = CVaR._rolling(returns=returns, window=window, confidence_level=0.9)
+
+    expected = [np.nan] * (window - 1) + [
+        CVaR._summary(
+            returns=returns.iloc[i - window + 1 : i + 1], confidence_level=0.9
+        )
+        for i in range(window - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-12)
+
+
+def test_cvar_expanding_matches_prefix_summary():
+    """Test expanding CVaR equals the summary of each prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.normal(0, 0.01, 80))
+    min_periods = 5
+
+    result = CVaR._expanding(returns=returns, min_periods=min_periods)
+
+    expected = [np.nan] * (min_periods - 1) + [
+        CVaR._summary(returns=returns.iloc[: i + 1])
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-12)
+
+
+def test_cvar_rolling_with_nan():
+    """Test windows holding a NaN are NaN instead of raising."""
+    returns = pd.Series(np.random.default_rng(5).normal(0, 0.01, 40))
+    returns.iloc[10] = np.nan
+
+    result = CVaR._rolling(returns=returns, window=8)
+
+    assert result.iloc[10:18].isna().all()
+    assert result.iloc[[9, 18]].notna().all()
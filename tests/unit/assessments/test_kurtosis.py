@@ -50,3 +50,33 @@ def test_kurtosis_excess_vs_raw():
 
     # Raw = Excess + 3
     assert np.isclose(raw, excess + 3, rtol=0.01)
+
+
+def test_kurtosis_rolling_matches_scipy():
+    """Test rolling kurtosis matches scipy on every window."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.standard_t(4, 200) * 0.01)
+    window = 20
+
+    result = Kurtosis._rolling(returns=returns, window=window)
+
+    expected = [np.nan] * (window - 1) + [
+        Kurtosis._summary(returns=returns.iloc[i - window + 1 : i + 1])
+        for i in range(window - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-8)
+
+
+def test_kurtosis_expanding_raw_matches_scipy():
+    """Test expanding raw kurtosis matches scipy on every prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.standard_t(4, 100) * 0.01)
+    min_periods = 4
+
+    result = Kurtosis._expanding(returns=returns, min_periods=min_periods, excess=False)
+
+    expected = [np.nan] * (min_periods - 1) + [
+        Kurtosis._summary(returns=returns.iloc[: i + 1], excess=False)
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-8)
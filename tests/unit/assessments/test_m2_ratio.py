@@ -49,3 +49,47 @@ def test_m2_ratio_same_performance():
 
     # M² should be near 0 (same performance)
     assert np.isclose(result, 0, atol=0.1)
+
+
+def test_m2_ratio_rolling_matches_window_summary():
+    """Test rolling M² equals the summary of the window preceding each point."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 80))
+    bmk = pd.Series(rng.normal(0.0003, 0.008, 80))
+    rfr = pd.Series(rng.normal(0.0001, 0.00001, 80))
+    window = 20
+
+    result = M2Ratio._rolling(returns=returns, bmk=bmk, rfr=rfr, window=window)
+
+    expected = [np.nan] * window + [
+        M2Ratio._summary(
+            returns=returns.iloc[i - window : i],
+            bmk=bmk.iloc[i - window : i],
+            rfr=rfr.iloc[i - window : i],
+        )
+        for i in range(window, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-9)
+
+
+def test_m2_ratio_expanding_matches_prefix_summary():
+    """Test expanding M² equals the summary of each prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 50))
+    bmk = pd.Series(rng.normal(0.0003, 0.008, 50))
+    rfr = pd.Series(rng.normal(0.0001, 0.00001, 50))
+    min_periods = 5
+
+    result = M2Ratio._expanding(
+        returns=returns, bmk=bmk, rfr=rfr, min_periods=min_periods
+    )
+
+    expected = [np.nan] * (min_periods - 1) + [
+        M2Ratio._summary(
+            returns=returns.iloc[: i + 1],
+            bmk=bmk.iloc[: i + 1],
+            rfr=rfr.iloc[: i + 1],
+        )
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-9)
@@ -1,5 +1,6 @@
 """Tests for Max Drawdown assessment."""
 
+import numpy as np
 import pandas as pd
 
 from src.assessments.max_drawdown import MaxDrawdown
@@ -54,3 +55,60 @@ def test_max_drawdown_recovery():
 
     # Should capture the peak-to-trough decline
     assert result < 0
+
+
+def test_max_drawdown_rolling_matches_window_summary():
+    """Test rolling max drawdown equals the summary of each trailing window."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.02, 150))
+
+    for window in [1, 7, 25, 150]:
+        result = MaxDrawdown._rolling(returns=returns, window=window)
+
+        expected = [np.nan] * (window - 1) + [
+            MaxDrawdown._summary(returns=returns.iloc[i - window + 1 : i + 1])
+            for i in range(window - 1, len(returns))
+        ]
+        np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10, atol=1e-15)
+
+
+def test_max_drawdown_rolling_window_longer_than_series():
+    """Test rolling max drawdown is all NaN when the window exceeds the data."""
+    returns = pd.Series([0.01, -0.02, 0.03])
+
+    result = MaxDrawdown._rolling(returns=returns, window=5)
+
+    assert result.isna().all()
+
+
+def test_max_drawdown_expanding_matches_prefix_summary():
+    """Test expanding max drawdown equals the summary of each prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.normal(0.0005, 0.02, 60))
+    min_periods = 5
+
+    result = MaxDrawdown._expanding(returns=returns, min_periods=min_periods)
+
+    expected = [np.nan] * (min_periods - 1) + [
+        MaxDrawdown._summary(returns=returns.iloc[: i + 1])
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-12)
+
+
+def test_max_drawdown_rolling_with_total_loss():
+    """Test a -100% day only affects the windows holding it."""
+    rng = np.random.default_rng(2)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 300))
+    returns.iloc[50] = -1.0
+    returns.iloc[150] = -1.5
+    window = 20
+
+    result = MaxDrawdown._rolling_kernel(returns.to_numpy(), window=window)
+
+    expected = returns.rolling(window).apply(MaxDrawdown._summary, raw=True)
+    np.testing.assert_allclose(result, expected, rtol=1e-10)
+    # Only the window opening on the total loss has no peak
+    assert np.isnan(result).sum() == window
+    assert (result[50 : 49 + window] == -1.0).all()
+    assert np.isnan(result[49 + window])
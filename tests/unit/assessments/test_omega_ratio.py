@@ -59,3 +59,45 @@ def test_omega_ratio_nonzero_threshold():
 
     # Should be positive but less than inf
     assert result > 0 and not np.isinf(result)
+
+
+def _window_omega(x, threshold):
+    """Omega Ratio of a single window, computed directly."""
+    excess = x - threshold
+    losses = -excess[excess < 0].sum()
+    return float(excess[excess > 0].sum() / losses) if losses > 0 else np.inf
+
+
+def test_omega_ratio_rolling_matches_window_omega():
+    """Test rolling Omega equals the ratio of each trailing window, incl. inf."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 100))
+    returns.iloc[40:60] = 0.01  # windows without losses
+    window = 10
+
+    result = OmegaRatio._rolling(returns=returns, threshold=0.0, window=window)
+
+    expected = [np.nan] * (window - 1) + [
+        _window_omega(returns.iloc[i - window + 1 : i + 1], 0.0)
+        for i in range(window - 1, len(returns))
+    ]
+    assert np.isinf(result.iloc[55])
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10)
+
+
+def test_omega_ratio_expanding_matches_prefix_omega():
+    """Test expanding Omega equals the ratio of each prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 60))
+    returns.iloc[:3] = 0.02  # leading prefixes without losses
+    min_periods = 2
+
+    result = OmegaRatio._expanding(
+        returns=returns, threshold=0.001, min_periods=min_periods
+    )
+
+    expected = [np.nan] * (min_periods - 1) + [
+        _window_omega(returns.iloc[: i + 1], 0.001)
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10)
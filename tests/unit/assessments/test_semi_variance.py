@@ -1,5 +1,6 @@
 """Tests for Semi-Variance assessment."""
 
+import numpy as np
 import pandas as pd
 
 from src.assessments.semi_variance import SemiVariance
@@ -54,3 +55,45 @@ def test_semi_variance_custom_target():
 
     # Should be positive (1% return is below 2% target)
     assert result > 0
+
+
+def _window_semi_variance(x, target, ann_factor=252):
+    """Annualized variance of the downside deviations of a single window."""
+    downside = x - target
+    downside = downside[downside < 0]
+    return float(downside.var() * ann_factor) if len(downside) > 0 else np.nan
+
+
+def test_semi_variance_rolling_matches_window_semi_variance():
+    """Test rolling semi-variance equals the downside variance of each window."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 100))
+    returns.iloc[40:60] = 0.01  # windows without downside points
+    window = 10
+
+    result = SemiVariance._rolling(
+        returns=returns, target=0.0, window=window, ann_factor=252
+    )
+
+    expected = [np.nan] * (window - 1) + [
+        _window_semi_variance(returns.iloc[i - window + 1 : i + 1], 0.0)
+        for i in range(window - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-9)
+
+
+def test_semi_variance_expanding_matches_prefix_semi_variance():
+    """Test expanding semi-variance equals the downside variance of each prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 60))
+    min_periods = 5
+
+    result = SemiVariance._expanding(
+        returns=returns, target=0.001, min_periods=min_periods, ann_factor=252
+    )
+
+    expected = [np.nan] * (min_periods - 1) + [
+        _window_semi_variance(returns.iloc[: i + 1], 0.001)
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-9)
@@ -45,3 +45,40 @@ def test_sharpe_ratio_negative_excess_returns():
     result = SharpeRatio._summary(returns=returns, rfr=rfr, ann_factor=252)
 
     assert result < 0  # Negative Sharpe ratio
+
+
+def test_sharpe_ratio_rolling_matches_window_summary():
+    """Test rolling Sharpe equals the summary of each trailing window."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 100))
+    returns.iloc[40:60] = 0.0001  # zero excess volatility windows
+    rfr = pd.Series(np.full(100, 0.0001))
+    window = 10
+
+    result = SharpeRatio._rolling(returns=returns, rfr=rfr, window=window)
+
+    expected = [np.nan] * (window - 1) + [
+        SharpeRatio._summary(
+            returns=returns.iloc[i - window + 1 : i + 1],
+            rfr=rfr.iloc[i - window + 1 : i + 1],
+        )
+        for i in range(window - 1, len(returns))
+    ]
+    assert np.isnan(result.iloc[55])
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-8)
+
+
+def test_sharpe_ratio_expanding_matches_prefix_summary():
+    """Test expanding Sharpe equals the summary of each prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 60))
+    rfr = pd.Series(np.full(60, 0.0001))
+    min_periods = 5
+
+    result = SharpeRatio._expanding(returns=returns, rfr=rfr, min_periods=min_periods)
+
+    expected = [np.nan] * (min_periods - 1) + [
+        SharpeRatio._summary(returns=returns.iloc[: i + 1], rfr=rfr.iloc[: i + 1])
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-8)
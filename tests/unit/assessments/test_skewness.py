@@ -49,3 +49,43 @@ def test_skewness_constant():
 
     # Skewness undefined for constant values, should be NaN or 0
     assert np.isnan(result) or result == 0
+
+
+def test_skewness_rolling_matches_scipy():
+    """Test rolling skewness matches scipy on every window."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.standard_t(4, 200) * 0.01)
+    window = 20
+
+    result = Skewness._rolling(returns=returns, window=window)
+
+    expected = [np.nan] * (window - 1) + [
+        Skewness._summary(returns=returns.iloc[i - window + 1 : i + 1])
+        for i in range(window - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-8)
+
+
+def test_skewness_expanding_matches_scipy():
+    """Test expanding skewness matches scipy on every prefix."""
+    rng = np.random.default_rng(1)
+    returns = pd.Series(rng.standard_t(4, 100) * 0.01)
+    min_periods = 3
+
+    result = Skewness._expanding(returns=returns, min_periods=min_periods)
+
+    expected = [np.nan] * (min_periods - 1) + [
+        Skewness._summary(returns=returns.iloc[: i + 1])
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-8)
+
+
+def test_skewness_rolling_constant_window():
+    """Test rolling skewness is NaN for windows of constant returns."""
+    returns = pd.Series([0.01, -0.02, 0.03, 0.001, 0.001, 0.001, 0.001, 0.02])
+
+    result = Skewness._rolling(returns=returns, window=4)
+
+    assert np.isnan(result.iloc[6])
+    assert not np.isnan(result.iloc[7])
@@ -1,7 +1,9 @@
 """Tests for Ulcer Index assessment."""
 
+import numpy as np
 import pandas as pd
 
+from src.assessments import ulcer_index
 from src.assessments.ulcer_index import UlcerIndex
 
 
@@ -50,3 +52,60 @@ def test_ulcer_index_all_negative():
 
     # Should be positive and substantial
     assert result > 0
+
+
+def test_ulcer_index_rolling_matches_window_summary():
+    """Test rolling Ulcer Index equals the summary of each trailing window."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.02, 120))
+    window = 30
+
+    result = UlcerIndex._rolling(returns=returns, window=window)
+
+    expected = [np.nan] * (window - 1) + [
+        UlcerIndex._summary(returns=returns.iloc[i - window + 1 : i + 1])
+        for i in range(window - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-9, atol=1e-12)
+
+
+def test_ulcer_index_rolling_chunks(monkeypatch):
+    """Test rolling Ulcer Index does not depend on the chunk size."""
+    returns = pd.Series(np.random.default_rng(1).normal(0.0, 0.02, 80))
+    expected = UlcerIndex._rolling(returns=returns, window=10)
+
+    monkeypatch.setattr(ulcer_index, "_CHUNK_SIZE", 25)
+    result = UlcerIndex._rolling(returns=returns, window=10)
+
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+
+def test_ulcer_index_expanding_matches_prefix_summary():
+    """Test expanding Ulcer Index equals the summary of each prefix."""
+    rng = np.random.default_rng(2)
+    returns = pd.Series(rng.normal(0.0005, 0.02, 60))
+    min_periods = 5
+
+    result = UlcerIndex._expanding(returns=returns, min_periods=min_periods)
+
+    expected = [np.nan] * (min_periods - 1) + [
+        UlcerIndex._summary(returns=returns.iloc[: i + 1])
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10, atol=1e-12)
+
+
+def test_ulcer_index_rolling_with_total_loss():
+    """Test a -100% day only affects the windows holding it."""
+    rng = np.random.default_rng(2)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 300))
+    returns.iloc[50] = -1.0
+    returns.iloc[150] = -1.5
+    window = 20
+
+    result = ulcer_index._rolling_ulcer(returns.to_numpy(), window)
+
+    expected = returns.rolling(window).apply(UlcerIndex._summary_kernel, raw=True)
+    np.testing.assert_allclose(result, expected, rtol=1e-10)
+    # Only the window opening on the total loss has no peak
+    assert np.isnan(result).sum() == window
@@ -59,3 +59,49 @@ def test_up_capture_no_up_days():
 
     # Should be NaN (no up days to measure)
     assert np.isnan(result)
+
+
+def test_up_capture_rolling_matches_window_summary():
+    """Test rolling up capture equals the summary of each trailing window."""
+    rng = np.random.default_rng(0)
+    bmk = pd.Series(rng.normal(0, 0.01, 60))
+    returns = bmk * 1.2 + pd.Series(rng.normal(0, 0.005, 60))
+    window = 10
+
+    result = UpCapture._rolling(returns=returns, bmk=bmk, window=window)
+
+    expected = [np.nan] * (window - 1) + [
+        UpCapture._summary(
+            returns=returns.iloc[i - window + 1 : i + 1],
+            bmk=bmk.iloc[i - window + 1 : i + 1],
+        )
+        for i in range(window - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-12)
+
+
+def test_up_capture_expanding_matches_prefix_summary():
+    """Test expanding up capture equals the summary of each prefix."""
+    rng = np.random.default_rng(1)
+    bmk = pd.Series(rng.normal(0, 0.01, 40))
+    returns = bmk * 0.8 + pd.Series(rng.normal(0, 0.005, 40))
+    min_periods = 5
+
+    result = UpCapture._expanding(returns=returns, bmk=bmk, min_periods=min_periods)
+
+    expected = [np.nan] * (min_periods - 1) + [
+        UpCapture._summary(returns=returns.iloc[: i + 1], bmk=bmk.iloc[: i + 1])
+        for i in range(min_periods - 1, len(returns))
+    ]
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-12)
+
+
+def test_up_capture_rolling_window_without_up_days():
+    """Test rolling up capture is NaN for windows with no up days."""
+    returns = pd.Series([0.01, 0.02, 0.01, 0.03, -0.01])
+    bmk = pd.Series([-0.01, -0.02, -0.01, -0.02, 0.01])
+
+    result = UpCapture._rolling(returns=returns, bmk=bmk, window=2)
+
+    assert np.isnan(result.iloc[:4]).all()
+    assert not np.isnan(result.iloc[4])
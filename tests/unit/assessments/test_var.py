@@ -3,7 +3,9 @@
 import numpy as np
 import pandas as pd
 
+from src.assessments.cvar import CVaR
 from src.assessments.var import VaR
+from src.utils.window_stats import WindowStats
 
 
 def test_var_simple_case():
@@ -40,3 +42,31 @@ def test_var_different_confidence():
 
     # 99% VaR should be more extreme (more negative) than 95% VaR
     assert var_99 <= var_95
+
+
+def test_var_kernels_match_pandas_quantile():
+    """Test VaR from the sorted window matches the pandas rolling quantile."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0, 0.01, 100))
+
+    rolling = VaR._rolling_kernel(returns.to_numpy(), window=20)
+    expanding = VaR._expanding_kernel(returns.to_numpy(), min_periods=5)
+
+    np.testing.assert_allclose(
+        rolling, VaR._rolling(returns=returns, window=20), rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        expanding, VaR._expanding(returns=returns, min_periods=5), rtol=1e-12
+    )
+
+
+def test_var_and_cvar_share_sorted_window():
+    """Test VaR and CVaR of a config read one tail_risk result."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0, 0.01, 100))
+    stats = WindowStats(returns=returns)
+
+    VaR._rolling_kernel(returns.to_numpy(), window=20, stats=stats)
+    CVaR._rolling_kernel(returns.to_numpy(), window=20, stats=stats)
+
+    assert (stats.misses, stats.hits) == (1, 1)
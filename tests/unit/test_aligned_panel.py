@@ -0,0 +1,301 @@
+"""Tests for the aligned panel and the combinations of config series."""
+
+from itertools import product
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.dataclasses.aligned_panel import AlignedPanel
+from src.dataclasses.assessment_config import AssessmentConfig, OverlapMode
+
+
+@pytest.fixture
+def series():
+    """Create returns, rfr and benchmarks on different, overlapping dates."""
+    rng = np.random.default_rng(3)
+    days = pd.bdate_range("2020-01-01", periods=120)
+
+    returns = [
+        pd.Series(rng.normal(0.0005, 0.01, 120), days, name="Full"),
+        pd.Series(rng.normal(0.0005, 0.01, 90), days[20:110], name="Late"),
+        pd.Series(rng.normal(0.0005, 0.01, 100), days[:100], name="Gappy").drop(
+            days[[10, 40, 41]]
+        ),
+    ]
+    returns[1].iloc[:5] = np.nan
+
+    rfr = [
+        pd.Series(0.0001, days, name="Flat"),
+        pd.Series(rng.uniform(0, 0.0002, 60), days[::2], name="Sparse"),
+    ]
+    bmk = [
+        pd.Series(rng.normal(0.0003, 0.008, 110), days[10:], name="Bmk"),
+        pd.Series(
+            rng.normal(0.0003, 0.008, 130),
+            pd.bdate_range("2019-12-01", periods=130),
+            name="Wide",
+        ),
+    ]
+    bmk[0].iloc[-3:] = np.nan
+
+    return returns, rfr, bmk
+
+
+def expected_configs(config: AssessmentConfig) -> list:
+    """Per-combination processing of the series, as before the panel."""
+    processed = []
+    for ret, rfr, bmk in product(
+        config._returns_list, config._rfr_list, config._bmk_list
+    ):
+        try:
+            processed.append(config._process_single_config(ret, rfr, bmk))
+        except ValueError as e:
+            processed.append(str(e))
+
+    return processed
+
+
+def panel_configs(config: AssessmentConfig) -> list:
+    panel = config._aligned_panel()
+    processed = []
+    for i, f, b in product(
+        range(len(config._returns_list)),
+        range(len(config._rfr_list)),
+        range(len(config._bmk_list)),
+    ):
+        try:
+            processed.append(panel.combination(i, f, b))
+        except ValueError as e:
+            processed.append(str(e))
+
+    return processed
+
+
+class TestAlignedPanel:
+    @pytest.mark.parametrize("overlap_mode", list(OverlapMode))
+    @pytest.mark.parametrize(
+        "start, end", [(None, None), ("2020-01-15", None), ("2020-02-01", "2020-05-01")]
+    )
+    def test_matches_per_combination_processing(self, series, overlap_mode, start, end):
+        """Test every combination equals reindexing its series one by one."""
+        returns, rfr, bmk = series
+        config = AssessmentConfig(
+            returns=returns,
+            rfr=rfr,
+            bmk=bmk,
+            start=start,
+            end=end,
+            min_periods=5,
+            overlap_mode=overlap_mode,
+        )
+
+        for actual, expected in zip(
+            panel_configs(config), expected_configs(config), strict=True
+        ):
+            if isinstance(expected, str):
+                assert actual == expected
+                continue
+            for actual_series, expected_series in zip(actual, expected):
+                pd.testing.assert_series_equal(actual_series, expected_series)
+
+    def test_iter_configs_uses_panel(self, series):
+        """Test iter_configs yields the panel combinations with their keys."""
+        returns, rfr, bmk = series
+        config = AssessmentConfig(
+            returns=returns[0],
+            rfr=rfr,
+            bmk=bmk,
+            min_periods=5,
+            overlap_mode=OverlapMode.LONGEST_OVERLAP,
+        )
+
+        configs = dict(config.iter_configs())
+
+        assert list(configs) == [
+            "Full|Flat|Bmk",
+            "Full|Flat|Wide",
+            "Full|Sparse|Bmk",
+            "Full|Sparse|Wide",
+        ]
+        pd.testing.assert_series_equal(
+            configs["Full|Sparse|Bmk"].rfr, panel_configs(config)[2][1]
+        )
+
+    def test_combinations_share_rows(self, series):
+        """Test combinations of one returns series are views of shared rows."""
+        returns, rfr, bmk = series
+        config = AssessmentConfig(returns=returns, rfr=rfr, bmk=bmk, min_periods=5)
+        panel = config._aligned_panel()
+
+        rows = panel.rows(0)
+        _, rfr_a, bmk_a = panel.combination(0, 1, 0, rows)
+        _, rfr_b, bmk_b = panel.combination(0, 1, 1, rows)
+
+        assert np.shares_memory(rfr_a.to_numpy(), rfr_b.to_numpy())
+        assert not np.shares_memory(bmk_a.to_numpy(), bmk_b.to_numpy())
+
+    def test_no_overlap(self, series):
+        """Test combinations without a common period raise ValueError."""
+        _, rfr, bmk = series
+        late = pd.Series(0.01, pd.bdate_range("2021-01-01", periods=30), name="Later")
+        config = AssessmentConfig(
+            returns=late,
+            rfr=rfr[0],
+            bmk=bmk[0],
+            min_periods=5,
+            overlap_mode=OverlapMode.LONGEST_OVERLAP,
+        )
+
+        with pytest.raises(ValueError, match="No overlapping period"):
+            list(config.iter_configs())
+
+    def test_missing_returns(self, series):
+        """Test missing returns inside the evaluated period raise ValueError."""
+        returns, rfr, bmk = series
+        config = AssessmentConfig(
+            returns=returns[1], rfr=rfr[0], bmk=bmk[0], min_periods=5
+        )
+
+        with pytest.raises(ValueError, match="missing data"):
+            list(config.iter_configs())
+
+    def test_unsorted_index_falls_back(self, series):
+        """Test configs with unsorted indexes are processed per combination."""
+        returns, rfr, bmk = series
+        shuffled = returns[0].iloc[::-1]
+        config = AssessmentConfig(
+            returns=shuffled, rfr=rfr[0], bmk=bmk[1], min_periods=5
+        )
+
+        assert not AlignedPanel.supports(shuffled)
+        assert config._aligned_panel() is None
+        _, single = next(config.iter_configs())
+        pd.testing.assert_series_equal(single.returns, shuffled)
+
+
+def assert_matches_processing(config: AssessmentConfig, combinations: list) -> None:
+    """Configs of ``config`` are the per-combination processing of ``combinations``."""
+    configs = list(config.iter_configs())
+    assert len(configs) == len(combinations) == config.num_configs
+
+    for (config_key, single), (i, f, b) in zip(configs, combinations):
+        returns, rfr, bmk = config._process_single_config(
+            config._returns_list[i], config._rfr_list[f], config._bmk_list[b]
+        )
+        assert config_key == f"{returns.name}|{rfr.name}|{bmk.name}"
+        pd.testing.assert_series_equal(single.returns, returns)
+        pd.testing.assert_series_equal(single.rfr, rfr, check_freq=False)
+        pd.testing.assert_series_equal(single.bmk, bmk, check_freq=False)
+
+
+class TestPairing:
+    @pytest.mark.parametrize("overlap_mode", list(OverlapMode))
+    def test_zip(self, series, overlap_mode):
+        """Test zip pairs the series at the same positions."""
+        returns, rfr, bmk = series
+        # Late has missing returns outside of the longest overlap
+        config = AssessmentConfig(
+            returns=[returns[0], returns[2]],
+            rfr=rfr,
+            bmk=bmk,
+            min_periods=5,
+            overlap_mode=overlap_mode,
+            pairing="zip",
+        )
+
+        assert_matches_processing(config, [(0, 0, 0), (1, 1, 1)])
+
+    def test_zip_repeats_single_series(self, series):
+        """Test single rfr and bmk series go with every returns series."""
+        returns, rfr, bmk = series
+        config = AssessmentConfig(
+            returns=[returns[0], returns[2]],
+            rfr=rfr[1],
+            bmk=bmk[0],
+            min_periods=5,
+            pairing="zip",
+        )
+
+        assert_matches_processing(config, [(0, 0, 0), (1, 0, 0)])
+
+    @pytest.mark.parametrize("sort", [True, False])
+    def test_explicit_pairs(self, series, sort):
+        """Test explicit triples are evaluated in their order, with or without panel."""
+        returns, rfr, bmk = series
+        if not sort:
+            returns = [returns[0].iloc[::-1], *returns[1:]]
+        pairs = [(2, 1, 0), (0, 0, 1), (2, 0, 1)]
+        config = AssessmentConfig(
+            returns=returns, rfr=rfr, bmk=bmk, min_periods=5, pairing=pairs
+        )
+
+        assert (config._aligned_panel() is not None) == sort
+        assert_matches_processing(config, pairs)
+
+    def test_pairs_from_lists(self, series):
+        """Test triples given as lists, as in JSON payloads, are accepted."""
+        returns, rfr, bmk = series
+        config = AssessmentConfig(
+            returns=returns, rfr=rfr, bmk=bmk, min_periods=5, pairing=[[2, 0, 1]]
+        )
+
+        assert config.pairing == [(2, 0, 1)]
+        assert [key for key, _ in config.iter_configs()] == ["Gappy|Flat|Wide"]
+
+    @pytest.mark.parametrize(
+        "pairing, match",
+        [
+            ("cross", "pairing must be one of"),
+            ("zip", "zip pairing needs"),
+            ([], "at least one combination"),
+            ([(3, 0, 0)], "not a"),
+            ([(0, 0)], "not a"),
+            ([(0, 0, 0), (0, 0, 0)], "repeat"),
+        ],
+    )
+    def test_invalid_pairing(self, series, pairing, match):
+        """Test unknown modes and invalid triples are rejected."""
+        returns, rfr, bmk = series
+
+        with pytest.raises(ValueError, match=match):
+            AssessmentConfig(
+                returns=returns, rfr=rfr, bmk=bmk, min_periods=5, pairing=pairing
+            )
+
+
+class TestConstruction:
+    def test_kwargs_hold_the_inputs(self, series):
+        """Test config construction references the series instead of copying them."""
+        returns, rfr, bmk = series
+        window = [20, 60]
+
+        single = AssessmentConfig(
+            returns=returns[0], rfr=rfr[0], bmk=bmk[0], window=window, min_periods=5
+        )
+        multi = AssessmentConfig(
+            returns=returns, rfr=rfr, bmk=bmk, window=window, min_periods=5
+        )
+
+        assert single.kwargs["returns"] is returns[0]
+        assert single.kwargs["rfr"] is rfr[0]
+        assert single.kwargs["bmk"] is bmk[0]
+        assert single.kwargs["window"] is window
+        assert multi._returns_list is returns
+        assert "returns" not in multi.kwargs and "pairing" not in multi.kwargs
+
+    def test_combinations_are_views(self, series):
+        """Test combination returns are views of the input series."""
+        returns, rfr, bmk = series
+        config = AssessmentConfig(
+            returns=returns[0],
+            rfr=rfr[0],
+            bmk=bmk[1],
+            min_periods=5,
+            overlap_mode=OverlapMode.LONGEST_OVERLAP,
+        )
+
+        (_, single), *_ = config.iter_configs()
+
+        assert np.shares_memory(single.returns.to_numpy(), returns[0].to_numpy())
+        assert single.kwargs["returns"] is single.returns
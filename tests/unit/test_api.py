@@ -285,7 +285,69 @@ class TestRunEndpoint:
         assert response.status_code == 422  # Validation error
 
 
+class TestRunBatchEndpoint:
+    @patch("src.app.api.task_queue")
+    def test_enqueue_assessments(self, mock_queue, client, mock_job):
+        """Test run_batch endpoint enqueues one job for all tasks."""
+        mock_queue.enqueue.return_value = mock_job
+
+        response = client.post(
+            "/run_batch",
+            json={
+                "tasks": [
+                    {"assessment_name": "Beta", "assessment_type": "summary"},
+                    {"assessment_name": "Volatility", "assessment_type": "rolling"},
+                ],
+                "config": {
+                    "returns": [0.01, 0.02, 0.03],
+                    "bmk": [0.005, 0.01, 0.015],
+                    "rfr": [0.001, 0.001, 0.001],
+                },
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"job_id": "test_job_123"}
+        tasks = mock_queue.enqueue.call_args[0][1]
+        assert tasks[1] == {
+            "assessment_name": "Volatility",
+            "assessment_type": "rolling",
+        }
+
+    def test_invalid_task(self, client):
+        """Test run_batch endpoint validates every task."""
+        response = client.post(
+            "/run_batch",
+            json={
+                "tasks": [{"assessment_name": "Invalid", "assessment_type": "summary"}],
+                "config": {"returns": [0.01], "bmk": [0.01], "rfr": [0.001]},
+            },
+        )
+
+        assert response.status_code == 422
+
+    def test_invalid_config(self, client):
+        """Test run_batch endpoint validates the config."""
+        response = client.post(
+            "/run_batch",
+            json={
+                "tasks": [{"assessment_name": "Beta", "assessment_type": "summary"}],
+                "config": {"returns": [0.01]},
+            },
+        )
+
+        assert response.status_code == 422
+
+
 class TestSerializeResult:
+    def test_serialize_list_of_outputs(self):
+        """Test batch outputs are serialized item by item."""
+        result = serialize_result(
+            [{"result": pd.Series([1.0, np.nan])}, {"result": np.float64(2.0)}]
+        )
+
+        assert result == [{"result": [1.0, None]}, {"result": 2.0}]
+
     def test_serialize_none(self):
         """Test serializing None."""
         assert serialize_result(None) is None
@@ -1,20 +1,26 @@
 """Tests for Evaluation class."""
 
-import pytest
-import pandas as pd
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
 from unittest.mock import Mock, patch
-from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.assessments.base_assessment import BaseAssessment
+from src.constants import AssessmentName
+from src.dataclasses.assessment_config import AssessmentConfig, OverlapMode
+from src.dataclasses.assessment_results import AssessmentType
 from src.evaluation import (
+    ALL_ASSESSMENT_TYPES,
+    ALL_ASSESSMENTS,
     Evaluation,
     ExecutorType,
-    ALL_ASSESSMENTS,
-    ALL_ASSESSMENT_TYPES,
+    run_shared_assessments,
 )
-from src.dataclasses.assessment_config import AssessmentConfig
-from src.dataclasses.assessment_results import AssessmentType
-from src.constants import AssessmentName
 from src.utils.executors import DummyExecutor, RQExecutor
+from src.utils.result_cache import ResultCache
 
 
 @pytest.fixture
@@ -173,6 +179,31 @@ class TestEvaluation:
         assert AssessmentName.Beta in results.timer[config_key]
         assert AssessmentType.Summary in results.timer[config_key][AssessmentName.Beta]
 
+    def test_run_reports_cache_stats(self, sample_config):
+        """Test shared windowed statistics are reused across assessments."""
+        eval_obj = (
+            Evaluation(config=sample_config)
+            .with_assessments(
+                [
+                    AssessmentName.Beta,
+                    AssessmentName.TreynorRatio,
+                    AssessmentName.BenchmarkCorrelation,
+                    AssessmentName.RSquared,
+                ]
+            )
+            .with_assessment_types([AssessmentType.Rolling, AssessmentType.Expanding])
+        )
+
+        results = eval_obj.run()
+
+        config_key = next(iter(results.results))
+        assert results.cache_stats[config_key] == {
+            "hits": results.cache_hits,
+            "misses": results.cache_misses,
+        }
+        assert results.cache_hits > 0
+        assert results.cache_misses > 0
+
     def test_run_with_process_pool_executor(self, sample_config):
         """Test run with ProcessPoolExecutor."""
         executor = ProcessPoolExecutor(max_workers=2)
@@ -326,6 +357,826 @@ class TestEvaluation:
         )
 
 
+class TestBatchedEvaluation:
+    @pytest.fixture
+    def multi_config(self):
+        """Create a config with several portfolios, one on a shorter track."""
+        rng = np.random.default_rng(0)
+        index = pd.bdate_range("2020-01-01", periods=120)
+        returns = [
+            pd.Series(rng.normal(0.0005, 0.01, 120), index=index, name=f"P{i}")
+            for i in range(3)
+        ]
+        returns.append(
+            pd.Series(rng.normal(0.0005, 0.01, 60), index=index[60:], name="Short")
+        )
+
+        return AssessmentConfig(
+            returns=returns,
+            rfr=pd.Series(0.0001, index=index, name="RFR"),
+            bmk=pd.Series(rng.normal(0.0003, 0.008, 120), index=index, name="Bmk"),
+            window=20,
+            min_periods=10,
+        )
+
+    def test_iter_batches_groups_aligned_configs(self, multi_config):
+        """Test configs on the same dates are stacked into one batch."""
+        batches = list(multi_config.iter_batches())
+
+        assert [list(configs) for configs, _ in batches] == [
+            ["P0|RFR|Bmk", "P1|RFR|Bmk", "P2|RFR|Bmk"],
+            ["Short|RFR|Bmk"],
+        ]
+        configs, batch_config = batches[0]
+        assert batch_config.returns.shape == (120, 3)
+        assert list(batch_config.bmk.columns) == list(configs)
+
+    def test_batched_matches_unbatched(self, multi_config):
+        """Test batched evaluation gives the same results as the per-config loop."""
+        expected = Evaluation(config=multi_config).run()
+        results = Evaluation(config=multi_config).with_batching().run()
+
+        assert list(results.results) == list(expected.results)
+        for assessment_type, df in expected.results_dfs.items():
+            pd.testing.assert_frame_equal(
+                results.results_dfs[assessment_type], df, check_exact=False
+            )
+
+    def test_batched_with_rq_executor_raises(self, multi_config):
+        """Test batched evaluation is rejected for the remote executor."""
+        eval_obj = (
+            Evaluation(config=multi_config)
+            .with_batching()
+            .with_executor(RQExecutor(api_url="http://localhost:8000"))
+        )
+
+        with pytest.raises(TypeError):
+            eval_obj.run()
+
+
+class TestMultiWindowEvaluation:
+    @pytest.fixture
+    def series(self):
+        """Create returns, rfr and benchmark series."""
+        rng = np.random.default_rng(1)
+        index = pd.bdate_range("2020-01-01", periods=150)
+        return (
+            pd.Series(rng.normal(0.0005, 0.01, 150), index=index, name="Port"),
+            pd.Series(0.0001, index=index, name="RFR"),
+            pd.Series(rng.normal(0.0003, 0.008, 150), index=index, name="Bmk"),
+        )
+
+    def test_rolling_results_have_window_level(self, series):
+        """Test each window matches a separate single-window evaluation."""
+        returns, rfr, bmk = series
+        config = AssessmentConfig(
+            returns=returns, rfr=rfr, bmk=bmk, window=[10, 40], min_periods=5
+        )
+
+        results = (
+            Evaluation(config=config)
+            .with_assessment_types([AssessmentType.Rolling])
+            .run()
+        )
+
+        rolling_df = results.results_dfs[AssessmentType.Rolling]
+        assert rolling_df.columns.names[-1] == "Window"
+        for window in [10, 40]:
+            expected = (
+                Evaluation(
+                    config=AssessmentConfig(
+                        returns=returns, rfr=rfr, bmk=bmk, window=window, min_periods=5
+                    )
+                )
+                .with_assessment_types([AssessmentType.Rolling])
+                .run()
+            )
+            pd.testing.assert_frame_equal(
+                rolling_df.xs(window, axis=1, level="Window"),
+                expected.results_dfs[AssessmentType.Rolling],
+            )
+
+    def test_invalid_window_in_list(self, series):
+        """Test every window of the list is validated."""
+        returns, rfr, bmk = series
+
+        with pytest.raises(ValueError):
+            AssessmentConfig(returns=returns, rfr=rfr, bmk=bmk, window=[21, 0])
+
+
+class TestPrecision:
+    @pytest.fixture
+    def config_kwargs(self):
+        """Create returns, rfr and benchmark series."""
+        rng = np.random.default_rng(2)
+        index = pd.bdate_range("2020-01-01", periods=150)
+        return {
+            "returns": pd.Series(rng.normal(0.0005, 0.01, 150), index, name="Port"),
+            "rfr": pd.Series(0.0001, index=index, name="RFR"),
+            "bmk": pd.Series(rng.normal(0.0003, 0.008, 150), index, name="Bmk"),
+            "window": [10, 40],
+            "min_periods": 5,
+        }
+
+    def test_float32_results(self, config_kwargs):
+        """Test float32 precision stores windowed results in float32."""
+        full = Evaluation(config=AssessmentConfig(**config_kwargs)).run()
+        half = Evaluation(
+            config=AssessmentConfig(**config_kwargs, precision="float32")
+        ).run()
+
+        for assessment_type in [AssessmentType.Rolling, AssessmentType.Expanding]:
+            result = half.results_dfs[assessment_type]
+            expected = full.results_dfs[assessment_type]
+
+            assert (result.dtypes == np.float32).all()
+            assert result.memory_usage().sum() < expected.memory_usage().sum()
+            pd.testing.assert_frame_equal(
+                result, expected.astype(np.float32), check_exact=False, rtol=1e-6
+            )
+
+        # Summaries stay Python floats
+        pd.testing.assert_frame_equal(
+            half.results_dfs[AssessmentType.Summary],
+            full.results_dfs[AssessmentType.Summary],
+        )
+
+    def test_invalid_precision(self, config_kwargs):
+        """Test unknown precisions are rejected."""
+        with pytest.raises(ValueError, match="precision"):
+            AssessmentConfig(**config_kwargs, precision="float16")
+
+
+class TestIncrementalEvaluation:
+    @pytest.fixture
+    def series(self):
+        """Create returns, rfr and benchmark series to evaluate over growing spans."""
+        rng = np.random.default_rng(3)
+        index = pd.bdate_range("2020-01-01", periods=200)
+        returns = pd.Series(rng.normal(0.0005, 0.01, 200), index, name="Port")
+        return {
+            "returns": [returns, (returns * 1.5).rename("Levered")],
+            "rfr": pd.Series(0.0001, index=index, name="RFR"),
+            "bmk": pd.Series(
+                0.6 * returns.to_numpy() + rng.normal(0.0, 0.008, 200),
+                index,
+                name="Bmk",
+            ),
+        }
+
+    @staticmethod
+    def make_config(series, end, **kwargs):
+        return AssessmentConfig(
+            returns=[returns.iloc[:end] for returns in series["returns"]],
+            rfr=series["rfr"].iloc[:end],
+            bmk=series["bmk"].iloc[:end],
+            min_periods=10,
+            **kwargs,
+        )
+
+    @staticmethod
+    def assert_results_close(result, expected):
+        for assessment_type in AssessmentType:
+            pd.testing.assert_frame_equal(
+                result.results_dfs[assessment_type],
+                expected.results_dfs[assessment_type],
+                check_exact=False,
+                rtol=1e-7,
+                atol=1e-12,
+            )
+
+    @pytest.mark.parametrize("window", [30, [15, 30]])
+    def test_matches_full_run(self, series, window):
+        """Test extending previous results equals evaluating the longer history."""
+        previous = Evaluation(self.make_config(series, 150, window=window)).run()
+        extended = (
+            Evaluation(self.make_config(series, 180, window=window))
+            .with_previous(previous)
+            .run()
+        )
+        # The second extension starts from the carried running statistics
+        final = (
+            Evaluation(self.make_config(series, 200, window=window))
+            .with_previous(extended)
+            .run()
+        )
+
+        assert set(extended.online_stats) == {"Port|RFR|Bmk", "Levered|RFR|Bmk"}
+        self.assert_results_close(
+            final, Evaluation(self.make_config(series, 200, window=window)).run()
+        )
+
+    def test_previous_is_not_modified(self, series):
+        """Test extending results leaves the previous results untouched."""
+        previous = (
+            Evaluation(self.make_config(series, 150, window=30))
+            .with_previous(Evaluation(self.make_config(series, 140, window=30)).run())
+            .run()
+        )
+        count = previous.online_stats["Port|RFR|Bmk"].count
+
+        Evaluation(self.make_config(series, 200, window=30)).with_previous(
+            previous
+        ).run()
+
+        assert previous.online_stats["Port|RFR|Bmk"].count == count
+        assert (
+            len(previous.results["Port|RFR|Bmk"][AssessmentName.Beta]["rolling"]) == 150
+        )
+
+    def test_with_rq_executor_raises(self, series):
+        """Test extending previous results is rejected for the remote executor."""
+        previous = Evaluation(self.make_config(series, 150, window=30)).run()
+        eval_obj = (
+            Evaluation(self.make_config(series, 180, window=30))
+            .with_previous(previous)
+            .with_executor(RQExecutor(api_url="http://localhost:8000"))
+        )
+
+        with pytest.raises(ValueError):
+            eval_obj.run()
+
+    def test_changed_history_runs_in_full(self, series):
+        """Test configs whose earlier points changed are recomputed from scratch."""
+        previous = Evaluation(self.make_config(series, 150, window=30)).run()
+        series["bmk"] = series["bmk"] * 2
+        config = self.make_config(series, 200, window=30)
+
+        result = Evaluation(config).with_previous(previous).run()
+
+        assert result.online_stats == {}
+        pd.testing.assert_frame_equal(
+            result.results_dfs[AssessmentType.Rolling],
+            Evaluation(config).run().results_dfs[AssessmentType.Rolling],
+        )
+
+    def test_changed_parameters_run_in_full(self, series):
+        """Test previous results with other parameters are not reused."""
+        previous = Evaluation(self.make_config(series, 150, window=30)).run()
+
+        result = (
+            Evaluation(self.make_config(series, 200, window=40))
+            .with_previous(previous)
+            .run()
+        )
+
+        assert result.online_stats == {}
+
+    def test_missing_assessments_run_in_full(self, series):
+        """Test assessments absent from the previous results are computed in full."""
+        previous = (
+            Evaluation(self.make_config(series, 150, window=30))
+            .with_assessments([AssessmentName.Beta])
+            .run()
+        )
+        config = self.make_config(series, 200, window=30)
+
+        result = (
+            Evaluation(config)
+            .with_assessments([AssessmentName.Beta, AssessmentName.Volatility])
+            .with_previous(previous)
+            .run()
+        )
+
+        self.assert_results_close(
+            result,
+            Evaluation(config)
+            .with_assessments([AssessmentName.Beta, AssessmentName.Volatility])
+            .run(),
+        )
+
+
+class TestResultCache:
+    @pytest.fixture
+    def config(self):
+        """Create a config with two portfolios on the same dates."""
+        rng = np.random.default_rng(4)
+        index = pd.bdate_range("2020-01-01", periods=80)
+        returns = pd.Series(rng.normal(0.0005, 0.01, 80), index, name="Port")
+        return AssessmentConfig(
+            returns=[returns, (returns * 2).rename("Levered")],
+            rfr=pd.Series(0.0001, index=index, name="RFR"),
+            bmk=pd.Series(rng.normal(0.0003, 0.008, 80), index, name="Bmk"),
+            window=[10, 20],
+            min_periods=5,
+        )
+
+    @pytest.mark.parametrize("batched", [False, True])
+    def test_second_run_hits(self, config, batched):
+        """Test a repeated evaluation is served from the cache with equal results."""
+        cache = ResultCache()
+        first = Evaluation(config).with_batching(batched).with_cache(cache).run()
+        second = Evaluation(config).with_batching(batched).with_cache(cache).run()
+
+        runs = len(ALL_ASSESSMENTS) * len(AssessmentType) * 2
+        assert first.result_cache_stats["hits"] == 0
+        assert second.result_cache_stats == {"hits": runs, "misses": 0}
+        for assessment_type in AssessmentType:
+            pd.testing.assert_frame_equal(
+                second.results_dfs[assessment_type],
+                first.results_dfs[assessment_type],
+            )
+
+    def test_shared_through_disk(self, config, tmp_path):
+        """Test results are reused by another cache over the same directory."""
+        Evaluation(config).with_cache(ResultCache(directory=tmp_path)).run()
+
+        cache = ResultCache(directory=tmp_path)
+        result = Evaluation(config).with_cache(cache).run()
+
+        assert cache.disk_hits == len(ALL_ASSESSMENTS) * len(AssessmentType) * 2
+        assert result.result_cache_stats["misses"] == 0
+
+    def test_remote_results_are_not_cached(self, config):
+        """Test JSON results of RQExecutor jobs never reach local runs."""
+        cache = ResultCache()
+        executor = RQExecutor("http://api.example.com")
+
+        def submit_batch(single_config, runs):
+            future = Mock()
+            future.result.return_value = [{"result": [0.0], "time": 0.0} for _ in runs]
+            return future
+
+        with patch.object(executor, "submit_batch", side_effect=submit_batch):
+            Evaluation(config).with_executor(executor).with_task_size(None).with_cache(
+                cache
+            ).run()
+        result = Evaluation(config).with_cache(cache).run()
+
+        assert len(cache) == len(ALL_ASSESSMENTS) * len(AssessmentType) * 2
+        assert result.result_cache_stats["hits"] == 0
+
+    def test_without_cache(self, config):
+        """Test evaluations without a cache report no cache statistics."""
+        assert Evaluation(config).run().result_cache_stats == {}
+
+
+class TestTaskSize:
+    @pytest.fixture
+    def config(self):
+        """Create a config with two portfolios."""
+        rng = np.random.default_rng(5)
+        index = pd.bdate_range("2020-01-01", periods=60)
+        returns = pd.Series(rng.normal(0.0005, 0.01, 60), index, name="Port")
+        return AssessmentConfig(
+            returns=[returns, (returns * 2).rename("Levered")],
+            rfr=pd.Series(0.0001, index=index, name="RFR"),
+            bmk=pd.Series(rng.normal(0.0003, 0.008, 60), index, name="Bmk"),
+            window=20,
+            min_periods=5,
+        )
+
+    @pytest.mark.parametrize("task_size", [None, 7])
+    def test_grouped_tasks_match(self, config, task_size):
+        """Test grouping runs into tasks gives the results of one run per task."""
+        expected = Evaluation(config).run()
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result = (
+                Evaluation(config)
+                .with_executor(executor)
+                .with_task_size(task_size)
+                .run()
+            )
+
+        for assessment_type in AssessmentType:
+            pd.testing.assert_frame_equal(
+                result.results_dfs[assessment_type],
+                expected.results_dfs[assessment_type],
+            )
+
+    def test_task_count(self, config):
+        """Test each task holds up to task_size runs of one configuration."""
+        executor = DummyExecutor()
+        submit = Mock(wraps=executor.submit)
+        executor.submit = submit
+
+        Evaluation(config).with_executor(executor).with_task_size(30).run()
+
+        # 78 runs per configuration in tasks of 30, 30 and 18
+        assert submit.call_count == 6
+
+    def test_remote_tasks(self, config):
+        """Test RQExecutor receives grouped runs as batch jobs."""
+        executor = RQExecutor("http://api.example.com")
+
+        def submit_batch(single_config, runs):
+            future = Mock()
+            future.result.return_value = [
+                ALL_ASSESSMENTS[AssessmentName[name]](config=single_config)._run(
+                    AssessmentType(assessment_type)
+                )
+                for name, assessment_type in runs
+            ]
+            return future
+
+        with patch.object(executor, "submit_batch", side_effect=submit_batch) as submit:
+            result = (
+                Evaluation(config).with_executor(executor).with_task_size(None).run()
+            )
+
+        assert submit.call_count == 2
+        runs = submit.call_args[0][1]
+        assert ("Beta", "summary") in runs
+        assert len(runs) == len(ALL_ASSESSMENTS) * len(AssessmentType)
+        pd.testing.assert_frame_equal(
+            result.results_dfs[AssessmentType.Summary],
+            Evaluation(config).run().results_dfs[AssessmentType.Summary],
+        )
+
+    def test_invalid_task_size(self, config):
+        """Test non-positive task sizes are rejected."""
+        with pytest.raises(ValueError, match="task_size"):
+            Evaluation(config).with_task_size(0)
+
+
+class TestSharedMemory:
+    @pytest.fixture
+    def config(self):
+        """Create a config with two portfolios on business days."""
+        rng = np.random.default_rng(7)
+        index = pd.bdate_range("2020-01-01", periods=80)
+        returns = pd.Series(rng.normal(0.0005, 0.01, 80), index, name="Port")
+        return AssessmentConfig(
+            returns=[returns, (returns * 2).rename("Levered")],
+            rfr=pd.Series(0.0001, index=index, name="RFR"),
+            bmk=pd.Series(rng.normal(0.0003, 0.008, 80), index, name="Bmk"),
+            window=20,
+            min_periods=5,
+        )
+
+    @pytest.mark.parametrize("shared_memory", [True, False])
+    def test_process_pool_results_match(self, config, shared_memory):
+        """Test results are the same with and without shared series."""
+        expected = Evaluation(config).run()
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result = (
+                Evaluation(config)
+                .with_executor(executor)
+                .with_shared_memory(shared_memory)
+                .run()
+            )
+
+        for assessment_type in AssessmentType:
+            pd.testing.assert_frame_equal(
+                result.results_dfs[assessment_type],
+                expected.results_dfs[assessment_type],
+            )
+
+    def test_tasks_carry_handles(self, config):
+        """Test process pool tasks receive a handle instead of the config."""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            submit = Mock(wraps=executor.submit)
+            with patch.object(executor, "submit", submit):
+                Evaluation(config).with_executor(executor).run()
+
+        functions = {call.args[0] for call in submit.call_args_list}
+        handles = {call.args[1].name for call in submit.call_args_list}
+        assert functions == {run_shared_assessments}
+        assert len(handles) == 2
+
+    def test_other_executors_unaffected(self, config):
+        """Test shared memory is only used with process pools."""
+        executor = DummyExecutor()
+        submit = Mock(wraps=executor.submit)
+        executor.submit = submit
+
+        Evaluation(config).with_executor(executor).run()
+
+        assert run_shared_assessments not in {
+            call.args[0] for call in submit.call_args_list
+        }
+
+
+class LazyExecutor(DummyExecutor):
+    """Executor whose tasks run when their result is requested."""
+
+    def __init__(self):
+        self.pending = 0
+        self.max_pending = 0
+        self.events = []
+
+    def submit(self, fn, *args, **kwargs):
+        executor = self
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+        self.events.append("submit")
+
+        class LazyFuture(Future):
+            def result(self, timeout=None):
+                executor.pending -= 1
+                executor.events.append("result")
+                return fn(*args, **kwargs)
+
+        return LazyFuture()
+
+
+class TestPipelining:
+    @pytest.fixture
+    def config(self):
+        """Create a config with three portfolios."""
+        rng = np.random.default_rng(11)
+        index = pd.bdate_range("2020-01-01", periods=60)
+        returns = pd.Series(rng.normal(0.0005, 0.01, 60), index, name="Port")
+        return AssessmentConfig(
+            returns=[
+                returns,
+                (returns * 2).rename("Double"),
+                (-returns).rename("Short"),
+            ],
+            rfr=pd.Series(0.0001, index=index, name="RFR"),
+            bmk=pd.Series(rng.normal(0.0003, 0.008, 60), index, name="Bmk"),
+            window=20,
+            min_periods=5,
+        )
+
+    def test_configs_in_flight_together(self, config):
+        """Test tasks of later configurations are submitted before any is collected."""
+        executor = LazyExecutor()
+        # Composite assessments wait for the results of their components
+        independent = [
+            name for name, cls in ALL_ASSESSMENTS.items() if not cls.dependencies
+        ]
+
+        result = (
+            Evaluation(config)
+            .with_assessments(independent)
+            .with_executor(executor)
+            .with_max_in_flight(None)
+            .run()
+        )
+
+        tasks = len(independent) * len(AssessmentType)
+        assert executor.max_pending == 3 * tasks
+        assert executor.events[: 3 * tasks] == ["submit"] * (3 * tasks)
+        assert list(result.results) == [
+            "Port|RFR|Bmk",
+            "Double|RFR|Bmk",
+            "Short|RFR|Bmk",
+        ]
+
+    @pytest.mark.parametrize("max_in_flight", [1, 10])
+    def test_in_flight_limit(self, config, max_in_flight):
+        """Test no more than max_in_flight tasks are pending at once."""
+        executor = LazyExecutor()
+        expected = Evaluation(config).run()
+
+        result = (
+            Evaluation(config)
+            .with_executor(executor)
+            .with_max_in_flight(max_in_flight)
+            .run()
+        )
+
+        assert executor.max_pending == max_in_flight
+        for assessment_type in AssessmentType:
+            pd.testing.assert_frame_equal(
+                result.results_dfs[assessment_type],
+                expected.results_dfs[assessment_type],
+            )
+
+    def test_result_order_with_cached_results(self, config):
+        """Test cached and computed results keep the order of the assessments."""
+        cache = ResultCache()
+        Evaluation(config).with_assessments([AssessmentName.Volatility]).with_cache(
+            cache
+        ).run()
+
+        result = Evaluation(config).with_cache(cache).run()
+
+        for config_results in result.results.values():
+            assert list(config_results) == list(ALL_ASSESSMENTS)
+
+    def test_invalid_max_in_flight(self, config):
+        """Test non-positive limits are rejected."""
+        with pytest.raises(ValueError, match="max_in_flight"):
+            Evaluation(config).with_max_in_flight(0)
+
+
+class TestDependencies:
+    @pytest.fixture
+    def config(self):
+        """Create a config with two portfolios."""
+        rng = np.random.default_rng(13)
+        index = pd.bdate_range("2020-01-01", periods=80)
+        returns = pd.Series(rng.normal(0.0005, 0.01, 80), index, name="Port")
+        return AssessmentConfig(
+            returns=[returns, (returns * 2).rename("Levered")],
+            rfr=pd.Series(0.0001, index=index, name="RFR"),
+            bmk=pd.Series(rng.normal(0.0003, 0.008, 80), index, name="Bmk"),
+            window=[20, 40],
+            min_periods=5,
+        )
+
+    @pytest.mark.parametrize("task_size", [1, 4, None])
+    def test_components_are_passed(self, config, task_size):
+        """Test composites reuse the results of their components."""
+        from src.assessments import calmar_ratio
+
+        expected = Evaluation(config).run()
+
+        with patch.object(
+            calmar_ratio,
+            "resolve_dependency",
+            wraps=calmar_ratio.resolve_dependency,
+        ) as resolve:
+            result = (
+                Evaluation(config)
+                .with_executor(DummyExecutor())
+                .with_task_size(task_size)
+                .run()
+            )
+
+        # Two components of the summary, both windows and expanding, per config
+        assert resolve.call_count == 2 * (2 + 2 * 2 + 2)
+        for call in resolve.call_args_list:
+            dependencies, name, _ = call.args
+            assert name in dependencies
+        for assessment_type in AssessmentType:
+            pd.testing.assert_frame_equal(
+                result.results_dfs[assessment_type],
+                expected.results_dfs[assessment_type],
+            )
+
+    def test_composites_wait_for_components(self, config):
+        """Test composite tasks are submitted once their components are collected."""
+        executor = LazyExecutor()
+
+        result = (
+            Evaluation(config)
+            .with_assessments(
+                [
+                    AssessmentName.CalmarRatio,
+                    AssessmentName.CAGR,
+                    AssessmentName.MaxDrawdown,
+                ]
+            )
+            .with_assessment_types([AssessmentType.Summary])
+            .with_executor(executor)
+            .with_max_in_flight(None)
+            .run()
+        )
+
+        # Components of both configurations first, then the composites
+        assert executor.events[:4] == ["submit"] * 4
+        assert executor.events[4] == "result"
+        assert executor.max_pending == 4
+        for config_results in result.results.values():
+            assert list(config_results) == [
+                AssessmentName.CalmarRatio,
+                AssessmentName.CAGR,
+                AssessmentName.MaxDrawdown,
+            ]
+
+    def test_missing_components_are_computed(self, config):
+        """Test composites compute components that are not evaluated."""
+        expected = Evaluation(config).run()
+
+        result = (
+            Evaluation(config)
+            .with_assessments([AssessmentName.InformationRatio])
+            .with_executor(DummyExecutor())
+            .run()
+        )
+
+        pd.testing.assert_frame_equal(
+            result.results_dfs[AssessmentType.Summary],
+            expected.results_dfs[AssessmentType.Summary].loc[
+                [AssessmentName.InformationRatio]
+            ],
+        )
+        for config_key, config_results in result.results.items():
+            for assessment_type in (AssessmentType.Rolling, AssessmentType.Expanding):
+                pd.testing.assert_frame_equal(
+                    pd.DataFrame(
+                        config_results[AssessmentName.InformationRatio][assessment_type]
+                    ),
+                    pd.DataFrame(
+                        expected.results[config_key][AssessmentName.InformationRatio][
+                            assessment_type
+                        ]
+                    ),
+                )
+
+
+class TestInputSignatures:
+    @pytest.fixture
+    def config(self):
+        """Create a config with two rfr and two benchmarks of different lengths."""
+        rng = np.random.default_rng(17)
+        index = pd.bdate_range("2020-01-01", periods=80)
+        return AssessmentConfig(
+            returns=pd.Series(rng.normal(0.0005, 0.01, 80), index, name="Port"),
+            rfr=[
+                pd.Series(0.0001, index=index, name="RFR"),
+                pd.Series(0.0002, index=index, name="RFR2"),
+            ],
+            bmk=[
+                pd.Series(rng.normal(0.0003, 0.008, 80), index, name="Bmk"),
+                pd.Series(rng.normal(0.0002, 0.009, 70), index[10:], name="Bmk2"),
+            ],
+            window=20,
+            min_periods=5,
+            overlap_mode=OverlapMode.LONGEST_OVERLAP,
+        )
+
+    def test_runs_once_per_signature(self, config):
+        """Test assessments run once per distinct processed inputs."""
+        with patch.object(
+            BaseAssessment, "_run", autospec=True, side_effect=BaseAssessment._run
+        ) as run:
+            result = Evaluation(config).with_executor(DummyExecutor()).run()
+
+        runs = Counter(call.args[0].name for call in run.call_args_list)
+        types = len(AssessmentType)
+        # The second benchmark trims the returns, so returns-only results differ
+        assert runs[AssessmentName.Volatility] == 2 * types
+        assert runs[AssessmentName.SharpeRatio] == 4 * types
+        assert runs[AssessmentName.Beta] == 2 * types
+        assert runs[AssessmentName.TreynorRatio] == 4 * types
+
+        volatility = result.results["Port|RFR|Bmk"][AssessmentName.Volatility]
+        shared = result.results["Port|RFR2|Bmk"][AssessmentName.Volatility]
+        for assessment_type in AssessmentType:
+            assert shared[assessment_type] is volatility[assessment_type]
+        assert result.timer["Port|RFR2|Bmk"][AssessmentName.Volatility] == {
+            assessment_type: 0.0 for assessment_type in AssessmentType
+        }
+
+    @pytest.mark.parametrize("task_size", [1, None])
+    def test_matches_separate_runs(self, config, task_size):
+        """Test shared results equal those of each combination run alone."""
+        result = (
+            Evaluation(config)
+            .with_executor(DummyExecutor())
+            .with_task_size(task_size)
+            .with_max_in_flight(2)
+            .run()
+        )
+
+        for rfr in config.rfr:
+            for bmk in config.bmk:
+                single = Evaluation(
+                    AssessmentConfig(
+                        returns=config.returns,
+                        rfr=rfr,
+                        bmk=bmk,
+                        window=20,
+                        min_periods=5,
+                        overlap_mode=OverlapMode.LONGEST_OVERLAP,
+                    )
+                ).run()
+                config_key = f"Port|{rfr.name}|{bmk.name}"
+                for name, values in single.results[config_key].items():
+                    for assessment_type, value in values.items():
+                        expected = result.results[config_key][name][assessment_type]
+                        if isinstance(value, pd.Series):
+                            pd.testing.assert_series_equal(value, expected)
+                        else:
+                            np.testing.assert_equal(value, expected)
+
+
+class TestPairing:
+    @pytest.fixture
+    def series(self):
+        """Create three portfolios, each with its own benchmark."""
+        rng = np.random.default_rng(19)
+        index = pd.bdate_range("2020-01-01", periods=60)
+        returns = [
+            pd.Series(rng.normal(0.0005, 0.01, 60), index, name=f"Port{i}")
+            for i in range(3)
+        ]
+        bmk = [
+            pd.Series(rng.normal(0.0003, 0.008, 60), index, name=f"Bmk{i}")
+            for i in range(3)
+        ]
+        return returns, pd.Series(0.0001, index=index, name="RFR"), bmk
+
+    @pytest.mark.parametrize("pairing", ["zip", [(0, 0, 0), (1, 0, 1), (2, 0, 2)]])
+    def test_only_paired_combinations(self, series, pairing):
+        """Test paired runs evaluate the requested subset of the product."""
+        returns, rfr, bmk = series
+        kwargs = {
+            "returns": returns,
+            "rfr": rfr,
+            "bmk": bmk,
+            "window": 20,
+            "min_periods": 5,
+        }
+        expected = Evaluation(AssessmentConfig(**kwargs)).run()
+
+        evaluation = Evaluation(AssessmentConfig(**kwargs, pairing=pairing))
+        result = evaluation.run()
+
+        assert "configurations=3" in repr(evaluation)
+        assert list(result.results) == [f"Port{i}|RFR|Bmk{i}" for i in range(3)]
+        summary = result.results_dfs[AssessmentType.Summary]
+        pd.testing.assert_frame_equal(
+            summary, expected.results_dfs[AssessmentType.Summary][summary.columns]
+        )
+
+
 class TestAllAssessments:
     def test_all_assessments_has_implementations(self):
         """Test ALL_ASSESSMENTS has implementations for registered assessments."""
@@ -339,3 +1190,13 @@ class TestAllAssessments:
         """Test ALL_ASSESSMENT_TYPES is a frozenset."""
         assert isinstance(ALL_ASSESSMENT_TYPES, frozenset)
         assert len(ALL_ASSESSMENT_TYPES) == len(AssessmentType)
+
+    def test_inputs_cover_dependencies(self):
+        """Test assessments declare the inputs of the assessments they build on."""
+        for assessment_class in ALL_ASSESSMENTS.values():
+            assert set(assessment_class.inputs) <= {"returns", "rfr", "bmk"}
+            assert "returns" in assessment_class.inputs
+            for dependency in assessment_class.dependencies:
+                assert set(ALL_ASSESSMENTS[dependency].inputs) <= set(
+                    assessment_class.inputs
+                )
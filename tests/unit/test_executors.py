@@ -222,6 +222,41 @@ class TestRQExecutor:
         assert isinstance(payload["config"]["rfr"], list)
         assert payload["config"]["ann_factor"] == 252
 
+    @patch("src.utils.executors.requests.post")
+    def test_submit_batch(self, mock_post):
+        """Test RQExecutor submits several assessments as one job."""
+        import pandas as pd
+
+        from src.dataclasses.assessment_config import AssessmentConfig
+
+        mock_response = Mock()
+        mock_response.json.return_value = {"job_id": "job123"}
+        mock_response.raise_for_status = Mock()
+        mock_post.return_value = mock_response
+
+        config = AssessmentConfig(
+            returns=pd.Series(
+                [0.01 + i * 0.001 for i in range(25)], name="TestReturns"
+            ),
+            bmk=pd.Series([0.005 + i * 0.0005 for i in range(25)], name="TestBmk"),
+            rfr=pd.Series([0.001] * 25, name="TestRFR"),
+            min_periods=2,
+        )
+
+        executor = RQExecutor("http://api.example.com")
+        future = executor.submit_batch(
+            config, [("Beta", "summary"), ("Volatility", "rolling")]
+        )
+
+        assert future.job_id == "job123"
+        assert mock_post.call_args[0][0] == "http://api.example.com/run_batch"
+        payload = mock_post.call_args[1]["json"]
+        assert payload["tasks"] == [
+            {"assessment_name": "Beta", "assessment_type": "summary"},
+            {"assessment_name": "Volatility", "assessment_type": "rolling"},
+        ]
+        assert len(payload["config"]["returns"]) == 25
+
     def test_shutdown(self):
         """Test RQExecutor shutdown method."""
         executor = RQExecutor("http://api.example.com")
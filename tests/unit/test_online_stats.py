@@ -0,0 +1,127 @@
+"""Tests for the online accumulators of the streaming evaluation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.assessments.max_drawdown import _rolling_max_drawdown
+from src.utils.online_stats import OnlineStats, SlidingDrawdown
+
+
+@pytest.fixture
+def series():
+    """Create random returns, rfr and benchmark series."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 200))
+    rfr = pd.Series(np.full(200, 0.0001))
+    bmk = pd.Series(0.5 * returns.to_numpy() + rng.normal(0.0, 0.008, 200))
+
+    return returns, rfr, bmk
+
+
+class TestSlidingDrawdown:
+    def test_matches_rolling_max_drawdown(self, series):
+        """Test the sliding drawdown equals the batch rolling drawdown at every tick."""
+        returns = series[0].to_numpy()
+        expected = _rolling_max_drawdown(returns, 20)
+
+        drawdown = SlidingDrawdown()
+        for i, log_wealth in enumerate(np.cumsum(np.log1p(returns))):
+            drawdown.push(log_wealth)
+            if len(drawdown) > 20:
+                drawdown.pop()
+            if i >= 19:
+                assert np.expm1(drawdown.max_drawdown()) == pytest.approx(
+                    expected[i], abs=1e-12
+                )
+
+    def test_empty(self):
+        """Test an empty window has no drawdown."""
+        assert np.isnan(SlidingDrawdown().max_drawdown())
+
+
+class TestOnlineStats:
+    def test_rolling_matches_pandas(self, series):
+        """Test rolling moments equal the pandas rolling results at every tick."""
+        returns, rfr, bmk = series
+        stats = OnlineStats(window=20)
+        expected_std = returns.rolling(20).std()
+        expected_corr = returns.rolling(20).corr(bmk)
+        expected_beta = returns.rolling(20).cov(bmk) / bmk.rolling(20).var()
+
+        for i, tick in enumerate(zip(returns, rfr, bmk)):
+            stats.add(*tick)
+            assert stats.ready == (i >= 19)
+            if stats.ready:
+                assert stats.std("returns") == pytest.approx(expected_std[i])
+                assert stats.corr() == pytest.approx(expected_corr[i])
+                assert stats.beta() == pytest.approx(expected_beta[i])
+
+    def test_expanding_matches_pandas(self, series):
+        """Test expanding statistics equal pandas over the whole history."""
+        returns, rfr, bmk = series
+        stats = OnlineStats(min_periods=21)
+        for tick in zip(returns, rfr, bmk):
+            stats.add(*tick)
+
+        excess = returns - rfr
+        n, mean, m2, _, _ = stats.moments()
+        assert n == len(returns)
+        assert mean == pytest.approx(returns.mean())
+        assert m2 == pytest.approx(returns.var(ddof=0))
+        assert stats.mean("excess") == pytest.approx(excess.mean())
+        assert stats.var("active") == pytest.approx((returns - bmk).var())
+        assert stats.quantile(0.05) == pytest.approx(returns.quantile(0.05))
+
+    def test_constant_window_has_zero_variance(self):
+        """Test a window of a repeated value gets exactly zero variance."""
+        stats = OnlineStats(window=3)
+        for value in [0.01, 0.02, 0.03, 0.03, 0.03]:
+            stats.add(value, 0.0, 0.0)
+
+        assert stats.var("returns") == 0.0
+        assert stats.mean("returns") == pytest.approx(0.03)
+
+    @pytest.mark.parametrize("window", [None, 20])
+    def test_extend_matches_add(self, series, window):
+        """Test appending whole arrays gives the state of adding tick by tick."""
+        returns, rfr, bmk = (s.to_numpy() for s in series)
+        added = OnlineStats(window=window, min_periods=21)
+        for tick in zip(returns, rfr, bmk):
+            added.add(*tick)
+
+        extended = OnlineStats(window=window, min_periods=21)
+        extended.extend(returns, rfr, bmk)
+
+        assert extended.count == added.count
+        assert extended.ready == added.ready
+        for key in ("returns", "excess", "active"):
+            assert extended.mean(key) == pytest.approx(added.mean(key))
+            assert extended.var(key) == pytest.approx(added.var(key))
+        assert extended.beta() == pytest.approx(added.beta())
+        assert extended.lagged.beta() == pytest.approx(added.lagged.beta())
+        assert extended.alpha_mean() == pytest.approx(added.alpha_mean())
+        assert extended.max_drawdown() == pytest.approx(added.max_drawdown())
+        assert extended.ulcer() == pytest.approx(added.ulcer())
+        assert extended.tail_mean(0.05) == pytest.approx(added.tail_mean(0.05))
+
+    @pytest.mark.parametrize("window", [None, 20])
+    def test_losses_of_100_percent_or_more(self, series, window):
+        """Test returns of -1 and below give the batch growth and drawdowns."""
+        returns, rfr, bmk = (s.to_numpy().copy() for s in series)
+        returns[[50, 120]] = [-1.0, -1.5]
+        stats = OnlineStats(window=window, min_periods=21)
+
+        for i, tick in enumerate(zip(returns, rfr, bmk)):
+            stats.add(*tick)
+            start = max(i + 1 - window, 0) if window else 0
+            seen = returns[start : i + 1]
+            wealth = np.cumprod(1 + seen)
+            # A window opening on the total loss has no peak
+            with np.errstate(invalid="ignore"):
+                drawdowns = wealth / np.maximum.accumulate(wealth) - 1
+            assert stats.growth() == pytest.approx(np.prod(1 + seen) - 1)
+            assert stats.max_drawdown() == pytest.approx(drawdowns.min(), nan_ok=True)
+            assert stats.ulcer() == pytest.approx(
+                np.sqrt(np.mean((drawdowns * 100) ** 2)), nan_ok=True
+            )
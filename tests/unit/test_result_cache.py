@@ -0,0 +1,217 @@
+"""Tests for the tiered result cache."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.dataclasses.assessment_config import AssessmentConfig
+from src.utils import result_cache
+from src.utils.result_cache import ResultCache, result_key
+
+
+@pytest.fixture
+def config():
+    """Create a single-series config."""
+    rng = np.random.default_rng(0)
+    index = pd.bdate_range("2020-01-01", periods=60)
+    return AssessmentConfig(
+        returns=pd.Series(rng.normal(0.0005, 0.01, 60), index, name="Port"),
+        rfr=pd.Series(0.0001, index=index, name="RFR"),
+        bmk=pd.Series(rng.normal(0.0003, 0.008, 60), index, name="Bmk"),
+        window=20,
+        min_periods=5,
+    )
+
+
+class TestResultKey:
+    def test_equal_inputs_share_key(self, config):
+        """Test configs built from equal series and parameters have one key."""
+        copy = AssessmentConfig(
+            returns=config.returns.copy(),
+            rfr=config.rfr.copy(),
+            bmk=config.bmk.copy(),
+            window=20,
+            min_periods=5,
+        )
+
+        assert result_key("Beta", "rolling", config) == result_key(
+            "Beta", "rolling", copy
+        )
+
+    def test_inputs_change_key(self, config):
+        """Test the key depends on the assessment, values, labels and parameters."""
+        key = result_key("Beta", "rolling", config)
+        returns = config.returns.copy()
+        returns.iloc[-1] += 1e-12
+
+        variants = [
+            result_key("Volatility", "rolling", config),
+            result_key("Beta", "expanding", config),
+            result_key("Beta", "rolling", config, batched=True),
+            result_key(
+                "Beta",
+                "rolling",
+                AssessmentConfig(
+                    returns=returns, rfr=config.rfr, bmk=config.bmk, window=20
+                ),
+            ),
+            result_key(
+                "Beta",
+                "rolling",
+                AssessmentConfig(
+                    returns=config.returns.rename("Other"),
+                    rfr=config.rfr,
+                    bmk=config.bmk,
+                    window=20,
+                    min_periods=5,
+                ),
+            ),
+            result_key(
+                "Beta",
+                "rolling",
+                AssessmentConfig(
+                    returns=config.returns,
+                    rfr=config.rfr,
+                    bmk=config.bmk,
+                    window=30,
+                    min_periods=5,
+                ),
+            ),
+        ]
+
+        assert key not in variants
+        assert len(set(variants)) == len(variants)
+
+    def test_unread_inputs_are_not_hashed(self, config):
+        """Test keys only depend on the series listed in inputs."""
+        other = AssessmentConfig(
+            returns=config.returns,
+            rfr=config.rfr * 2,
+            bmk=config.bmk.rename("Other"),
+            window=20,
+            min_periods=5,
+        )
+
+        assert result_key(
+            "Volatility", "rolling", config, inputs=("returns",)
+        ) == result_key("Volatility", "rolling", other, inputs=("returns",))
+        assert result_key("Beta", "rolling", config) != result_key(
+            "Beta", "rolling", other
+        )
+
+    def test_digests_are_reused(self, config):
+        """Test digests passed in are filled once and give the same keys."""
+        digests = {}
+        key = result_key("Beta", "rolling", config, digests=digests)
+
+        assert set(digests) == {"returns", "rfr", "bmk"}
+        assert result_key("Beta", "rolling", config, digests=digests) == key
+
+    def test_code_changes_key(self, config, monkeypatch):
+        """Test keys change with the code computing the results."""
+        key = result_key("Beta", "rolling", config)
+        monkeypatch.setattr(result_cache, "_code_digest", lambda: b"other code")
+
+        assert result_key("Beta", "rolling", config) != key
+
+    def test_code_digest_covers_sources(self, tmp_path):
+        """Test the code digest changes when an assessment source changes."""
+        (tmp_path / "assessments").mkdir()
+        source = tmp_path / "assessments" / "beta.py"
+        source.write_text("WINDOW = 20\n")
+        before = result_cache._code_digest(tmp_path)
+        result_cache._code_digest.cache_clear()
+
+        source.write_text("WINDOW = 21\n")
+
+        assert result_cache._code_digest(tmp_path) != before
+
+    def test_multi_series_config_has_no_key(self, config):
+        """Test configs with several combinations are not cached as a whole."""
+        multi = AssessmentConfig(
+            returns=[config.returns, config.returns.rename("Other")],
+            rfr=config.rfr,
+            bmk=config.bmk,
+        )
+
+        assert result_key("Beta", "summary", multi) is None
+
+
+class TestResultCache:
+    def test_memory_lru(self):
+        """Test the memory tier evicts the least recently used result."""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1.0)
+        cache.put("b", 2.0)
+        assert cache.get("a") == 1.0
+
+        cache.put("c", 3.0)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1.0
+        assert cache.get("c") == 3.0
+        assert cache.stats["memory_hits"] == 3
+        assert cache.misses == 1
+
+    def test_returns_copies(self):
+        """Test callers cannot modify cached series."""
+        cache = ResultCache()
+        series = pd.Series([1.0, 2.0])
+        cache.put("key", series)
+        series.iloc[0] = 0.0
+
+        result = cache.get("key")
+        result.iloc[1] = 0.0
+
+        pd.testing.assert_series_equal(cache.get("key"), pd.Series([1.0, 2.0]))
+
+    def test_disk_tier(self, tmp_path):
+        """Test results persist on disk across cache instances."""
+        series = pd.Series([1.0, np.nan], index=pd.bdate_range("2020-01-01", periods=2))
+        ResultCache(directory=tmp_path).put("key", series)
+
+        cache = ResultCache(directory=tmp_path)
+        pd.testing.assert_series_equal(cache.get("key"), series)
+        assert cache.disk_hits == 1
+
+        # Promoted to memory
+        cache.get("key")
+        assert cache.memory_hits == 1
+
+    def test_disk_size_eviction(self, tmp_path):
+        """Test the disk tier stays within its size budget."""
+        value = np.zeros(1000)
+        cache = ResultCache(max_entries=0, directory=tmp_path, max_disk_bytes=20_000)
+
+        for i in range(5):
+            cache.put(f"key{i}", value)
+
+        assert cache.stats["disk_bytes"] <= 20_000
+        assert sum(path.stat().st_size for path in tmp_path.glob("*.pkl")) <= 20_000
+        assert cache.get("key4") is not None
+        assert cache.get("key0") is None
+
+    def test_unreadable_file_is_a_miss(self, tmp_path):
+        """Test corrupt files are dropped instead of raising."""
+        (tmp_path / "key.pkl").write_bytes(b"not a pickle")
+        cache = ResultCache(directory=tmp_path)
+
+        assert cache.get("key") is None
+        assert not (tmp_path / "key.pkl").exists()
+
+    def test_clear(self, tmp_path):
+        """Test clearing empties both tiers."""
+        cache = ResultCache(directory=tmp_path)
+        cache.put("key", 1.0)
+
+        cache.clear()
+
+        assert cache.get("key") is None
+        assert list(tmp_path.glob("*.pkl")) == []
+
+    def test_invalid_sizes(self):
+        """Test negative sizes are rejected."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ResultCache(max_entries=-1)
+        with pytest.raises(ValueError, match="max_disk_bytes"):
+            ResultCache(max_disk_bytes=-1)
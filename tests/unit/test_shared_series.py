@@ -0,0 +1,124 @@
+"""Tests for the shared-memory transport of config series."""
+
+import pickle
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.dataclasses.assessment_config import AssessmentConfig
+from src.utils import shared_series
+from src.utils.shared_series import SharedConfig, attach_config, detach_all
+
+
+def make_config(index: pd.Index):
+    """Create the single config of random series on ``index``."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, len(index)), index, name="Port")
+    config = AssessmentConfig(
+        returns=returns,
+        rfr=pd.Series(0.0001, index=index, name="RFR"),
+        bmk=(returns * 0.5).rename("Bmk"),
+        window=20,
+        min_periods=5,
+    )
+
+    return next(config.iter_configs())[1]
+
+
+@pytest.fixture(autouse=True)
+def detach():
+    """Unmap the blocks attached by each test."""
+    yield
+    detach_all()
+
+
+class TestSharedConfig:
+    @pytest.mark.parametrize(
+        "index",
+        [
+            pd.bdate_range("2020-01-01", periods=60),
+            pd.bdate_range("2020-01-01", periods=60, tz="Europe/London"),
+            pd.date_range("2020-01-01", periods=60, unit="s"),
+            pd.RangeIndex(60),
+            pd.Index(np.arange(60) * 2, name="step"),
+            pd.Index([f"t{i}" for i in range(60)]),
+        ],
+    )
+    def test_attach_round_trip(self, index):
+        """Test the attached config holds the same series as the shared one."""
+        config = make_config(index)
+
+        with SharedConfig(config) as shared:
+            attached = attach_config(pickle.loads(pickle.dumps(shared.handle)))
+
+            for key in ("returns", "rfr", "bmk"):
+                pd.testing.assert_series_equal(
+                    getattr(attached, key), getattr(config, key)
+                )
+            assert getattr(attached.returns.index, "freq", None) == getattr(
+                config.returns.index, "freq", None
+            )
+            assert attached.window == config.window
+            assert attached.min_periods == config.min_periods
+
+    def test_views_are_read_only(self):
+        """Test workers cannot modify the shared series."""
+        config = make_config(pd.bdate_range("2020-01-01", periods=60))
+
+        with SharedConfig(config) as shared:
+            attached = attach_config(shared.handle)
+            values = attached.returns.to_numpy()
+
+            assert not values.flags.writeable
+            with pytest.raises(ValueError):
+                values[0] = 1.0
+
+    def test_handle_is_small(self):
+        """Test the handle does not carry the series."""
+        config = make_config(pd.bdate_range("2020-01-01", periods=5000))
+
+        with SharedConfig(config) as shared:
+            assert len(pickle.dumps(shared.handle)) < 2000
+            assert len(pickle.dumps(config)) > 100_000
+
+    def test_attach_reuses_config(self):
+        """Test each block is mapped and rebuilt once per process."""
+        config = make_config(pd.bdate_range("2020-01-01", periods=60))
+
+        with SharedConfig(config) as shared:
+            assert attach_config(shared.handle) is attach_config(shared.handle)
+
+    def test_attached_configs_are_bounded(self, monkeypatch):
+        """Test the oldest configs are unmapped beyond MAX_ATTACHED."""
+        monkeypatch.setattr(shared_series, "MAX_ATTACHED", 2)
+        config = make_config(pd.bdate_range("2020-01-01", periods=60))
+        blocks = [SharedConfig(config) for _ in range(3)]
+
+        try:
+            for block in blocks:
+                attach_config(block.handle)
+
+            assert list(shared_series._attached) == [
+                block.handle.name for block in blocks[1:]
+            ]
+        finally:
+            for block in blocks:
+                block.close()
+
+    def test_close_deletes_block(self):
+        """Test closing the owner deletes the shared block."""
+        shared = SharedConfig(make_config(pd.bdate_range("2020-01-01", periods=60)))
+        shared.close()
+
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=shared.handle.name, track=False)
+
+    def test_supports(self):
+        """Test non-numeric series are not shared."""
+        config = make_config(pd.bdate_range("2020-01-01", periods=60))
+        assert SharedConfig.supports(config)
+
+        config.bmk = config.bmk.astype("Float64")
+        assert not SharedConfig.supports(config)
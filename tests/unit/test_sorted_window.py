@@ -0,0 +1,173 @@
+"""Tests for the sliding sorted window."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.sorted_window import RankedWindow, SortedWindow, tail_risk
+
+
+class TestSortedWindow:
+    def test_insert_keeps_order(self):
+        """Test values are kept sorted regardless of insert order."""
+        window = SortedWindow()
+        for value in [0.03, -0.01, 0.02, -0.05]:
+            window.insert(value)
+
+        assert len(window) == 4
+        assert window.tail_sum(2) == pytest.approx(-0.06)
+        assert window.count_le(0.0) == 2
+
+    def test_remove(self):
+        """Test removing one copy of a duplicated value."""
+        window = SortedWindow()
+        for value in [0.01, 0.01, 0.02]:
+            window.insert(value)
+
+        window.remove(0.01)
+
+        assert len(window) == 2
+        assert window.count_le(0.01) == 1
+
+    def test_remove_missing_value(self):
+        """Test removing a value that is not in the window raises."""
+        window = SortedWindow()
+        window.insert(0.01)
+
+        with pytest.raises(ValueError):
+            window.remove(0.02)
+
+    def test_running_tail_sum(self):
+        """Test the running tail sum follows inserts and removals."""
+        rng = np.random.default_rng(4)
+        values = rng.normal(0, 0.01, 200).round(3).tolist()
+        window = SortedWindow()
+
+        for i, value in enumerate(values):
+            window.insert(value)
+            if i >= 30:
+                window.remove(values[i - 30])
+            count = int(rng.integers(0, len(window) + 1))
+
+            assert window.tail_sum(count) == pytest.approx(
+                sum(sorted(values[max(i - 29, 0) : i + 1])[:count]), abs=1e-12
+            )
+
+    def test_nans_are_counted(self):
+        """Test NaNs are kept out of the ordered values and can be removed."""
+        window = SortedWindow()
+        for value in [0.01, np.nan, -0.02]:
+            window.insert(value)
+
+        assert len(window) == 2 and window.nans == 1
+        assert window.tail(0.0) == (1, -0.02)
+
+        window.remove(np.nan)
+        assert window.nans == 0
+        with pytest.raises(ValueError):
+            window.remove(np.nan)
+
+    @pytest.mark.parametrize("q", [0.0, 0.05, 0.3, 0.5, 0.99, 1.0])
+    def test_quantile_matches_pandas(self, q):
+        """Test quantile interpolation matches pandas."""
+        values = np.random.default_rng(0).normal(0, 0.01, 37)
+        window = SortedWindow()
+        for value in values:
+            window.insert(value)
+
+        assert window.quantile(q) == pytest.approx(pd.Series(values).quantile(q))
+
+
+class TestRankedWindow:
+    def test_matches_sorted_window(self):
+        """Test order statistics match those of a SortedWindow over the same values."""
+        rng = np.random.default_rng(6)
+        # Rounded so that values repeat
+        values = rng.normal(0, 0.01, 300).round(3)
+        ranked = RankedWindow(values)
+        window = SortedWindow()
+
+        for i, value in enumerate(values.tolist()):
+            ranked.insert(value)
+            window.insert(value)
+            if i >= 40:
+                ranked.remove(values[i - 40])
+                window.remove(values[i - 40])
+
+            assert len(ranked) == len(window)
+            for q in (0.05, 0.5):
+                threshold = window.quantile(q)
+                assert ranked.quantile(q) == threshold
+                count, total = ranked.tail(threshold)
+                assert count == window.count_le(threshold)
+                assert total == pytest.approx(window.tail_sum(count), abs=1e-12)
+
+    def test_unknown_values(self):
+        """Test values outside those given, or not in the window, are rejected."""
+        ranked = RankedWindow(np.array([0.01, 0.01, np.nan]))
+        ranked.insert(0.01)
+        ranked.insert(0.01)
+        ranked.insert(np.nan)
+
+        with pytest.raises(ValueError):
+            ranked.insert(0.01)
+        with pytest.raises(ValueError):
+            ranked.insert(0.02)
+        with pytest.raises(ValueError):
+            ranked.remove(0.02)
+        assert len(ranked) == 2 and ranked.nans == 1
+
+
+class TestTailRisk:
+    def test_rolling_warmup_is_nan(self):
+        """Test windows shorter than the rolling window are NaN."""
+        values = np.random.default_rng(0).normal(0, 0.01, 10)
+
+        var, cvar = tail_risk(values, window=4)
+
+        assert np.isnan(var[:3]).all()
+        assert np.isnan(cvar[:3]).all()
+        assert not np.isnan(var[3:]).any()
+        assert (cvar[3:] <= var[3:]).all()
+
+    def test_expanding_single_observation(self):
+        """Test CVaR needs two observations while VaR needs one."""
+        var, cvar = tail_risk(np.array([0.01, -0.02, 0.03]), min_periods=1)
+
+        assert var[0] == 0.01
+        assert np.isnan(cvar[0])
+        assert not np.isnan(cvar[1])
+
+    def test_columns_evaluated_independently(self):
+        """Test a 2-d input gives the same result as each column on its own."""
+        rng = np.random.default_rng(2)
+        values = rng.normal(0.0, 0.01, (50, 3))
+
+        var, cvar = tail_risk(values, window=10)
+
+        for i in range(values.shape[1]):
+            column_var, column_cvar = tail_risk(values[:, i], window=10)
+            np.testing.assert_array_equal(var[:, i], column_var)
+            np.testing.assert_array_equal(cvar[:, i], column_cvar)
+
+    @pytest.mark.parametrize("window", [5, None])
+    def test_nans_match_pandas(self, window):
+        """Test NaNs inside and outside windows give the pandas results."""
+        returns = pd.Series(np.random.default_rng(8).normal(0, 0.01, 30))
+        returns.iloc[[3, 17]] = np.nan
+
+        def cvar(x):
+            if len(x) < 2:
+                return np.nan
+            tail = x[x <= x.quantile(0.05)]
+            return tail.mean() if len(tail) > 0 else np.nan
+
+        windows = returns.rolling(window) if window else returns.expanding(2)
+        var, result = tail_risk(returns.to_numpy(), window=window, min_periods=2)
+
+        np.testing.assert_allclose(var, windows.quantile(0.05), rtol=1e-12)
+        np.testing.assert_allclose(result, windows.apply(cvar, raw=False), rtol=1e-12)
+        if window:
+            # Windows holding a NaN are NaN, the others are computed
+            assert np.isnan(result[3:8]).all() and np.isnan(result[17:22]).all()
+            assert not np.isnan(result[[8, 16, 22]]).any()
@@ -0,0 +1,172 @@
+"""Tests for StreamingEvaluation class."""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.constants import AssessmentName
+from src.dataclasses.assessment_config import AssessmentConfig
+from src.dataclasses.assessment_results import AssessmentType
+from src.evaluation import ALL_ASSESSMENTS, Evaluation
+from src.streaming_evaluation import StreamingEvaluation
+
+
+@pytest.fixture
+def series():
+    """Create random returns, rfr and benchmark series on business days."""
+    rng = np.random.default_rng(0)
+    index = pd.bdate_range("2020-01-01", periods=120)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 120), index=index, name="Port")
+    rfr = pd.Series(np.full(120, 0.0001), index=index, name="RFR")
+    bmk = pd.Series(
+        0.6 * returns.to_numpy() + rng.normal(0.0, 0.008, 120), index=index, name="Bmk"
+    )
+
+    return returns, rfr, bmk
+
+
+def make_config(series, end: int, window: int | list[int] = 40) -> AssessmentConfig:
+    returns, rfr, bmk = series
+    return AssessmentConfig(
+        returns=returns.iloc[:end],
+        rfr=rfr.iloc[:end],
+        bmk=bmk.iloc[:end],
+        window=window,
+        min_periods=21,
+    )
+
+
+def assert_matches(latest, results) -> None:
+    """Compare streamed values with the last point of an Evaluation run."""
+    for config_key, config_results in results.items():
+        for name, types in config_results.items():
+            for assessment_type, expected in types.items():
+                value = latest[config_key][name][assessment_type]
+                if assessment_type != AssessmentType.Summary:
+                    expected = expected.iloc[-1]
+                if isinstance(value, dict):
+                    value = [value[window] for window in expected.index]
+                np.testing.assert_allclose(
+                    value,
+                    np.asarray(expected, dtype=float),
+                    rtol=1e-7,
+                    atol=1e-12,
+                    err_msg=f"{name} {assessment_type}",
+                )
+
+
+class TestStreamingEvaluation:
+    def test_seeded_values_match_evaluation(self, series):
+        """Test values after replaying the history equal a full evaluation."""
+        streaming = StreamingEvaluation(make_config(series, 120))
+
+        assert_matches(
+            streaming.latest(), Evaluation(make_config(series, 120)).run().results
+        )
+
+    @pytest.mark.parametrize("window", [40, [20, 40]])
+    def test_updates_match_evaluation(self, series, window):
+        """Test each update gives the newest values of the extended history."""
+        returns, rfr, bmk = series
+        streaming = StreamingEvaluation(make_config(series, 30, window))
+
+        for end in range(31, 121):
+            latest = streaming.update(
+                returns.iloc[end - 1], rfr.iloc[end - 1], bmk.iloc[end - 1]
+            )
+            if end in (39, 40, 41, 120):
+                results = Evaluation(make_config(series, end, window)).run().results
+                assert_matches(latest, results)
+
+    def test_total_losses(self, series):
+        """Test -100% days in the history and in updates match a full evaluation."""
+        returns, rfr, bmk = series
+        returns = returns.copy()
+        returns.iloc[[20, 90]] = -1.0
+        series = (returns, rfr, bmk)
+        streaming = StreamingEvaluation(make_config(series, 60))
+
+        for end in range(61, 121):
+            latest = streaming.update(
+                returns.iloc[end - 1], rfr.iloc[end - 1], bmk.iloc[end - 1]
+            )
+            if end in (90, 91, 120):
+                results = Evaluation(make_config(series, end)).run().results
+                assert_matches(latest, results)
+
+    def test_rolling_is_nan_before_full_window(self, series):
+        """Test rolling values wait for a full window, as the batch results do."""
+        latest = StreamingEvaluation(make_config(series, 30)).latest()
+
+        values = latest["Port|RFR|Bmk"][AssessmentName.Volatility]
+        assert np.isnan(values[AssessmentType.Rolling])
+        assert not np.isnan(values[AssessmentType.Expanding])
+
+    def test_snapshot_restore(self, series):
+        """Test a restored snapshot continues exactly like the original."""
+        returns, rfr, bmk = series
+        streaming = StreamingEvaluation(make_config(series, 100))
+        restored = StreamingEvaluation.restore(streaming.snapshot())
+
+        for i in range(100, 120):
+            tick = (returns.iloc[i], rfr.iloc[i], bmk.iloc[i])
+            assert restored.update(*tick) == streaming.update(*tick)
+
+    def test_restore_rejects_other_objects(self):
+        """Test restoring bytes that do not hold a StreamingEvaluation raises."""
+        with pytest.raises(TypeError):
+            StreamingEvaluation.restore(pickle.dumps({"not": "a snapshot"}))
+
+    def test_update_with_mapping(self, series):
+        """Test multi-portfolio configs take one new value per series name."""
+        returns, rfr, bmk = series
+        other = (returns * 2).rename("Other")
+        config = AssessmentConfig(
+            returns=[returns.iloc[:100], other.iloc[:100]],
+            rfr=rfr.iloc[:100],
+            bmk=bmk.iloc[:100],
+            window=40,
+        )
+        streaming = StreamingEvaluation(config)
+
+        for i in range(100, 120):
+            latest = streaming.update(
+                {"Port": returns.iloc[i], "Other": other.iloc[i]},
+                rfr.iloc[i],
+                bmk.iloc[i],
+            )
+
+        expected = AssessmentConfig(
+            returns=[returns, other], rfr=rfr, bmk=bmk, window=40
+        )
+        assert set(latest) == {"Port|RFR|Bmk", "Other|RFR|Bmk"}
+        assert_matches(latest, Evaluation(expected).run().results)
+
+    def test_update_missing_series(self, series):
+        """Test a mapping without a value for some series raises KeyError."""
+        streaming = StreamingEvaluation(make_config(series, 30))
+
+        with pytest.raises(KeyError):
+            streaming.update({"Other": 0.01}, 0.0, 0.0)
+
+    def test_with_assessments_and_types(self, series):
+        """Test filters limit the reported assessments and types."""
+        streaming = (
+            StreamingEvaluation(make_config(series, 30))
+            .with_assessments([AssessmentName.SharpeRatio])
+            .with_assessment_types([AssessmentType.Summary])
+        )
+
+        latest = streaming.update(0.01, 0.0001, 0.005)
+
+        assert list(latest["Port|RFR|Bmk"]) == [AssessmentName.SharpeRatio]
+        assert list(latest["Port|RFR|Bmk"][AssessmentName.SharpeRatio]) == [
+            AssessmentType.Summary
+        ]
+
+    def test_every_assessment_streams(self):
+        """Test all assessments implement the online hook."""
+        for assessment in ALL_ASSESSMENTS.values():
+            assert "_online" in vars(assessment)
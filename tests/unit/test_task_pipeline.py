@@ -0,0 +1,135 @@
+from concurrent.futures import Future
+
+import pytest
+
+from src.utils.task_pipeline import TaskPipeline
+
+
+class Recorder:
+    """Callbacks of a pipeline whose tasks run when their result is requested."""
+
+    def __init__(self, available=None):
+        self.pending = 0
+        self.max_pending = 0
+        self.events = []
+        self.outputs = {}
+        self.done = []
+        # Tasks are ints, runnable once every smaller task of their key is
+        # collected unless listed in `available`
+        self.available = available
+
+    def submit(self, key, task, inputs):
+        recorder = self
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+        self.events.append(("submit", key, task))
+
+        class LazyFuture(Future):
+            def result(self, timeout=None):
+                recorder.pending -= 1
+                return task * 10
+
+        return LazyFuture()
+
+    def inputs(self, key, task):
+        if self.available is None or task in self.available:
+            return {}
+        if all(t in self.outputs.get(key, {}) for t in range(task)):
+            return {}
+        return None
+
+    def collect(self, key, task, output):
+        self.events.append(("collect", key, task))
+        self.outputs.setdefault(key, {})[task] = output
+
+    def pipeline(self, max_in_flight=None):
+        return TaskPipeline(
+            submit=self.submit,
+            inputs=self.inputs,
+            collect=self.collect,
+            done=self.done.append,
+            max_in_flight=max_in_flight,
+        )
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 3, 10])
+def test_in_flight_limit(max_in_flight):
+    """Test no more than max_in_flight tasks are pending at once."""
+    recorder = Recorder()
+    pipeline = recorder.pipeline(max_in_flight)
+
+    for key in "abc":
+        pipeline.add(key, list(range(5)))
+        assert pipeline.in_flight <= max_in_flight
+    pipeline.drain()
+
+    assert recorder.max_pending == max_in_flight
+    assert pipeline.in_flight == 0
+    assert recorder.outputs == {key: {t: t * 10 for t in range(5)} for key in "abc"}
+
+
+def test_collects_oldest_first():
+    """Test a full pipeline collects its oldest task before submitting another."""
+    recorder = Recorder()
+    pipeline = recorder.pipeline(2)
+
+    pipeline.add("a", [0, 1, 2])
+    pipeline.drain()
+
+    assert recorder.events == [
+        ("submit", "a", 0),
+        ("submit", "a", 1),
+        ("collect", "a", 0),
+        ("submit", "a", 2),
+        ("collect", "a", 1),
+        ("collect", "a", 2),
+    ]
+
+
+def test_without_limit():
+    """Test every task is submitted before any is collected without a limit."""
+    recorder = Recorder()
+    pipeline = recorder.pipeline(None)
+
+    for key in "ab":
+        pipeline.add(key, list(range(4)))
+
+    assert pipeline.in_flight == 8
+    assert recorder.max_pending == 8
+
+    pipeline.drain()
+    assert [event for event, *_ in recorder.events] == ["submit"] * 8 + ["collect"] * 8
+
+
+def test_blocked_tasks_wait_for_inputs():
+    """Test tasks missing inputs are submitted once they are collected."""
+    recorder = Recorder(available={0})
+    pipeline = recorder.pipeline(None)
+
+    pipeline.add("a", [0, 1, 2])
+    assert recorder.events == [("submit", "a", 0)]
+
+    pipeline.drain()
+    assert recorder.events == [
+        ("submit", "a", 0),
+        ("collect", "a", 0),
+        ("submit", "a", 1),
+        ("collect", "a", 1),
+        ("submit", "a", 2),
+        ("collect", "a", 2),
+    ]
+
+
+def test_done_once_per_key():
+    """Test done is called once a key has all of its tasks collected."""
+    recorder = Recorder()
+    pipeline = recorder.pipeline(1)
+
+    pipeline.add("a", [0, 1])
+    assert recorder.done == []
+
+    pipeline.add("b", [0])
+    assert recorder.done == ["a"]
+
+    pipeline.drain()
+    assert recorder.done == ["a", "b"]
@@ -3,7 +3,8 @@
 import pytest
 import pandas as pd
 
-from src.app.tasks import add_numbers, run_assessment
+from src.app.tasks import add_numbers, run_assessment, run_assessments
+from src.utils.result_cache import ResultCache
 
 
 class TestAddNumbers:
@@ -143,3 +144,56 @@ class TestRunAssessment:
             result = run_assessment(assessment_name, "summary", config)
             assert "result" in result
             assert "time" in result
+
+    def test_run_assessment_uses_result_cache(self):
+        """Test repeated runs with equal inputs are served from the result cache."""
+        config = {
+            "returns": [0.01 + i * 0.001 for i in range(25)],
+            "bmk": [0.005 + i * 0.0005 for i in range(25)],
+            "rfr": [0.001] * 25,
+            "window": 5,
+            "min_periods": 3,
+        }
+        cache = ResultCache()
+
+        first = run_assessment("Beta", "rolling", config, cache=cache)
+        second = run_assessment("Beta", "rolling", config, cache=cache)
+
+        assert first["result_cache"] == "miss"
+        assert second["result_cache"] == "hit"
+        assert cache.hits == 1
+        pd.testing.assert_series_equal(second["result"], first["result"])
+
+
+class TestRunAssessments:
+    def test_runs_in_order(self):
+        """Test run_assessments runs every task on one config, in order."""
+        config = {
+            "returns": [0.01 + i * 0.001 for i in range(25)],
+            "bmk": [0.005 + i * 0.0005 for i in range(25)],
+            "rfr": [0.001] * 25,
+            "window": 5,
+            "min_periods": 3,
+        }
+        tasks = [
+            {"assessment_name": "Beta", "assessment_type": "summary"},
+            {"assessment_name": "Volatility", "assessment_type": "rolling"},
+        ]
+
+        outputs = run_assessments(tasks, config, cache=ResultCache())
+
+        assert len(outputs) == 2
+        assert (
+            outputs[0]["result"]
+            == run_assessment("Beta", "summary", config, cache=ResultCache())["result"]
+        )
+        assert isinstance(outputs[1]["result"], pd.Series)
+
+    def test_unknown_assessment(self):
+        """Test an unknown assessment in a batch raises ValueError."""
+        config = {"returns": [0.01] * 25, "bmk": [0.01] * 25, "rfr": [0.001] * 25}
+
+        with pytest.raises(ValueError, match="Unknown assessment"):
+            run_assessments(
+                [{"assessment_name": "Invalid", "assessment_type": "summary"}], config
+            )
@@ -0,0 +1,140 @@
+"""Tests for the shared windowed-statistics cache."""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.window_stats import WindowStats
+
+
+@pytest.fixture
+def stats():
+    """Create a cache over random returns, rfr and benchmark series."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 100))
+    rfr = pd.Series(np.full(100, 0.0001))
+    bmk = pd.Series(rng.normal(0.0003, 0.008, 100))
+
+    return WindowStats(returns=returns, rfr=rfr, bmk=bmk)
+
+
+class TestWindowStats:
+    def test_matches_pandas(self, stats):
+        """Test cached statistics equal the pandas rolling/expanding results."""
+        returns, bmk = stats.series("returns"), stats.series("bmk")
+
+        pd.testing.assert_series_equal(
+            stats.std("returns", 20), returns.rolling(20).std()
+        )
+        pd.testing.assert_series_equal(
+            stats.mean("returns", min_periods=5), returns.expanding(5).mean()
+        )
+        pd.testing.assert_series_equal(
+            stats.corr("returns", "bmk", 20), returns.rolling(20).corr(bmk)
+        )
+        pd.testing.assert_series_equal(
+            stats.beta(20), returns.rolling(20).cov(bmk) / bmk.rolling(20).var()
+        )
+
+    def test_windows_share_prefix_sums(self, stats):
+        """Test every window matches pandas when answered from one set of prefixes."""
+        returns, bmk = stats.series("returns"), stats.series("bmk")
+
+        for window in [5, 20, 63]:
+            pd.testing.assert_series_equal(
+                stats.var("returns", window), returns.rolling(window).var()
+            )
+            pd.testing.assert_series_equal(
+                stats.cov("returns", "bmk", window),
+                returns.rolling(window).cov(bmk),
+                check_names=False,
+            )
+
+    def test_constant_window_has_zero_variance(self):
+        """Test windows of a repeated value get exactly zero variance."""
+        returns = pd.Series([0.01, 0.02, 0.03, 0.03, 0.03, 0.03, 0.01])
+        stats = WindowStats(returns=returns)
+
+        std = stats.std("returns", 3)
+
+        assert std.iloc[4] == 0.0
+        assert std.iloc[5] == 0.0
+        assert std.iloc[6] > 0.0
+
+    def test_derived_series(self, stats):
+        """Test derived excess and active series."""
+        returns = stats.series("returns")
+
+        pd.testing.assert_series_equal(
+            stats.series("excess"), returns - stats.series("rfr")
+        )
+        pd.testing.assert_series_equal(
+            stats.series("active"), returns - stats.series("bmk")
+        )
+
+    def test_hits_and_misses(self, stats):
+        """Test each distinct statistic is computed once."""
+        first = stats.mean("returns", 20, raw=True)
+        second = stats.mean("returns", 20, raw=True)
+
+        assert first is second
+        assert (stats.hits, stats.misses) == (1, 1)
+
+        stats.mean("returns", 21)
+        stats.var("returns", 20)
+
+        assert (stats.hits, stats.misses) == (1, 3)
+
+        # The standard deviation is derived from the cached variance
+        stats.std("returns", 20)
+
+        assert (stats.hits, stats.misses) == (2, 4)
+
+    def test_min_periods_ignored_for_rolling(self, stats):
+        """Test min_periods only distinguishes expanding windows."""
+        stats.mean("returns", 20, min_periods=1)
+        stats.mean("returns", 20, min_periods=5)
+        stats.mean("returns", min_periods=1)
+        stats.mean("returns", min_periods=5)
+
+        assert (stats.hits, stats.misses) == (1, 3)
+
+    def test_raw_and_labelled_share_cache(self, stats):
+        """Test raw arrays and labelled series are views of the same result."""
+        raw = stats.std("returns", 20, raw=True)
+        labelled = stats.std("returns", 20)
+
+        assert isinstance(raw, np.ndarray)
+        np.testing.assert_array_equal(labelled.to_numpy(), raw)
+        assert labelled.index.equals(stats.series("returns").index)
+        assert stats.misses == 2
+
+    def test_ndarray_inputs(self, stats):
+        """Test plain array inputs give the same, unlabelled, statistics."""
+        arrays = WindowStats(returns=stats.values("returns"), bmk=stats.values("bmk"))
+
+        result = arrays.beta(20)
+
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, stats.beta(20).to_numpy())
+
+    def test_missing_series(self):
+        """Test requesting a series that was not provided raises."""
+        stats = WindowStats(returns=pd.Series([0.01, 0.02]))
+
+        with pytest.raises(KeyError):
+            stats.mean("bmk", 2)
+
+    def test_pickle_drops_cache(self, stats):
+        """Test pickled copies keep the inputs but not the cached results."""
+        stats.mean("returns", 20)
+
+        restored = pickle.loads(pickle.dumps(stats))
+
+        assert (restored.hits, restored.misses) == (0, 0)
+        pd.testing.assert_series_equal(
+            restored.mean("returns", 20), stats.mean("returns", 20)
+        )
+        assert restored.misses == 1